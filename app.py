@@ -1,9 +1,10 @@
 import streamlit as st
 from core.interface.form import input_form
-from core.interface.trials import run_trials
-from core.interface.charts import display_charts
 from pathlib import Path
 
+# The trials and analysis pages are imported inside their branches below, so
+# pandas and matplotlib are only loaded once a page needs them.
+
 
 def main():
     # Use session state to manage the current page and configuration
@@ -21,6 +22,8 @@ def main():
             st.rerun()
 
     elif st.session_state.page == "trials":
+        from core.interface.trials import run_trials
+
         if st.session_state.config:
             run_trials(st.session_state.config)
             if st.button("Analyze Results", use_container_width=True):
@@ -33,6 +36,8 @@ def main():
                 st.rerun()
 
     elif st.session_state.page == "analysis":
+        from core.interface.charts import display_charts
+
         if st.session_state.config:
             data_dir = Path("data") / st.session_state.config["directory"]
             display_charts(data_dir)
@@ -0,0 +1,59 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Only the analysis and trials pages may pull these in
+STARTUP_FORBIDDEN = ("pandas", "matplotlib")
+
+
+def import_profile(module: str = "app") -> list[tuple[str, int, int]]:
+    """
+    Import `module` in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        list[tuple[str, int, int]]: (module, self_us, cumulative_us) for
+        every module imported, in import order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        profile.append((name.strip(), int(self_us), int(cumulative_us)))
+    return profile
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Report what `import app` costs at Streamlit startup."
+    )
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    profile = import_profile(args.module)
+    total = next(cum for name, _, cum in profile if name == args.module)
+    print(f"import {args.module}: {total / 1000:.1f} ms, {len(profile)} modules\n")
+    ranked = sorted(profile, key=lambda entry: -entry[2])[: args.top]
+    for name, self_us, cumulative_us in ranked:
+        print(f"{cumulative_us / 1000:9.1f} ms  {self_us / 1000:7.1f} ms  {name}")
+
+    loaded = {name for name, _, _ in profile}
+    forbidden = [name for name in STARTUP_FORBIDDEN if name in loaded]
+    if forbidden:
+        print(f"\nLoaded at startup but should be lazy: {', '.join(forbidden)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
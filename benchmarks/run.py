@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.import_time import import_profile
+from core.analysis.engine import analyze_experiment
+from core.analysis.index import INDEX_FILENAME
+from core.hardware.connection import DeviceManager
+from core.logging.logger import VernierFSRLogger
+from core.logging.writer import TrialWriter
+from core.utils.mock_data import MockSignalEngine, write_mock_experiment
+from core.utils.storage import load_trial
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 0.3
+TRIAL_SAMPLES = 1000
+
+BENCHMARKS = []
+
+
+def benchmark(func):
+    """
+    Register a benchmark. Benchmarks take the parsed arguments and a scratch
+    directory and return {name: (value, unit, higher_is_better)}.
+    """
+    BENCHMARKS.append(func)
+    return func
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """
+    Fastest wall time of `repeat` calls to `func`, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def make_experiment(directory: Path, trials: int, fmt: str = "csv") -> Path:
+    """
+    Write a synthetic experiment of `trials` CLEAN files from the mock engine.
+    """
+    names = []
+    for n in range(trials):
+        trial_no, rest = divmod(n, 8)
+        location, condition = rest // 2 + 1, ("LUMP", "NOLUMP")[rest % 2]
+        names.append(f"TRIAL_{trial_no + 1}_LOC_{location}_{condition}")
+    return write_mock_experiment(
+        directory, names, TRIAL_SAMPLES, fmt, engine=MockSignalEngine(rate=1000)
+    )
+
+
+def run_logger(logger: VernierFSRLogger, duration: float, save_dir: Path) -> int:
+    _, clean_path = logger.run(duration, save_dir=save_dir, file_stem="BENCH")
+    return len(load_trial(clean_path, mmap=False)) if clean_path else 0
+
+
+@benchmark
+def startup(args, scratch: Path) -> dict:
+    times = []
+    for _ in range(3):
+        profile = import_profile("app")
+        times.append(next(cum for name, _, cum in profile if name == "app"))
+    return {"startup.import_app": (min(times) / 1e6, "s", False)}
+
+
+@benchmark
+def ingest(args, scratch: Path) -> dict:
+    duration = 0.5 if args.quick else 1.0
+    results = {}
+
+    logger = VernierFSRLogger(
+        use_mock=True,
+        stream=True,
+        echo=False,
+        mock_engine=MockSignalEngine(rate=50_000),
+    )
+    rows = run_logger(logger, duration, scratch / "mock")
+    results["ingest.mock_50k"] = (rows / duration, "samples/s", True)
+
+    if hasattr(os, "openpty"):
+        from core.hardware.simulator import SerialSimulator
+
+        for protocol in ("ascii", "binary"):
+            with SerialSimulator(rate=20_000) as simulator:
+                device = DeviceManager(port=simulator.port, timeout=0.05, reset_delay=0)
+                logger = VernierFSRLogger(
+                    device=device, stream=True, echo=False, protocol=protocol
+                )
+                rows = run_logger(logger, duration, scratch / f"pty_{protocol}")
+                device.close()
+            results[f"ingest.pty_{protocol}_20k"] = (rows / duration, "samples/s", True)
+    return results
+
+
+@benchmark
+def clean_files(args, scratch: Path) -> dict:
+    # Same size in quick mode, so rates stay comparable with the baseline
+    count = 100_000
+    engine = MockSignalEngine(rate=10_000)
+    records = engine.block(count)
+    stamp = datetime.now().strftime("%H:%M:%S.%f")
+    rows = [
+        (f"{t:.4f}", str(a), str(b), str(c), str(d))
+        for t, a, b, c, d in records.tolist()
+    ]
+    entries = [f"[{stamp}] {' | '.join(row)}" for row in rows]
+
+    def write(fmt):
+        writer = TrialWriter(scratch, f"BENCH_{fmt}", fsync=False, clean_formats=(fmt,))
+        for entry, row in zip(entries, rows):
+            writer.write_parsed(entry, row)
+        return writer.close()
+
+    write_csv = best_of(lambda: write("csv"))
+    write_npy = best_of(lambda: write("npy"))
+    parse_csv = best_of(lambda: load_trial(scratch / "CLEAN_BENCH_csv.csv"), 5)
+    parse_npy = best_of(
+        lambda: load_trial(scratch / "CLEAN_BENCH_npy.npy", mmap=False), 5
+    )
+    return {
+        "clean_csv.write": (count / write_csv, "rows/s", True),
+        "clean_npy.write": (count / write_npy, "rows/s", True),
+        "clean_csv.parse": (count / parse_csv, "rows/s", True),
+        "clean_npy.parse": (count / parse_npy, "rows/s", True),
+    }
+
+
+@benchmark
+def analysis(args, scratch: Path) -> dict:
+    results = {}
+    for trials in (10, 100) if args.quick else (10, 100, 1000):
+        directory = make_experiment(scratch / f"experiment_{trials}", trials)
+        repeat = 1 if trials >= 1000 else 3
+
+        def cold():
+            (directory / INDEX_FILENAME).unlink(missing_ok=True)
+            analyze_experiment(directory)
+
+        # What the analysis page runs: index update plus pooled summary
+        results[f"analysis.experiment_cold.{trials}"] = (
+            best_of(cold, repeat),
+            "s",
+            False,
+        )
+        results[f"analysis.experiment_warm.{trials}"] = (
+            best_of(lambda: analyze_experiment(directory), repeat),
+            "s",
+            False,
+        )
+    return results
+
+
+@benchmark
+def memory(args, scratch: Path) -> dict:
+    results = {}
+    for duration in (0.5, 1.0) if args.quick else (1.0, 2.0, 4.0):
+        logger = VernierFSRLogger(
+            use_mock=True,
+            stream=True,
+            echo=False,
+            mock_engine=MockSignalEngine(rate=10_000),
+        )
+        tracemalloc.start()
+        logger.run(duration, save_dir=scratch / "memory", file_stem="BENCH")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"memory.stream_peak.{duration:g}s"] = (peak / 2**20, "MiB", False)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Names of results that are worse than the baseline by more than
+    `tolerance` (a fraction of the baseline value).
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or not base["value"]:
+            continue
+        change = result["value"] / base["value"] - 1
+        if result["higher_is_better"]:
+            change = -change
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the acquisition benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads.")
+    parser.add_argument("--only", help="Run benchmark groups starting with this.")
+    parser.add_argument("--output", type=Path, help="Write results JSON here.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline.",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for func in BENCHMARKS:
+            if args.only and not func.__name__.startswith(args.only):
+                continue
+            print(f"Running {func.__name__}...", file=sys.stderr)
+            group = func(args, Path(scratch) / func.__name__)
+            for name, (value, unit, higher_is_better) in group.items():
+                results[name] = {
+                    "value": round(float(value), 6),
+                    "unit": unit,
+                    "higher_is_better": higher_is_better,
+                }
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    baseline = {}
+    if args.baseline.is_file():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.tolerance)
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = "new"
+        if base and base["value"]:
+            delta = f"{result['value'] / base['value'] - 1:+.0%}"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:34} {result['value']:14.4f} {result['unit']:10} {delta}{flag}")
+
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: "
+            f"{', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import logging
+import math
+import re
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.analysis.loader import CONDITIONS, SENSORS
+from core.logging.multi import raw_entries
+
+ALIGNED_PATTERN = re.compile(
+    r"^ALIGNED_TRIAL_(\d+)_LOC_(\d+)_(LUMP|NOLUMP)(?:_DEV\d+)?\.npz$"
+)
+RAW_PATTERN = re.compile(r"^RAW_(.+)\.csv$")
+DEFAULT_RATE = 100.0
+
+
+def load_raw_log(raw_path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read host and device timestamps plus sensor values from a RAW log.
+
+    Returns:
+        (host_s, values): Host time in seconds since midnight of the first
+        line, and an (n, 5) float64 array of Time(s), A, B, C, D.
+    """
+    host, rows = [], []
+    for seconds, _, _, row in raw_entries(Path(raw_path)):
+        host.append(seconds)
+        rows.append(row)
+    values = np.array(rows, dtype=np.float64).reshape(-1, 1 + len(SENSORS))
+    return np.array(host, dtype=np.float64), values
+
+
+def unwrap_device_time(device_s: np.ndarray, host_s: np.ndarray) -> np.ndarray:
+    """
+    Make device time monotonic across device clock restarts.
+
+    Wherever the device clock jumps backwards (firmware reset, counter
+    wrap), the step is replaced by the host-time step over the same samples.
+    """
+    if len(device_s) < 2:
+        return device_s.astype(np.float64)
+    device_step = np.diff(device_s)
+    host_step = np.diff(host_s)
+    correction = np.where(device_step < 0, host_step - device_step, 0.0)
+    return device_s + np.concatenate(([0.0], np.cumsum(correction)))
+
+
+def estimate_clock(
+    device_s: np.ndarray, host_s: np.ndarray, windows: int = 16
+) -> tuple[float, float]:
+    """
+    Fit host time as `offset + (1 + drift) * device_time`.
+
+    Lines are stamped when the host reads them, which is always after the
+    device produced them and often for a whole batch at once. The fit
+    therefore uses the lower envelope: the sample with the smallest
+    host-minus-device delay in each of `windows` equal device-time windows.
+
+    Args:
+        device_s (np.ndarray): Monotonic device time in seconds.
+        host_s (np.ndarray): Host time in seconds, same length.
+        windows (int): Number of envelope windows.
+
+    Returns:
+        (offset, drift): Offset in seconds and relative drift of the device
+        clock (1e-4 means the device clock runs 100 ppm slow).
+    """
+    if not len(device_s):
+        return 0.0, 0.0
+    delay = host_s - device_s
+    span = device_s[-1] - device_s[0]
+    if len(device_s) < 2 or span <= 0:
+        return float(np.min(delay)), 0.0
+
+    bins = ((device_s - device_s[0]) / span * windows).astype(np.int64)
+    bins = np.minimum(bins, windows - 1)
+    order = np.lexsort((delay, bins))
+    _, first = np.unique(bins[order], return_index=True)
+    envelope = order[first]
+    if len(envelope) < 2:
+        return float(np.min(delay)), 0.0
+
+    slope, offset = np.polyfit(device_s[envelope], host_s[envelope], 1)
+    return float(offset), float(slope - 1)
+
+
+def resample(
+    host_s: np.ndarray, values: np.ndarray, rate: float = DEFAULT_RATE
+) -> dict[str, np.ndarray]:
+    """
+    Map device time onto the host clock and resample onto a uniform grid.
+
+    Grid points sit at whole multiples of `1 / rate` host seconds, so trials
+    recorded on different devices at the same time share grid points.
+
+    Args:
+        host_s (np.ndarray): Host timestamps from `load_raw_log`.
+        values (np.ndarray): (n, 5) Time(s), A, B, C, D array.
+        rate (float): Grid rate in Hz.
+
+    Returns:
+        dict[str, np.ndarray]: `time` (host seconds), one float32 array per
+        sensor, and the fitted `offset`, `drift` and `rate`.
+    """
+    device_s = unwrap_device_time(values[:, 0], host_s)
+    offset, drift = estimate_clock(device_s, host_s)
+    corrected, unique = np.unique(offset + (1 + drift) * device_s, return_index=True)
+
+    if len(corrected):
+        first = math.ceil(corrected[0] * rate)
+        last = math.floor(corrected[-1] * rate)
+        grid = np.arange(first, last + 1, dtype=np.float64) / rate
+    else:
+        grid = np.empty(0, dtype=np.float64)
+
+    aligned = {"time": grid}
+    for column, sensor in enumerate(SENSORS, start=1):
+        aligned[sensor] = np.interp(grid, corrected, values[unique, column]).astype(
+            np.float32
+        )
+    aligned.update(offset=np.float64(offset), drift=np.float64(drift))
+    aligned["rate"] = np.float64(rate)
+    return aligned
+
+
+def align_trial(raw_path: Path, rate: float = DEFAULT_RATE) -> Path | None:
+    """
+    Align one RAW log and store it as `ALIGNED_<stem>.npz` next to it.
+
+    Returns:
+        Path | None: The aligned file, or None if the log had no samples.
+    """
+    raw_path = Path(raw_path)
+    stem = RAW_PATTERN.match(raw_path.name).group(1)
+    host_s, values = load_raw_log(raw_path)
+    if len(host_s) < 2:
+        logging.warning(f"Not enough samples to align {raw_path.name}.")
+        return None
+
+    aligned = resample(host_s, values, rate)
+    out_path = raw_path.with_name(f"ALIGNED_{stem}.npz")
+    np.savez(out_path, **aligned)
+    logging.info(
+        f"Aligned {raw_path.name}: offset {aligned['offset']:.4f}s, "
+        f"drift {aligned['drift'] * 1e6:.0f} ppm, {len(aligned['time'])} samples"
+    )
+    return out_path
+
+
+def align_trial_files(
+    save_dir: Path, file_stem: str, rate: float = DEFAULT_RATE
+) -> list[Path]:
+    """
+    Align the RAW logs of one trial, including per-device `_DEV<n>` logs.
+    """
+    pattern = re.compile(rf"^RAW_{re.escape(file_stem)}(?:_DEV\d+)?\.csv$")
+    paths = []
+    for raw_path in sorted(Path(save_dir).glob(f"RAW_{file_stem}*.csv")):
+        if pattern.match(raw_path.name):
+            aligned = align_trial(raw_path, rate)
+            if aligned is not None:
+                paths.append(aligned)
+    return paths
+
+
+def align_experiment(data_directory: Path, rate: float = DEFAULT_RATE) -> list[Path]:
+    """
+    Align every RAW trial log in an experiment whose aligned file is missing
+    or older than the log.
+
+    Returns:
+        list[Path]: Newly written aligned files.
+    """
+    written = []
+    for raw_path in sorted(Path(data_directory).rglob("RAW_*.csv")):
+        match = RAW_PATTERN.match(raw_path.name)
+        if not match:
+            continue
+        out_path = raw_path.with_name(f"ALIGNED_{match.group(1)}.npz")
+        if out_path.exists() and out_path.stat().st_mtime >= raw_path.stat().st_mtime:
+            continue
+        aligned = align_trial(raw_path, rate)
+        if aligned is not None:
+            written.append(aligned)
+    return written
+
+
+def find_aligned_files(directory: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in Path(directory).rglob("ALIGNED_*.npz")
+        if ALIGNED_PATTERN.match(path.name)
+    )
+
+
+def average_aligned(files: list[Path], sensor: str = "D") -> pd.DataFrame:
+    """
+    Average aligned trials sample by sample for each condition and quadrant.
+
+    Every trial is on the same uniform grid, so sample `i` of each trial is
+    `i / rate` seconds after its first grid point. Trials are padded with NaN
+    to the longest trial of their group, and each point averages the trials
+    that reach it.
+
+    Returns:
+        pd.DataFrame: Indexed by Time(s) since the first grid point, one
+        column per "<condition> Q<location>".
+    """
+    groups: dict[tuple[str, int], list[np.ndarray]] = {}
+    rate = None
+    for path in files:
+        match = ALIGNED_PATTERN.match(path.name)
+        key = (match.group(3), int(match.group(2)))
+        with np.load(path) as aligned:
+            groups.setdefault(key, []).append(aligned[sensor].astype(np.float64))
+            rate = rate or float(aligned["rate"])
+
+    length = max((len(t) for trials in groups.values() for t in trials), default=0)
+    columns = {}
+    for condition, location_no in sorted(
+        groups, key=lambda key: (CONDITIONS.index(key[0]), key[1])
+    ):
+        trials = groups[(condition, location_no)]
+        stacked = np.full((len(trials), length), np.nan)
+        for row, trial in zip(stacked, trials):
+            row[: len(trial)] = trial
+        with warnings.catch_warnings():
+            # Points past the end of every trial stay NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            columns[f"{condition} Q{location_no}"] = np.nanmean(stacked, axis=0)
+
+    frame = pd.DataFrame(columns)
+    frame.index = pd.Index(np.arange(length) / (rate or DEFAULT_RATE), name="Time(s)")
+    return frame
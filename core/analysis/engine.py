@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from core.analysis.heatmap import Panels, heatmap_png, quadrant_grid
+from core.analysis.index import ExperimentIndex
+from core.analysis.loader import CONDITIONS, SENSORS
+from core.analysis.stats import quadrant_values, summary_table, variability
+from core.utils.storage import find_clean_files
+
+REPORT_DIRNAME = "report"
+ARCHIVE_SUMMARY_FILENAME = "analysis_summary.json"
+
+
+@dataclass
+class ExperimentReport:
+    """
+    Everything the analysis page shows for one experiment, without Streamlit.
+    """
+
+    directory: Path
+    summary: pd.DataFrame
+    trials: int
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+    def table(self, sensor: str = "D") -> pd.DataFrame:
+        return summary_table(self.summary, sensor)
+
+    def variability(self, sensor: str = "D") -> pd.DataFrame:
+        return variability(self.summary, sensor)
+
+    def panels(self, sensor: str = "D") -> Panels:
+        """
+        One heatmap panel per condition for `heatmap_png`/`heatmap_spec`.
+        """
+        return tuple(
+            (
+                f"{condition} - Sensor {sensor}",
+                quadrant_grid(quadrant_values(self.summary, condition, sensor)),
+            )
+            for condition in CONDITIONS
+        )
+
+
+def analyze_experiment(
+    data_directory: Path,
+    files: list[Path] | None = None,
+    workers: int = 1,
+    executor: str = "thread",
+) -> ExperimentReport:
+    """
+    Update an experiment's analysis index and summarize it.
+
+    Args:
+        data_directory (Path): Experiment directory.
+        files (list[Path] | None): Trial files. Defaults to
+            `find_clean_files(data_directory)`.
+        workers (int): Pool size for reading changed trials.
+        executor (str): "thread" or "process".
+
+    Returns:
+        ExperimentReport: Pooled summary plus unreadable trials.
+    """
+    data_directory = Path(data_directory)
+    if files is None:
+        files = find_clean_files(data_directory)
+    index = ExperimentIndex.load(data_directory)
+    index.update(files, workers=workers, executor=executor)
+    return ExperimentReport(
+        directory=data_directory,
+        summary=index.summary(),
+        trials=len(index.trials),
+        errors=sorted(index.errors.items()),
+    )
+
+
+def records(frame: pd.DataFrame) -> list[dict]:
+    # NaN is not valid JSON
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+def write_report(
+    report: ExperimentReport,
+    out_dir: Path,
+    sensors: tuple[str, ...] = SENSORS,
+    vmin: float = 0.0,
+    vmax: float = 60000.0,
+) -> list[Path]:
+    """
+    Write summary.csv, variability.csv, report.json and one
+    heatmap_<sensor>.png per sensor.
+
+    Returns:
+        list[Path]: The files written.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = report.summary.reset_index()
+    spread = pd.concat(
+        [report.variability(s).assign(sensor=s) for s in sensors], ignore_index=True
+    )[["sensor", "condition", "range", "std", "cv"]]
+
+    paths = [out_dir / "summary.csv", out_dir / "variability.csv"]
+    summary.to_csv(paths[0], index=False)
+    spread.to_csv(paths[1], index=False)
+    for sensor in sensors:
+        path = out_dir / f"heatmap_{sensor}.png"
+        path.write_bytes(heatmap_png(report.panels(sensor), vmin, vmax))
+        paths.append(path)
+
+    document = {
+        "experiment": report.directory.name,
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "trials": report.trials,
+        "errors": [{"file": f, "message": m} for f, m in report.errors],
+        "summary": records(summary),
+        "variability": records(spread),
+    }
+    path = out_dir / "report.json"
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    paths.append(path)
+    return paths
+
+
+def find_experiments(root: Path) -> list[Path]:
+    """
+    Directories directly under `root` that contain CLEAN trial files.
+    """
+    return [
+        path
+        for path in sorted(Path(root).iterdir())
+        if path.is_dir() and find_clean_files(path)
+    ]
+
+
+def process_experiment(
+    data_directory: Path,
+    out_dir: Path | None = None,
+    sensors: tuple[str, ...] = SENSORS,
+    vmin: float = 0.0,
+    vmax: float = 60000.0,
+) -> dict:
+    """
+    Analyze one experiment and write its report; runs in a worker process.
+
+    Returns:
+        dict: Outcome for the archive summary. Failures are reported in
+        `error` rather than raised, so one bad experiment does not stop a
+        batch.
+    """
+    data_directory = Path(data_directory)
+    out_dir = Path(out_dir or data_directory / REPORT_DIRNAME)
+    outcome = {"experiment": str(data_directory), "report": str(out_dir)}
+    try:
+        report = analyze_experiment(data_directory)
+        write_report(report, out_dir, sensors, vmin, vmax)
+    except Exception as e:
+        logging.error(f"Analysis of {data_directory} failed: {e}")
+        return {**outcome, "status": "failed", "error": str(e)}
+    return {
+        **outcome,
+        "status": "done",
+        "trials": report.trials,
+        "unreadable": len(report.errors),
+    }
+
+
+def analyze_archive(
+    root: Path,
+    output: Path | None = None,
+    workers: int = 0,
+    sensors: tuple[str, ...] = SENSORS,
+    vmin: float = 0.0,
+    vmax: float = 60000.0,
+    experiments: list[Path] | None = None,
+) -> list[dict]:
+    """
+    Analyze the experiments of an archive, one process per experiment.
+
+    Args:
+        root (Path): Archive directory, usually DATA_DIRECTORY.
+        output (Path | None): Write reports to `output/<experiment>/`
+            instead of `<experiment>/report/`.
+        workers (int): Process count; 0 uses one per CPU, 1 runs in-process.
+        experiments (list[Path] | None): Experiment directories to analyze
+            instead of `find_experiments(root)`.
+
+    Returns:
+        list[dict]: `process_experiment` outcomes in experiment order, also
+        saved as ARCHIVE_SUMMARY_FILENAME in `output` (or `root`).
+    """
+    if experiments is None:
+        experiments = find_experiments(root)
+    experiments = [Path(path) for path in experiments]
+    out_dirs = [output / path.name if output else None for path in experiments]
+    workers = min(workers or os.cpu_count() or 1, max(len(experiments), 1))
+
+    count = len(experiments)
+    arguments = (
+        experiments,
+        out_dirs,
+        [sensors] * count,
+        [vmin] * count,
+        [vmax] * count,
+    )
+    if workers <= 1:
+        outcomes = list(map(process_experiment, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(process_experiment, *arguments))
+
+    summary_path = Path(output or root) / ARCHIVE_SUMMARY_FILENAME
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(
+        json.dumps(
+            {
+                "generated": datetime.now().isoformat(timespec="seconds"),
+                "experiments": outcomes,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    logging.info(f"Analyzed {len(experiments)} experiments; summary in {summary_path}")
+    return outcomes
@@ -0,0 +1,122 @@
+import io
+import math
+
+import numpy as np
+
+# Quadrants as they sit on the board: Q2 Q1 on top, Q3 Q4 below
+LAYOUT = (("Q2", "Q1"), ("Q3", "Q4"))
+CMAP = "YlOrRd"
+VEGA_SCHEME = "yelloworangered"
+
+# (title, grid) pairs; grids are nested tuples so they can key a cache
+Grid = tuple[tuple[float, ...], ...]
+Panels = tuple[tuple[str, Grid], ...]
+
+
+def quadrant_grid(values: dict[str, float]) -> Grid:
+    """
+    Arrange per-quadrant values in board layout, NaN where one is missing.
+    """
+    return tuple(tuple(float(values.get(q, np.nan)) for q in row) for row in LAYOUT)
+
+
+def heatmap_png(panels: Panels, vmin: float, vmax: float) -> bytes:
+    """
+    Render one annotated quadrant heatmap per panel, side by side, as PNG.
+
+    The figure is built without pyplot, so it is not kept alive by pyplot's
+    figure registry once rendered and can be drawn from any thread or
+    worker process.
+
+    Args:
+        panels (Panels): (title, grid) pairs from `quadrant_grid`.
+        vmin (float): Reading mapped to the bottom of the colour scale.
+        vmax (float): Reading mapped to the top of the colour scale.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(7 * len(panels), 6))
+    axs = fig.subplots(1, len(panels), squeeze=False)[0]
+    for ax, (title, grid) in zip(axs, panels):
+        data = np.array(grid, dtype=np.float64)
+        image = ax.imshow(data, cmap=CMAP, vmin=vmin, vmax=vmax)
+        for (row, col), value in np.ndenumerate(data):
+            shade = (value - vmin) / (vmax - vmin) if vmax > vmin else 0.0
+            ax.text(
+                col,
+                row,
+                f"{LAYOUT[row][col]}\n{value:.1f}",
+                ha="center",
+                va="center",
+                color="white" if shade > 0.6 else "black",
+            )
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_title(title)
+        fig.colorbar(image, ax=ax)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def heatmap_spec(panels: Panels, vmin: float, vmax: float) -> dict:
+    """
+    Vega-Lite spec of the same heatmaps for `st.vega_lite_chart`, with
+    hover tooltips and no server-side rendering.
+    """
+    values = []
+    for title, grid in panels:
+        for row, cells in enumerate(grid):
+            for col, value in enumerate(cells):
+                missing = math.isnan(value)
+                values.append(
+                    {
+                        "panel": title,
+                        "quadrant": LAYOUT[row][col],
+                        "row": row,
+                        "col": col,
+                        # NaN is not valid JSON
+                        "value": None if missing else value,
+                        "label": f"{LAYOUT[row][col]}\n"
+                        + ("n/a" if missing else f"{value:.1f}"),
+                    }
+                )
+
+    position = {
+        "x": {"field": "col", "type": "ordinal", "axis": None},
+        "y": {"field": "row", "type": "ordinal", "axis": None},
+    }
+    return {
+        "data": {"values": values},
+        "facet": {"column": {"field": "panel", "type": "nominal", "title": None}},
+        "spec": {
+            "width": 240,
+            "height": 240,
+            "layer": [
+                {
+                    "mark": "rect",
+                    "encoding": {
+                        **position,
+                        "color": {
+                            "field": "value",
+                            "type": "quantitative",
+                            "title": None,
+                            "scale": {"domain": [vmin, vmax], "scheme": VEGA_SCHEME},
+                        },
+                        "tooltip": [
+                            {"field": "quadrant", "type": "nominal"},
+                            {"field": "value", "type": "quantitative", "format": ".1f"},
+                        ],
+                    },
+                },
+                {
+                    "mark": {"type": "text", "lineBreak": "\n"},
+                    "encoding": {**position, "text": {"field": "label"}},
+                },
+            ],
+        },
+    }
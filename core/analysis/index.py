@@ -0,0 +1,219 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.analysis.loader import READ_BATCH, SENSORS, parse_trial_name, read_trials
+from core.analysis.online import RunningStats, TrialStats, load_stats
+from core.analysis.sketch import QuantileSketch
+from core.utils.storage import find_clean_files
+
+INDEX_FILENAME = ".analysis_index.json"
+INDEX_VERSION = 2
+
+
+def sensor_aggregates(values: np.ndarray) -> dict:
+    """
+    Mergeable aggregates of one sensor column of one trial: `RunningStats`
+    fields plus a quantile sketch, the same layout as a STATS_*.json entry.
+    """
+    running = RunningStats()
+    running.update(values)
+    sketch = QuantileSketch()
+    sketch.update(values)
+    return {**running.to_dict(), "sketch": sketch.to_dict()}
+
+
+def merge_aggregates(parts: list[dict]) -> dict:
+    """
+    Combine per-trial sensor aggregates into count/avg/median/std/min/max.
+    """
+    running = RunningStats()
+    sketch = QuantileSketch.from_dict(parts[0]["sketch"])
+    for i, part in enumerate(parts):
+        running.merge(RunningStats.from_dict(part))
+        if i:
+            sketch.merge(QuantileSketch.from_dict(part["sketch"]))
+
+    return {
+        "count": running.count,
+        "avg": running.mean if running.count else np.nan,
+        "median": sketch.quantile(0.5),
+        "std": running.std,
+        "min": np.nan if running.min is None else running.min,
+        "max": np.nan if running.max is None else running.max,
+    }
+
+
+def stats_sidecar(path: Path) -> TrialStats | None:
+    """
+    The logger's STATS_<stem>.json for a CLEAN trial file, if it was written
+    after the file and so describes the same samples.
+    """
+    stem = path.stem.removeprefix("CLEAN_")
+    sidecar = path.with_name(f"STATS_{stem}.json")
+    try:
+        if sidecar.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+    except OSError:
+        return None
+    return load_stats(sidecar)
+
+
+class ExperimentIndex:
+    """
+    Per-experiment sidecar of trial file signatures and per-trial aggregates.
+
+    Stored as INDEX_FILENAME in the experiment directory. `update()` only
+    re-reads trials whose file was added or changed since the last update,
+    so refreshing the summary costs one stat() per trial plus the new data.
+    Changed trials are read READ_BATCH at a time and reduced to aggregates,
+    so at most one batch of samples is held in memory.
+    New trials that come with the logger's STATS_*.json sidecar are merged
+    from it without reading their samples at all.
+    """
+
+    def __init__(self, data_directory: Path):
+        self.data_directory = Path(data_directory)
+        self.path = self.data_directory / INDEX_FILENAME
+        self.trials: dict[str, dict] = {}
+        self.errors: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, data_directory: Path) -> "ExperimentIndex":
+        index = cls(data_directory)
+        if not index.path.is_file():
+            return index
+
+        try:
+            data = json.loads(index.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable analysis index {index.path}: {e}")
+            return index
+
+        if data.get("version") == INDEX_VERSION:
+            index.trials = data.get("trials", {})
+        return index
+
+    def save(self) -> None:
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": INDEX_VERSION, "trials": self.trials}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def update(
+        self,
+        files: list[Path] | None = None,
+        workers: int = 1,
+        executor: str = "thread",
+    ) -> list[str]:
+        """
+        Bring the index in line with the trial files on disk.
+
+        Args:
+            files (list[Path] | None): Trial files. Defaults to
+                `find_clean_files(data_directory)`.
+            workers (int): Pool size for reading changed trials.
+            executor (str): "thread" or "process".
+
+        Returns:
+            list[str]: Relative paths of trials that were (re)read.
+        """
+        if files is None:
+            files = find_clean_files(self.data_directory)
+
+        current, stale = {}, []
+        for path in files:
+            relative_path = str(path.relative_to(self.data_directory))
+            stat = path.stat()
+            current[relative_path] = [stat.st_mtime_ns, stat.st_size]
+            entry = self.trials.get(relative_path)
+            if entry is None or entry["signature"] != current[relative_path]:
+                stale.append(path)
+
+        removed = set(self.trials) - set(current)
+        for relative_path in removed:
+            del self.trials[relative_path]
+        self.errors = {}
+
+        # Trials the logger already summarized are merged without reading
+        unread = []
+        for path in stale:
+            relative_path = str(path.relative_to(self.data_directory))
+            parsed = parse_trial_name(path.name)
+            stats = stats_sidecar(path) if parsed else None
+            if stats is None or not set(SENSORS) <= set(stats.running):
+                unread.append(path)
+                continue
+            self._add(relative_path, current[relative_path], parsed, stats.to_dict())
+
+        # Reduce each batch to aggregates before reading the next one
+        for start in range(0, len(unread), READ_BATCH):
+            batch = unread[start : start + READ_BATCH]
+            results = read_trials(self.data_directory, batch, workers, executor)
+            for relative_path, parsed, records, error in results:
+                self.trials.pop(relative_path, None)
+                if error is not None:
+                    self.errors[relative_path] = error
+                    continue
+                sensors = {s: sensor_aggregates(records[s]) for s in SENSORS}
+                self._add(
+                    relative_path, current[relative_path], parsed, {"sensors": sensors}
+                )
+            results = records = None
+
+        if stale or removed:
+            self.save()
+        logging.info(
+            f"Analysis index: {len(unread)} trials read, "
+            f"{len(stale) - len(unread)} from STATS files, "
+            f"{len(current) - len(stale)} reused."
+        )
+        return [str(p.relative_to(self.data_directory)) for p in stale]
+
+    def _add(
+        self, relative_path: str, signature: list[int], parsed: tuple, stats: dict
+    ) -> None:
+        trial_no, location_no, condition = parsed
+        self.trials[relative_path] = {
+            "signature": signature,
+            "trial_no": trial_no,
+            "location_no": location_no,
+            "condition": condition,
+            "sensors": {s: stats["sensors"][s] for s in SENSORS},
+        }
+
+    def summary(self, decimals: int | None = 1) -> pd.DataFrame:
+        """
+        Merge per-trial aggregates into pooled per-condition/quadrant/sensor
+        statistics.
+
+        Returns:
+            pd.DataFrame: Indexed by (condition, quadrant, sensor) with avg,
+            median, std, count, min and max columns.
+        """
+        groups: dict[tuple[str, str, str], list[dict]] = {}
+        for entry in self.trials.values():
+            quadrant = f"Q{entry['location_no']}"
+            for sensor, aggregates in entry["sensors"].items():
+                key = (entry["condition"], quadrant, sensor)
+                groups.setdefault(key, []).append(aggregates)
+
+        rows = {key: merge_aggregates(parts) for key, parts in groups.items()}
+        summary = pd.DataFrame.from_dict(
+            rows,
+            orient="index",
+            columns=["avg", "median", "std", "count", "min", "max"],
+        )
+        summary.index = pd.MultiIndex.from_tuples(
+            summary.index, names=["condition", "quadrant", "sensor"]
+        )
+        summary = summary.sort_index()
+        if decimals is not None:
+            summary = summary.round(decimals)
+        return summary
@@ -0,0 +1,110 @@
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from core.utils.storage import load_trial
+
+# Multi-device trials add a `_DEV<n>` suffix; each device counts as a trial
+TRIAL_PATTERN = re.compile(
+    r"^CLEAN_TRIAL_(\d+)_LOC_(\d+)_(LUMP|NOLUMP)(?:_DEV\d+)?\.(?:csv|npy)$"
+)
+SENSORS = ("A", "B", "C", "D")
+CONDITIONS = ("LUMP", "NOLUMP")
+EXECUTORS = ("thread", "process")
+# Trials read per `read_trials()` call when building the index or the store,
+# so a cold build never needs the whole experiment in RAM
+READ_BATCH = 32
+
+Signature = tuple[tuple[str, int, int], ...]
+
+
+def file_signature(files: list[Path]) -> Signature:
+    """
+    Identify a set of files by path, modification time and size.
+
+    Args:
+        files (list[Path]): Files to describe.
+
+    Returns:
+        Signature: Hashable (path, mtime_ns, size) tuples, usable as a cache key.
+    """
+    signature = []
+    for path in files:
+        stat = path.stat()
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def parse_trial_name(filename: str) -> tuple[int, int, str] | None:
+    """
+    Extract (trial_no, location_no, condition) from a CLEAN trial filename.
+    """
+    match = TRIAL_PATTERN.match(filename)
+    if not match:
+        return None
+    trial_num, loc, condition = match.groups()
+    return int(trial_num), int(loc), condition
+
+
+def _read_trial(file_path: Path, data_directory: Path):
+    """
+    Parse one trial file; runs inside the loader's worker pool.
+
+    Returns:
+        (relative_path, metadata, records, error) with exactly one of
+        records/error set.
+    """
+    relative_path = str(file_path.relative_to(data_directory))
+    parsed = parse_trial_name(file_path.name)
+    if parsed is None:
+        return relative_path, None, None, "Regex mismatch"
+
+    try:
+        records = np.asarray(load_trial(file_path))
+    except Exception as e:
+        logging.error(f"Error processing {file_path.name}: {e}")
+        return relative_path, parsed, None, f"Failed to parse or process: {e}"
+
+    logging.debug(f"Loaded {len(records)} samples from {relative_path}")
+    return relative_path, parsed, records, None
+
+
+def read_trials(
+    data_directory: Path,
+    files: list[Path],
+    workers: int = 1,
+    executor: str = "thread",
+) -> list[tuple]:
+    """
+    Parse trial files in a worker pool, returning results in file order.
+
+    Args:
+        data_directory (Path): Experiment directory the files are relative to.
+        files (list[Path]): Trial files to read.
+        workers (int): Pool size; 0 uses one worker per CPU, 1 reads sequentially.
+        executor (str): "thread" or "process".
+
+    Returns:
+        list[tuple]: (relative_path, metadata, records, error) per file, with
+        exactly one of records/error set.
+    """
+    read = partial(_read_trial, data_directory=data_directory)
+    if executor not in EXECUTORS:
+        raise ValueError(f"Invalid executor {executor!r}. Allowed: {EXECUTORS}")
+
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return list(map(read, files))
+
+    if executor == "process":
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(read, files, chunksize=chunksize))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(read, files))
@@ -0,0 +1,168 @@
+import json
+import logging
+import math
+from pathlib import Path
+
+import numpy as np
+
+from core.analysis.sketch import QuantileSketch
+from core.utils.storage import TRIAL_DTYPE
+
+SENSOR_COLUMNS = TRIAL_DTYPE.names[1:]
+
+
+class RunningStats:
+    """
+    Welford mean/variance with min and max, updated in batches.
+
+    Each batch is reduced with NumPy and folded in with Chan's parallel
+    update, which is also how two accumulators merge, so per-trial results
+    combine across trials without revisiting samples.
+    """
+
+    def __init__(
+        self,
+        count: int = 0,
+        mean: float = 0.0,
+        m2: float = 0.0,
+        min: float | None = None,
+        max: float | None = None,
+    ):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.min = min
+        self.max = max
+
+    def update(self, values) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        mean = float(values.mean())
+        batch = RunningStats(
+            len(values),
+            mean,
+            float(np.square(values - mean).sum()),
+            float(values.min()),
+            float(values.max()),
+        )
+        self.merge(batch)
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1); NaN for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        return cls(data["count"], data["mean"], data["m2"], data["min"], data["max"])
+
+
+class TrialStats:
+    """
+    Per-sensor running statistics and quantile sketches for one trial.
+
+    Memory stays bounded however long the trial runs: a `RunningStats` and
+    a `QuantileSketch` (medians and percentiles within 8 counts) per sensor.
+    """
+
+    def __init__(self, sensors: tuple[str, ...] = SENSOR_COLUMNS):
+        self.running = {sensor: RunningStats() for sensor in sensors}
+        self.sketches = {sensor: QuantileSketch() for sensor in sensors}
+
+    @property
+    def count(self) -> int:
+        return max((r.count for r in self.running.values()), default=0)
+
+    def update(self, records: np.ndarray) -> None:
+        """
+        Add a block of TRIAL_DTYPE samples.
+        """
+        for sensor, running in self.running.items():
+            running.update(records[sensor])
+            self.sketches[sensor].update(records[sensor])
+
+    def merge(self, other: "TrialStats") -> None:
+        for sensor, running in other.running.items():
+            self.running.setdefault(sensor, RunningStats()).merge(running)
+            self.sketches.setdefault(sensor, QuantileSketch()).merge(
+                other.sketches[sensor]
+            )
+
+    def quantile(self, sensor: str, q: float) -> float:
+        return self.sketches[sensor].quantile(q)
+
+    def summary(self, sensor: str) -> dict:
+        """
+        count/avg/median/std/min/max of one sensor.
+        """
+        running = self.running[sensor]
+        return {
+            "count": running.count,
+            "avg": running.mean if running.count else math.nan,
+            "median": self.quantile(sensor, 0.5),
+            "std": running.std,
+            "min": math.nan if running.min is None else running.min,
+            "max": math.nan if running.max is None else running.max,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "sensors": {
+                sensor: {
+                    **running.to_dict(),
+                    "sketch": self.sketches[sensor].to_dict(),
+                }
+                for sensor, running in self.running.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrialStats":
+        stats = cls(sensors=())
+        for sensor, entry in data["sensors"].items():
+            stats.running[sensor] = RunningStats.from_dict(entry)
+            stats.sketches[sensor] = QuantileSketch.from_dict(entry["sketch"])
+        return stats
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        logging.info(f"Saved trial statistics to {path.resolve()}")
+        return path
+
+
+def load_stats(path: Path) -> TrialStats | None:
+    """
+    Read a STATS_*.json sidecar, or None if it is missing or unreadable.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return TrialStats.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,127 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from core.analysis.index import merge_aggregates
+from core.analysis.loader import SENSORS
+
+
+def trial_overview(trials: dict[str, dict]) -> pd.DataFrame:
+    """
+    One row per trial from the analysis index, without reading any samples.
+
+    Args:
+        trials (dict[str, dict]): `ExperimentIndex.trials`.
+
+    Returns:
+        pd.DataFrame: file, trial_no, location_no, condition and samples,
+        then avg/min/max columns for every sensor, sorted by file.
+    """
+    rows = []
+    for relative_path, entry in sorted(trials.items()):
+        row = {
+            "file": relative_path,
+            "trial_no": entry["trial_no"],
+            "location_no": entry["location_no"],
+            "condition": entry["condition"],
+        }
+        for sensor in SENSORS:
+            stats = merge_aggregates([entry["sensors"][sensor]])
+            row["samples"] = stats["count"]
+            row[f"{sensor} avg"] = round(stats["avg"], 1)
+            row[f"{sensor} min"] = stats["min"]
+            row[f"{sensor} max"] = stats["max"]
+        rows.append(row)
+    columns = ["file", "trial_no", "location_no", "condition", "samples"]
+    columns += [f"{s} {m}" for s in SENSORS for m in ("avg", "min", "max")]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def page_count(total: int, page_size: int) -> int:
+    return max(1, math.ceil(total / page_size))
+
+
+def paginate(records: np.ndarray, page: int, page_size: int) -> pd.DataFrame:
+    """
+    Rows of one page (1-based) of a trial. Only that slice is copied, so a
+    memory-mapped trial reads just the rows shown.
+    """
+    start = (min(max(page, 1), page_count(len(records), page_size)) - 1) * page_size
+    frame = pd.DataFrame(np.asarray(records[start : start + page_size]))
+    frame.index = pd.RangeIndex(start, start + len(frame), name="sample")
+    return frame
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last samples and, from each of `points - 2` equal
+    buckets in between, the sample forming the largest triangle with the
+    previously kept sample and the mean of the next bucket. Peaks and
+    troughs survive, unlike with plain striding.
+
+    Args:
+        x (np.ndarray): Monotonic x values.
+        y (np.ndarray): Values to preserve the shape of.
+        points (int): Number of samples to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the kept samples.
+    """
+    n = len(y)
+    if points >= n:
+        return np.arange(n)
+    if points < 3:
+        return np.linspace(0, n - 1, points, dtype=np.int64)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, points - 1).astype(int)
+    kept = np.empty(points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_x = x[stop : edges[bucket + 2]].mean()
+            next_y = y[stop : edges[bucket + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        kept[bucket + 1] = previous
+    return kept
+
+
+def downsample(
+    records: np.ndarray, points: int = 1000, sensors: tuple[str, ...] = SENSORS
+) -> pd.DataFrame:
+    """
+    Bounded-size view of a trial for plotting.
+
+    Takes the union of `lttb` picks for each sensor plus each sensor's
+    global minimum and maximum, so at most `len(sensors) * (points + 2)`
+    rows are returned however long the trial is.
+
+    Returns:
+        pd.DataFrame: Indexed by `Time(s)` with one column per sensor.
+    """
+    time = np.asarray(records["Time(s)"], dtype=np.float64)
+    picks = []
+    for sensor in sensors:
+        values = np.asarray(records[sensor], dtype=np.float64)
+        picks.append(lttb(time, values, points))
+        if len(values):
+            picks.append([values.argmin(), values.argmax()])
+    keep = np.unique(np.concatenate(picks)) if picks else np.arange(0)
+    selected = np.asarray(records[keep])
+    return pd.DataFrame(
+        {sensor: selected[sensor] for sensor in sensors},
+        index=pd.Index(selected["Time(s)"], name="Time(s)"),
+    )
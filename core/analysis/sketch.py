@@ -0,0 +1,76 @@
+import numpy as np
+
+SENSOR_MAX = 65535
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch over the uint16 sensor range.
+
+    Values are counted in fixed-width bins, so two sketches merge by adding
+    counts and any quantile is within `bin_width / 2` of the exact sample
+    quantile, independent of how many values were added. Counts live in one
+    preallocated array covering the whole range (32 KiB at the default
+    width), updated with `np.bincount`.
+    """
+
+    def __init__(self, bin_width: int = 16, counts: np.ndarray | None = None):
+        if bin_width < 1:
+            raise ValueError(f"bin_width must be positive, got {bin_width}")
+        self.bin_width = bin_width
+        self.counts = np.zeros(SENSOR_MAX // bin_width + 1, dtype=np.int64)
+        if counts is not None:
+            self.counts += counts
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values) -> None:
+        values = np.asarray(values)
+        if not len(values):
+            return
+        if values.dtype != np.uint16:
+            values = np.clip(values.astype(np.int64), 0, SENSOR_MAX)
+        self.counts += np.bincount(values // self.bin_width, minlength=len(self.counts))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.bin_width != self.bin_width:
+            raise ValueError(
+                f"Cannot merge sketches with bin widths {self.bin_width} "
+                f"and {other.bin_width}"
+            )
+        self.counts += other.counts
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-th quantile (0 <= q <= 1); NaN for an empty sketch.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be in [0, 1], got {q}")
+        bins = np.flatnonzero(self.counts)
+        if not len(bins):
+            return np.nan
+
+        counts = self.counts[bins]
+        cumulative = np.cumsum(counts)
+        rank = q * (cumulative[-1] - 1)
+        i = int(np.searchsorted(cumulative, rank, side="right"))
+        before = cumulative[i - 1] if i > 0 else 0
+        fraction = (rank - before + 0.5) / counts[i]
+        return float(bins[i] * self.bin_width + fraction * self.bin_width)
+
+    def to_dict(self) -> dict:
+        # Sparse, so sidecars and the index only store occupied bins
+        bins = np.flatnonzero(self.counts)
+        return {
+            "bin_width": self.bin_width,
+            "bins": bins.tolist(),
+            "counts": self.counts[bins].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data["bin_width"])
+        sketch.counts[np.asarray(data["bins"], dtype=np.int64)] = data["counts"]
+        return sketch
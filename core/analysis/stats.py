@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from core.analysis.loader import CONDITIONS
+
+QUADRANTS = ("Q1", "Q2", "Q3", "Q4")
+METRICS = ("avg", "median", "std")
+
+
+def summary_table(summary: pd.DataFrame, sensor: str = "D") -> pd.DataFrame:
+    """
+    Lay out one sensor's summary as Condition/Metric rows and Q1-Q4 columns.
+    """
+    rows = []
+    for condition in CONDITIONS:
+        for metric in METRICS:
+            row = {"Condition": condition, "Metric": metric}
+            for q in QUADRANTS:
+                row[q] = lookup(summary, condition, q, sensor, metric)
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def lookup(
+    summary: pd.DataFrame, condition: str, quadrant: str, sensor: str, metric: str
+) -> float:
+    try:
+        return summary.at[(condition, quadrant, sensor), metric]
+    except KeyError:
+        return np.nan
+
+
+def quadrant_values(
+    summary: pd.DataFrame, condition: str, sensor: str = "D", metric: str = "avg"
+) -> dict[str, float]:
+    return {q: lookup(summary, condition, q, sensor, metric) for q in QUADRANTS}
+
+
+def compute_metrics(quadrant_avgs: dict[str, float]) -> tuple[float, float, float]:
+    """
+    Inter-quadrant range, standard deviation and coefficient of variation (%)
+    of the quadrant averages; NaN when fewer than two quadrants have data.
+    """
+    quad_arr = np.array([quadrant_avgs.get(q, np.nan) for q in QUADRANTS])
+    quad_arr_clean = quad_arr[~np.isnan(quad_arr)]
+    if len(quad_arr_clean) >= 2:
+        q_mean = np.mean(quad_arr_clean)
+        q_std = np.std(quad_arr_clean)
+        q_range = np.max(quad_arr_clean) - np.min(quad_arr_clean)
+        q_cv = (q_std / q_mean) * 100 if q_mean != 0 else np.nan
+        return q_range, q_std, q_cv
+    return np.nan, np.nan, np.nan
+
+
+def variability(summary: pd.DataFrame, sensor: str = "D") -> pd.DataFrame:
+    """
+    Compute `compute_metrics` for each condition of one sensor.
+
+    Returns:
+        pd.DataFrame: One row per condition with range, std and cv columns.
+    """
+    rows = []
+    for condition in CONDITIONS:
+        r, s, c = compute_metrics(quadrant_values(summary, condition, sensor))
+        rows.append({"condition": condition, "range": r, "std": s, "cv": c})
+    return pd.DataFrame(rows)
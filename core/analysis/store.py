@@ -0,0 +1,232 @@
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+from core.analysis.loader import READ_BATCH, read_trials
+from core.utils.storage import TRIAL_DTYPE, find_clean_files
+
+STORE_DIRNAME = ".store"
+SAMPLES_FILENAME = "samples.bin"
+OFFSETS_FILENAME = "offsets.json"
+STORE_VERSION = 1
+
+
+class ExperimentStore:
+    """
+    Consolidated, memory-mapped copy of every CLEAN trial of an experiment.
+
+    Samples of all trials are appended to one flat TRIAL_DTYPE file,
+    `.store/samples.bin`, and `.store/offsets.json` records where each trial
+    starts, how many samples it has, its file signature and its
+    (trial, location, condition). Trials are served as zero-copy slices of a
+    read-only memory map, so analysis can walk experiments larger than RAM.
+
+    `update()` appends trials that are new or changed on disk. Replaced and
+    removed trials leave dead samples behind, which `compact()` reclaims once
+    they outnumber the live ones.
+    """
+
+    def __init__(self, data_directory: Path):
+        self.data_directory = Path(data_directory)
+        self.directory = self.data_directory / STORE_DIRNAME
+        self.samples_path = self.directory / SAMPLES_FILENAME
+        self.offsets_path = self.directory / OFFSETS_FILENAME
+        self.trials: dict[str, dict] = {}
+        self.errors: dict[str, str] = {}
+        self.count = 0
+        self._samples: np.ndarray | None = None
+
+    @classmethod
+    def load(cls, data_directory: Path) -> "ExperimentStore":
+        store = cls(data_directory)
+        if not store.offsets_path.is_file():
+            return store
+
+        try:
+            data = json.loads(store.offsets_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logging.warning(
+                f"Ignoring unreadable experiment store {store.directory}: {e}"
+            )
+            return store
+
+        size = store.samples_path.stat().st_size if store.samples_path.is_file() else 0
+        if (
+            data.get("version") == STORE_VERSION
+            and data.get("count", 0) * TRIAL_DTYPE.itemsize <= size
+        ):
+            store.trials = data.get("trials", {})
+            store.count = data.get("count", 0)
+        return store
+
+    def save(self) -> None:
+        tmp_path = self.offsets_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": STORE_VERSION, "count": self.count, "trials": self.trials}
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.offsets_path)
+
+    @property
+    def live(self) -> int:
+        """Samples that belong to a current trial."""
+        return sum(entry["count"] for entry in self.trials.values())
+
+    @property
+    def garbage(self) -> int:
+        """Samples left behind by replaced or removed trials."""
+        return self.count - self.live
+
+    def update(
+        self,
+        files: list[Path] | None = None,
+        workers: int = 1,
+        executor: str = "thread",
+    ) -> list[str]:
+        """
+        Append trials whose files were added or changed since the last update.
+
+        Args:
+            files (list[Path] | None): Trial files. Defaults to
+                `find_clean_files(data_directory)`.
+            workers (int): Pool size for reading changed trials.
+            executor (str): "thread" or "process".
+
+        Returns:
+            list[str]: Relative paths of trials that were (re)read.
+        """
+        if files is None:
+            files = find_clean_files(self.data_directory)
+
+        current, stale = {}, []
+        for path in files:
+            relative_path = str(path.relative_to(self.data_directory))
+            stat = path.stat()
+            current[relative_path] = [stat.st_mtime_ns, stat.st_size]
+            entry = self.trials.get(relative_path)
+            if entry is None or entry["signature"] != current[relative_path]:
+                stale.append(path)
+
+        removed = set(self.trials) - set(current)
+        for relative_path in removed:
+            del self.trials[relative_path]
+        self.errors = {}
+
+        if stale:
+            self.directory.mkdir(exist_ok=True)
+            with self.samples_path.open("ab") as f:
+                # Drop the tail of an append that never reached offsets.json
+                f.truncate(self.count * TRIAL_DTYPE.itemsize)
+                for start in range(0, len(stale), READ_BATCH):
+                    batch = stale[start : start + READ_BATCH]
+                    self._append(
+                        f,
+                        read_trials(self.data_directory, batch, workers, executor),
+                        current,
+                    )
+                f.flush()
+                os.fsync(f.fileno())
+
+        if stale or removed:
+            self._samples = None
+            if self.garbage > self.live:
+                self.compact()
+            self.save()
+        logging.info(
+            f"Experiment store: {len(stale)} trials appended, "
+            f"{len(current) - len(stale)} reused."
+        )
+        return [str(p.relative_to(self.data_directory)) for p in stale]
+
+    def _append(self, f, results: list[tuple], current: dict) -> None:
+        for relative_path, parsed, records, error in results:
+            self.trials.pop(relative_path, None)
+            if error is not None:
+                self.errors[relative_path] = error
+                continue
+
+            records = np.ascontiguousarray(records, dtype=TRIAL_DTYPE)
+            f.write(records.tobytes())
+            trial_no, location_no, condition = parsed
+            self.trials[relative_path] = {
+                "signature": current[relative_path],
+                "trial_no": trial_no,
+                "location_no": location_no,
+                "condition": condition,
+                "offset": self.count,
+                "count": len(records),
+            }
+            self.count += len(records)
+
+    def compact(self) -> None:
+        """
+        Rewrite samples.bin with only the live trials, in path order.
+        """
+        tmp_path = self.samples_path.with_suffix(".tmp")
+        offset = 0
+        with tmp_path.open("wb") as f:
+            for relative_path in sorted(self.trials):
+                f.write(self.trial(relative_path).tobytes())
+                entry = self.trials[relative_path]
+                entry["offset"] = offset
+                offset += entry["count"]
+            f.flush()
+            os.fsync(f.fileno())
+        # Open maps keep reading the old file until they are dropped
+        os.replace(tmp_path, self.samples_path)
+        logging.info(
+            f"Compacted experiment store: {self.count - offset} samples reclaimed."
+        )
+        self.count = offset
+        self._samples = None
+
+    def samples(self) -> np.ndarray:
+        """
+        Read-only memory map over every stored sample, live or dead.
+        """
+        if self._samples is None:
+            if not self.count:
+                return np.empty(0, dtype=TRIAL_DTYPE)
+            self._samples = np.memmap(
+                self.samples_path, dtype=TRIAL_DTYPE, mode="r", shape=(self.count,)
+            )
+        return self._samples
+
+    def trial(self, relative_path: str) -> np.ndarray:
+        """
+        Zero-copy view of one trial's samples.
+        """
+        entry = self.trials[relative_path]
+        return self.samples()[entry["offset"] : entry["offset"] + entry["count"]]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build or update the memory-mapped store of an experiment."
+    )
+    parser.add_argument("data_directory", type=Path)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--compact", action="store_true", help="Reclaim dead samples.")
+    args = parser.parse_args(argv)
+
+    store = ExperimentStore.load(args.data_directory)
+    store.update(workers=args.workers)
+    if args.compact and store.garbage:
+        store.compact()
+        store.save()
+    for relative_path, message in sorted(store.errors.items()):
+        print(f"Skipped {relative_path}: {message}")
+    print(
+        f"{len(store.trials)} trials, {store.live} samples "
+        f"({store.live * TRIAL_DTYPE.itemsize / 2**20:.1f} MiB) in {store.directory}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from core.analysis.alignment import align_trial_files
+from core.config.setting import get_settings
+from core.hardware.connection import DeviceManager
+from core.hardware.monitor import detected_ports
+from core.logging.logger import VernierFSRLogger
+from core.logging.metrics import load_metrics
+from core.logging.multi import MultiDeviceLogger
+from core.utils.generator import filename_generator
+from core.utils.mock_data import MockSignalEngine
+
+MANIFEST_FILENAME = "manifest.json"
+# Keys of the `input_form` config, which `--config` files use as well
+CONFIG_KEYS = (
+    "directory",
+    "num_trials",
+    "num_locations",
+    "lump_options",
+    "duration",
+    "delay",
+)
+CONFIG_DEFAULTS = {
+    "num_trials": 1,
+    "num_locations": 1,
+    "lump_options": ["LUMP", "NOLUMP"],
+    "duration": 10,
+    "delay": 2,
+}
+# Settings that change what is recorded, copied into the manifest
+RECORDED_SETTINGS = (
+    "USE_MOCK",
+    "MOCK_RATE_HZ",
+    "MOCK_SEED",
+    "BAUD_RATE",
+    "SERIAL_PORT",
+    "PROTOCOL",
+    "MULTI_DEVICE",
+    "CLEAN_FORMATS",
+    "ALIGN_RATE_HZ",
+)
+
+
+def now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class Campaign:
+    """
+    Run a grid of trials from the command line, without the Streamlit UI.
+
+    Trials are named by `filename_generator` and logged one after another
+    with `VernierFSRLogger` (or `MultiDeviceLogger`), exactly as the Trials
+    page would, including alignment. Progress is written to
+    `manifest.json` in the experiment directory after every trial, so an
+    interrupted campaign can be resumed.
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        data_directory: Path,
+        pause: float = 0,
+        prompt: bool = False,
+        use_mock: bool | None = None,
+        port: str | None = None,
+    ):
+        self.config = config
+        self.settings = get_settings().model_copy()
+        if use_mock is not None:
+            self.settings.USE_MOCK = use_mock
+        if port is not None:
+            self.settings.SERIAL_PORT = port
+        self.base_dir = Path(data_directory) / config["directory"]
+        self.manifest_path = self.base_dir / MANIFEST_FILENAME
+        self.pause = pause
+        self.prompt = prompt
+        self.trials = filename_generator(
+            config["num_trials"], config["num_locations"], config["lump_options"]
+        )
+        self.results: dict[str, dict] = {}
+        self._devices: list[DeviceManager] = []
+
+    def load_manifest(self) -> None:
+        """
+        Pick up the trial results of an earlier run of this campaign.
+        """
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self.results = {entry["name"]: entry for entry in manifest.get("trials", [])}
+
+    def save_manifest(self, finished: bool = False) -> None:
+        manifest = {
+            "config": self.config,
+            "settings": {key: getattr(self.settings, key) for key in RECORDED_SETTINGS},
+            "updated": now(),
+            "finished": finished,
+            "trials": [
+                self.results[name] for name in self.trials if name in self.results
+            ],
+        }
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def pending(self) -> list[str]:
+        return [
+            name
+            for name in self.trials
+            if self.results.get(name, {}).get("status") != "done"
+        ]
+
+    def _create_logger(self):
+        settings = self.settings
+        multi = settings.MULTI_DEVICE and not settings.USE_MOCK
+        if not self._devices and not settings.USE_MOCK:
+            ports = detected_ports() if multi else [settings.SERIAL_PORT]
+            if not ports:
+                raise RuntimeError("MULTI_DEVICE is on but no Arduino was found.")
+            self._devices = [
+                DeviceManager(port=port, baud=settings.BAUD_RATE) for port in ports
+            ]
+
+        def create_device_logger(device) -> VernierFSRLogger:
+            return VernierFSRLogger(
+                use_mock=settings.USE_MOCK,
+                stream=True,
+                clean_formats=tuple(settings.CLEAN_FORMATS),
+                device=device,
+                echo=False,
+                protocol=settings.PROTOCOL,
+                mock_engine=MockSignalEngine(
+                    rate=settings.MOCK_RATE_HZ, seed=settings.MOCK_SEED
+                ),
+            )
+
+        if multi:
+            return MultiDeviceLogger([create_device_logger(d) for d in self._devices])
+        return create_device_logger(self._devices[0] if self._devices else None)
+
+    def run_trial(self, name: str) -> dict:
+        """
+        Log, save and align one trial, returning its manifest entry.
+
+        A trial cut short by Ctrl+C keeps its partial files but is recorded
+        as "interrupted", so resuming the campaign runs it again.
+        """
+        save_dir = self.base_dir / name
+        entry = {"name": name, "status": "running", "started": now()}
+        try:
+            logger = self._create_logger()
+            raw_path, clean_path = logger.run(
+                self.config["duration"],
+                start_delay=self.config["delay"],
+                save_dir=save_dir,
+                file_stem=name,
+            )
+            entry["raw"] = str(raw_path) if raw_path else None
+            entry["clean"] = str(clean_path) if clean_path else None
+            entry["status"] = "interrupted" if logger.interrupted else "done"
+        except KeyboardInterrupt:
+            entry["status"] = "interrupted"
+        except Exception as e:
+            logging.error(f"Trial {name} failed: {e}")
+            entry["status"] = "failed"
+            entry["error"] = str(e)
+        entry["finished"] = now()
+
+        if entry["status"] == "done":
+            try:
+                align_trial_files(save_dir, name, rate=self.settings.ALIGN_RATE_HZ)
+            except Exception as e:
+                logging.error(f"Aligning {name} failed: {e}")
+                entry["error"] = f"Post-processing failed: {e}"
+
+        entry["metrics"] = {}
+        for path in sorted(save_dir.glob("METRICS_*.json")):
+            metrics = load_metrics(path)
+            if metrics is not None:
+                entry["metrics"][path.stem.removeprefix("METRICS_")] = {
+                    key: metrics[key]
+                    for key in ("samples", "effective_rate_hz", "gaps", "degraded")
+                }
+        return entry
+
+    def wait_for_position(self, name: str) -> None:
+        if self.prompt:
+            input(f"Move the sensor for {name}, then press Enter to start... ")
+        elif self.pause > 0:
+            print(f"Next: {name} in {self.pause:g}s")
+            time.sleep(self.pause)
+
+    def run(self) -> bool:
+        """
+        Run every pending trial in order.
+
+        Returns:
+            bool: True if all trials of the campaign are done.
+        """
+        pending = self.pending()
+        print(f"{len(pending)} of {len(self.trials)} trials to run in {self.base_dir}")
+        try:
+            for i, name in enumerate(pending):
+                if i:
+                    self.wait_for_position(name)
+                print(
+                    f"[{i + 1}/{len(pending)}] {name}: logging {self.config['duration']}s"
+                )
+                entry = self.run_trial(name)
+                self.results[name] = entry
+                self.save_manifest()
+                samples = sum(m["samples"] for m in entry["metrics"].values())
+                print(
+                    f"[{i + 1}/{len(pending)}] {name}: {entry['status']}, {samples} samples"
+                )
+                if entry["status"] == "interrupted":
+                    raise KeyboardInterrupt
+        finally:
+            for device in self._devices:
+                device.close()
+            done = not self.pending()
+            self.save_manifest(finished=done)
+        return done
+
+
+def load_config(args: argparse.Namespace) -> dict:
+    """
+    Build an `input_form`-style config from `--config` and the flags; flags
+    win over the file, and the file over the form's defaults.
+    """
+    config = dict(CONFIG_DEFAULTS)
+    if args.config is not None:
+        config.update(json.loads(args.config.read_text(encoding="utf-8")))
+    for key in CONFIG_KEYS:
+        value = getattr(args, key)
+        if value is not None:
+            config[key] = value
+    if not str(config.get("directory", "")).strip():
+        raise ValueError("A directory name is required (--directory or --config).")
+    return {key: config[key] for key in CONFIG_KEYS}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run a grid of trials without the Streamlit UI."
+    )
+    parser.add_argument(
+        "--config", type=Path, help="JSON file with the setup form's fields."
+    )
+    parser.add_argument("--directory", help="Experiment folder name.")
+    parser.add_argument("--trials", dest="num_trials", type=int)
+    parser.add_argument("--locations", dest="num_locations", type=int)
+    parser.add_argument(
+        "--conditions",
+        dest="lump_options",
+        nargs="+",
+        choices=("LUMP", "NOLUMP"),
+    )
+    parser.add_argument("--duration", type=float, help="Seconds logged per trial.")
+    parser.add_argument("--delay", type=float, help="Start delay of each trial.")
+    parser.add_argument(
+        "--pause", type=float, default=0, help="Seconds to wait between trials."
+    )
+    parser.add_argument(
+        "--prompt",
+        action="store_true",
+        help="Wait for Enter before each trial after the first.",
+    )
+    parser.add_argument(
+        "--mock", action=argparse.BooleanOptionalAction, help="Override USE_MOCK."
+    )
+    parser.add_argument("--port", help="Serial port; overrides SERIAL_PORT.")
+    parser.add_argument(
+        "--data-directory", type=Path, help="Defaults to DATA_DIRECTORY."
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Rerun every trial instead of resuming from the manifest.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    try:
+        config = load_config(args)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    campaign = Campaign(
+        config,
+        args.data_directory or Path(get_settings().DATA_DIRECTORY),
+        pause=args.pause,
+        prompt=args.prompt,
+        use_mock=args.mock,
+        port=args.port,
+    )
+    if not args.restart:
+        campaign.load_manifest()
+    try:
+        done = campaign.run()
+    except KeyboardInterrupt:
+        print(
+            f"\nStopped. Rerun the same command to resume ({campaign.manifest_path})."
+        )
+        return 130
+    print(f"Manifest written to {campaign.manifest_path}")
+    return 0 if done else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
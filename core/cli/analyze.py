@@ -0,0 +1,65 @@
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from core.analysis.engine import analyze_archive
+from core.analysis.loader import SENSORS
+from core.config.setting import get_settings
+
+
+def main(argv: list[str] | None = None) -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Write summary, variability and heatmap reports for experiments."
+    )
+    parser.add_argument(
+        "experiments",
+        nargs="*",
+        type=Path,
+        help="Experiment directories. Defaults to every experiment under --root.",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path(settings.DATA_DIRECTORY),
+        help="Archive to scan, and where analysis_summary.json goes without "
+        "--output; defaults to DATA_DIRECTORY.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write reports to OUTPUT/<experiment>/ instead of <experiment>/report/.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Processes; 0 uses one per CPU."
+    )
+    parser.add_argument("--sensors", nargs="+", choices=SENSORS, default=list(SENSORS))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    options = dict(
+        sensors=tuple(args.sensors),
+        vmin=settings.HEATMAP_VMIN,
+        vmax=settings.HEATMAP_VMAX,
+    )
+    if not args.experiments and not args.root.is_dir():
+        parser.error(f"{args.root} is not a directory.")
+    outcomes = analyze_archive(
+        args.root,
+        args.output,
+        args.workers,
+        experiments=args.experiments or None,
+        **options,
+    )
+
+    for outcome in outcomes:
+        detail = outcome.get("error") or f"{outcome['trials']} trials"
+        print(f"{outcome['status']:6}  {outcome['experiment']}  ({detail})")
+    return 1 if any(o["status"] != "done" for o in outcomes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
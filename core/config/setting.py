@@ -1,11 +1,32 @@
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
 class Settings(BaseModel):
     DATA_DIRECTORY: str = Field()
     ALTERNATIVE_LIMIT: int = Field()
+    CLEAN_FORMATS: list[str] = Field(default=["csv", "npy"])
+    LOADER_WORKERS: int = Field(default=0, ge=0)
+    LOADER_EXECUTOR: Literal["thread", "process"] = Field(default="thread")
+    LIVE_CHART_FPS: float = Field(default=4.0, gt=0)
+    LIVE_CHART_POINTS: int = Field(default=400, ge=1)
+    USE_MOCK: bool = Field(default=True)
+    MOCK_RATE_HZ: float = Field(default=1000.0, gt=0, le=50000)
+    MOCK_SEED: int = Field(default=0)
+    BAUD_RATE: int = Field(default=9600, gt=0)
+    SERIAL_PORT: str | None = Field(default=None)
+    PROTOCOL: Literal["ascii", "binary"] = Field(default="ascii")
+    MULTI_DEVICE: bool = Field(default=False)
+    ALIGN_RATE_HZ: float = Field(default=100.0, gt=0)
+    EXPERIMENT_STORE: bool = Field(default=False)
+    PREVIEW_POINTS: int = Field(default=1000, ge=3)
+    PREVIEW_PAGE_SIZE: int = Field(default=500, ge=1)
+    HEATMAP_VMIN: float = Field(default=0.0)
+    HEATMAP_VMAX: float = Field(default=60000.0)
+    HEATMAP_INTERACTIVE: bool = Field(default=False)
 
     @classmethod
     def from_json_file(cls, json_path: Path) -> "Settings":
@@ -27,4 +48,23 @@ class Settings(BaseModel):
         return cls(**data)
 
 
-settings = Settings.from_json_file(Path("settings.json"))
+SETTINGS_PATH = Path("settings.json")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load `settings.json` on first use and reuse it afterwards.
+
+    Returns:
+        Settings: The cached application settings.
+    """
+    return Settings.from_json_file(SETTINGS_PATH)
+
+
+def __getattr__(name: str):
+    # `from core.config.setting import settings` keeps working, but the file
+    # is only read when `settings` is first requested.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
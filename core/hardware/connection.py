@@ -0,0 +1,144 @@
+import logging
+import threading
+import time
+
+import serial
+
+from core.hardware.detector import find_arduino_ports
+from core.hardware.monitor import detected_ports
+
+RESET_DELAY = 2.0
+
+
+class DeviceManager:
+    """
+    Session-scoped owner of the Arduino serial connection.
+
+    The port is opened once and kept open across trials, so the board only
+    goes through its auto-reset (and the `reset_delay` wait) on the first
+    connect or after a reconnect. Trials are started and stopped with the
+    firmware's `s`/`e` commands on the same connection.
+    """
+
+    def __init__(
+        self,
+        port: str | None = None,
+        baud: int = 9600,
+        timeout: float = 1.0,
+        reset_delay: float = RESET_DELAY,
+        reconnect_attempts: int = 3,
+    ):
+        self._port = port
+        self.baud = baud
+        self.timeout = timeout
+        self.reset_delay = reset_delay
+        self.reconnect_attempts = reconnect_attempts
+        self._serial: serial.SerialBase | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def port(self) -> str:
+        """
+        The device port, looked up in the port monitor's cache on first access.
+        """
+        if self._port is None:
+            ports = find_arduino_ports(detected_ports())
+            self._port = ports if isinstance(ports, str) else ports[0]
+        return self._port
+
+    @property
+    def is_open(self) -> bool:
+        return self._serial is not None and self._serial.is_open
+
+    def connect(self) -> serial.SerialBase:
+        """
+        Return the open connection, opening it (and waiting for the board
+        reset) only if it is not open yet.
+        """
+        with self._lock:
+            if self.is_open:
+                return self._serial
+
+            logging.info(f"Opening serial port {self.port} @ {self.baud} baud")
+            self._serial = serial.serial_for_url(
+                self.port, baudrate=self.baud, timeout=self.timeout
+            )
+            if self.reset_delay > 0:
+                time.sleep(self.reset_delay)
+            self._serial.reset_input_buffer()
+            return self._serial
+
+    def reconnect(self) -> serial.SerialBase:
+        """
+        Close and reopen the port, retrying with a growing back-off.
+
+        Raises:
+            serial.SerialException: if every attempt fails.
+        """
+        with self._lock:
+            self.close()
+            for attempt in range(1, self.reconnect_attempts + 1):
+                try:
+                    return self.connect()
+                except serial.SerialException as e:
+                    logging.warning(
+                        f"Reconnect to {self.port} failed "
+                        f"({attempt}/{self.reconnect_attempts}): {e}"
+                    )
+                    if attempt == self.reconnect_attempts:
+                        raise
+                    time.sleep(0.5 * attempt)
+
+    def write(self, data: bytes) -> None:
+        """
+        Send a command, reconnecting once if the port has gone away.
+        """
+        with self._lock:
+            try:
+                self.connect().write(data)
+            except serial.SerialException as e:
+                logging.warning(f"Serial write failed, reconnecting: {e}")
+                self.reconnect().write(data)
+
+    def prepare(self) -> None:
+        """
+        Discard bytes left over from a previous trial.
+        """
+        with self._lock:
+            self.connect().reset_input_buffer()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._serial is not None:
+                try:
+                    self._serial.close()
+                except serial.SerialException as e:
+                    logging.warning(f"Error closing {self._port}: {e}")
+                self._serial = None
+
+
+def sync_devices(
+    devices: dict[str, DeviceManager], ports: list[str], baud: int = 9600
+) -> list[DeviceManager]:
+    """
+    Match a set of open devices to the currently detected ports.
+
+    Boards that were plugged in get a new manager, unplugged ones are closed
+    and dropped, and boards that stayed keep their warm connection.
+
+    Args:
+        devices (dict[str, DeviceManager]): Managers by port, updated in place.
+        ports (list[str]): Ports detected now, e.g. `detected_ports()`.
+        baud (int): Baud rate for new managers.
+
+    Returns:
+        list[DeviceManager]: One manager per port, sorted by port so each
+        board keeps its `_DEV<n>` number.
+    """
+    for port in set(devices) - set(ports):
+        logging.info(f"Releasing unplugged device {port}")
+        devices.pop(port).close()
+    for port in ports:
+        if port not in devices:
+            devices[port] = DeviceManager(port=port, baud=baud)
+    return [devices[port] for port in sorted(ports)]
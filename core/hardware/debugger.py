@@ -1,9 +1,10 @@
-from core.hardware.detector import find_arduino_ports
+from core.hardware.detector import list_arduino_ports
 import serial.tools.list_ports
 
 
 def debug_serial_ports():
-    ports = serial.tools.list_ports.comports()
+    # Enumerate once and reuse the result for the Arduino check below
+    ports = list(serial.tools.list_ports.comports())
 
     if not ports:
         print("No serial ports detected on the system.")
@@ -27,7 +28,7 @@ def debug_serial_ports():
         )
         print("-" * 70)
 
-    arduino_ports = find_arduino_ports()
+    arduino_ports = list_arduino_ports(ports)
     if arduino_ports:
         print("\nDetected Arduino/Teensy-Compatible Devices:")
         for p in arduino_ports:
@@ -1,6 +1,7 @@
 import sys
 import serial.tools.list_ports
-from typing import Union, List
+from serial.tools.list_ports_common import ListPortInfo
+from typing import Optional, Union, List
 
 
 class ArduinoNotFoundError(Exception):
@@ -17,22 +18,22 @@ class MultipleArduinoPortsFoundError(Exception):
         self.ports = ports
 
 
-def find_arduino_ports() -> Union[str, List[str]]:
+def list_arduino_ports(ports: Optional[List[ListPortInfo]] = None) -> List[str]:
     """
-    Scan the system's serial ports and identify Arduino devices.
+    Scan the system's serial ports and return every Arduino-like device.
 
     Uses USB vendor/product IDs, device descriptions, and platform-specific
     naming conventions to detect Arduino ports.
 
-    Raises:
-        ArduinoNotFoundError: if no Arduino devices are found.
-        MultipleArduinoPortsFoundError: if more than one Arduino is found.
+    Args:
+        ports: Already enumerated ports; scanned with `comports()` if None.
+
     Returns:
-        - A single port name (str) if exactly one Arduino device is found.
-        - A list of port names (List[str]) if multiple Arduino devices are found.
+        List[str]: Port names, possibly empty.
     """
     arduino_ports: List[str] = []
-    ports = list(serial.tools.list_ports.comports())
+    if ports is None:
+        ports = list(serial.tools.list_ports.comports())
 
     arduino_vid_pid = [
         (0x2341, 0x0043),  # Uno
@@ -69,6 +70,29 @@ def find_arduino_ports() -> Union[str, List[str]]:
         elif sys.platform.startswith("win") and "arduino" in desc:
             arduino_ports.append(nm)
 
+    return arduino_ports
+
+
+def find_arduino_ports(
+    arduino_ports: Optional[List[str]] = None,
+) -> Union[str, List[str]]:
+    """
+    Identify the single Arduino device used for logging.
+
+    Args:
+        arduino_ports: Cached result of `list_arduino_ports`, e.g. from the
+            port monitor; the ports are scanned if None.
+
+    Raises:
+        ArduinoNotFoundError: if no Arduino devices are found.
+    Returns:
+        - A single port name (str) if exactly one Arduino device is found.
+        - "mock" if multiple Arduino devices are found; use
+          `list_arduino_ports` to log from all of them.
+    """
+    if arduino_ports is None:
+        arduino_ports = list_arduino_ports()
+
     if not arduino_ports:
         raise ArduinoNotFoundError()
     if len(arduino_ports) > 1:
@@ -0,0 +1,215 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from core.hardware.detector import list_arduino_ports
+
+try:
+    import pyudev
+except ImportError:  # Optional, Linux only; falls back to timed rescans
+    pyudev = None
+
+RESCAN_INTERVAL = 2.0
+SYSFS_TTY = "/sys/class/tty"
+
+
+@dataclass(frozen=True)
+class PortEvent:
+    kind: str  # "added" or "removed"
+    port: str
+    at: float = field(default_factory=time.time)
+
+
+def device_fingerprint() -> frozenset[str] | None:
+    """
+    Cheap listing of serial device nodes, used to skip full rescans when
+    nothing was plugged in or out. None if the platform has no such listing.
+    """
+    if os.path.isdir(SYSFS_TTY):
+        return frozenset(os.listdir(SYSFS_TTY))
+    if sys.platform.startswith("darwin"):
+        return frozenset(name for name in os.listdir("/dev") if name.startswith("cu."))
+    return None
+
+
+class PortMonitor:
+    """
+    Process-wide cache of detected Arduino ports, kept current in the
+    background so callers never pay for a port scan.
+
+    On Linux with `pyudev` installed, tty add/remove notifications trigger a
+    rescan. Otherwise a thread re-checks every `rescan_interval` seconds and
+    only runs the full `comports()` scan when `device_fingerprint()` changed
+    (or on every check where no fingerprint is available).
+
+    Added/removed ports are published to `subscribe()` callbacks and kept in
+    `events` for the UI. The initial scan does not produce events.
+    """
+
+    def __init__(
+        self,
+        rescan_interval: float = RESCAN_INTERVAL,
+        scan: Callable[[], list[str]] = list_arduino_ports,
+        fingerprint: Callable[[], object] | None = device_fingerprint,
+        use_udev: bool = True,
+        history: int = 50,
+    ):
+        self.rescan_interval = rescan_interval
+        self._scan = scan
+        self._fingerprint = fingerprint
+        self.use_udev = (
+            use_udev and pyudev is not None and sys.platform.startswith("linux")
+        )
+        self.events: deque[PortEvent] = deque(maxlen=history)
+        self.last_scan: float | None = None
+        self._ports: list[str] = []
+        self._listeners: list[Callable[[PortEvent], None]] = []
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._observer = None
+
+    @property
+    def ports(self) -> list[str]:
+        """Arduino ports found by the latest scan, sorted."""
+        with self._lock:
+            return list(self._ports)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def running(self) -> bool:
+        return self._observer is not None or (
+            self._thread is not None and self._thread.is_alive()
+        )
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until the first scan has finished.
+        """
+        return self._ready.wait(timeout)
+
+    def subscribe(self, callback: Callable[[PortEvent], None]) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+
+    def recent_events(self) -> list[PortEvent]:
+        with self._lock:
+            return list(self.events)
+
+    def refresh(self) -> list[PortEvent]:
+        """
+        Rescan now and publish any added/removed ports.
+
+        Returns:
+            list[PortEvent]: The changes found by this scan.
+        """
+        try:
+            ports = sorted(self._scan())
+        except Exception as e:
+            logging.warning(f"Serial port scan failed: {e}")
+            self._ready.set()
+            return []
+
+        with self._lock:
+            old = set(self._ports)
+            events = []
+            if self._ready.is_set():
+                events = [PortEvent("removed", p) for p in sorted(old - set(ports))]
+                events += [PortEvent("added", p) for p in ports if p not in old]
+            self._ports = ports
+            self.last_scan = time.time()
+            self.events.extend(events)
+            listeners = list(self._listeners)
+        self._ready.set()
+
+        for event in events:
+            logging.info(f"Serial device {event.kind}: {event.port}")
+            for callback in listeners:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logging.error(f"Port event listener failed: {e}", exc_info=True)
+        return events
+
+    def start(self) -> "PortMonitor":
+        """
+        Start monitoring in the background; the first scan runs on the
+        monitor thread, so this returns immediately.
+        """
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=self.rescan_interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        last = self._fingerprint() if self._fingerprint else None
+        self.refresh()
+        if self.use_udev and self._start_udev():
+            return
+
+        while not self._stop.wait(self.rescan_interval):
+            if self._fingerprint is not None:
+                current = self._fingerprint()
+                if current is not None and current == last:
+                    continue
+                last = current
+            self.refresh()
+
+    def _start_udev(self) -> bool:
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem="tty")
+            self._observer = pyudev.MonitorObserver(
+                monitor, callback=lambda device: self.refresh(), daemon=True
+            )
+            self._observer.start()
+        except Exception as e:
+            logging.warning(f"udev monitoring unavailable, polling instead: {e}")
+            self._observer = None
+            return False
+        logging.info("Watching udev for serial device changes.")
+        return True
+
+
+_monitor: PortMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_monitor() -> PortMonitor:
+    """
+    Return the shared port monitor, starting it on first use.
+    """
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = PortMonitor().start()
+        return _monitor
+
+
+def detected_ports(timeout: float = 5.0) -> list[str]:
+    """
+    Cached Arduino ports, waiting for the first scan if it is still running.
+    """
+    monitor = get_monitor()
+    monitor.wait_ready(timeout)
+    return monitor.ports
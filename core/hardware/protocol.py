@@ -0,0 +1,101 @@
+import numpy as np
+
+from core.utils.storage import TRIAL_DTYPE
+
+# Binary frame sent by the firmware after the `b` start command:
+#   sync (0xA5) | device time in ms (uint32) | A | B | C | D (uint16) | checksum
+# All fields are little-endian; the checksum is the sum of the 12 payload
+# bytes modulo 256.
+SYNC = 0xA5
+FRAME_DTYPE = np.dtype(
+    [
+        ("sync", "u1"),
+        ("time_ms", "<u4"),
+        ("A", "<u2"),
+        ("B", "<u2"),
+        ("C", "<u2"),
+        ("D", "<u2"),
+        ("checksum", "u1"),
+    ]
+)
+FRAME_SIZE = FRAME_DTYPE.itemsize
+START_COMMANDS = {"ascii": b"s", "binary": b"b"}
+PROTOCOLS = tuple(START_COMMANDS)
+
+
+def encode_frames(records: np.ndarray) -> bytes:
+    """
+    Encode TRIAL_DTYPE records as binary frames (used by simulators and tests).
+    """
+    frames = np.zeros(len(records), dtype=FRAME_DTYPE)
+    frames["sync"] = SYNC
+    frames["time_ms"] = np.round(records["Time(s)"].astype(np.float64) * 1000)
+    for name in ("A", "B", "C", "D"):
+        frames[name] = records[name]
+    raw = frames.view(np.uint8).reshape(-1, FRAME_SIZE)
+    frames["checksum"] = raw[:, 1:-1].sum(axis=1, dtype=np.uint32) & 0xFF
+    return frames.tobytes()
+
+
+def decode_frames(buffer: bytes | bytearray) -> tuple[np.ndarray, int, int]:
+    """
+    Decode all complete frames at the start of `buffer`.
+
+    Runs of valid frames are validated and converted in bulk; on a bad sync
+    byte or checksum the decoder skips ahead to the next sync byte.
+
+    Args:
+        buffer: Bytes received so far.
+
+    Returns:
+        (records, consumed, dropped): TRIAL_DTYPE records, the number of
+        bytes consumed from the front of the buffer, and the number of bytes
+        discarded while resynchronising.
+    """
+    chunks, pos, dropped = [], 0, 0
+    while len(buffer) - pos >= FRAME_SIZE:
+        if buffer[pos] != SYNC:
+            nxt = buffer.find(SYNC, pos + 1)
+            if nxt < 0:
+                nxt = len(buffer)
+            dropped += nxt - pos
+            pos = nxt
+            continue
+
+        count = (len(buffer) - pos) // FRAME_SIZE
+        raw = np.frombuffer(buffer, np.uint8, count * FRAME_SIZE, pos)
+        raw = raw.reshape(count, FRAME_SIZE)
+        valid = (raw[:, 0] == SYNC) & (
+            (raw[:, 1:-1].sum(axis=1, dtype=np.uint32) & 0xFF) == raw[:, -1]
+        )
+        good = count if valid.all() else int(np.argmin(valid))
+        if good:
+            chunks.append(_to_records(raw[:good].copy().view(FRAME_DTYPE)[:, 0]))
+        pos += good * FRAME_SIZE
+        del raw
+        if good < count:
+            # Skip the bad frame's sync byte and search for the next one
+            pos += 1
+            dropped += 1
+
+    if not chunks:
+        return np.empty(0, dtype=TRIAL_DTYPE), pos, dropped
+    return np.concatenate(chunks), pos, dropped
+
+
+def _to_records(frames: np.ndarray) -> np.ndarray:
+    records = np.empty(len(frames), dtype=TRIAL_DTYPE)
+    records["Time(s)"] = frames["time_ms"] / 1000
+    for name in ("A", "B", "C", "D"):
+        records[name] = frames[name]
+    return records
+
+
+def format_rows(records: np.ndarray, decimals: int = 3) -> list[tuple[str, ...]]:
+    """
+    Render records as CLEAN row strings, matching the ASCII line format.
+    """
+    return [
+        (f"{t:.{decimals}f}", str(a), str(b), str(c), str(d))
+        for t, a, b, c, d in records.tolist()
+    ]
@@ -0,0 +1,160 @@
+import argparse
+import logging
+import os
+import select
+import threading
+import time
+import tty
+
+from core.hardware.protocol import encode_frames, format_rows
+from core.utils.mock_data import MockSignalEngine
+
+TICK = 0.005
+
+
+class SerialSimulator:
+    """
+    Virtual Arduino on a pseudo-terminal, for testing the real serial path.
+
+    The simulator owns both ends of a pty and exposes the device end as
+    `port`, which can be opened like a real board (`DeviceManager(port=...)`
+    or `VernierFSRLogger(port=...)`). It emulates the firmware commands:
+    `s` starts ASCII lines, `b` starts binary frames and `e` stops. Samples
+    come from a `MockSignalEngine` at `rate` Hz; with `baud` set, output is
+    throttled to `baud / 10` bytes per second like a real UART, which lowers
+    the effective sample rate when the link is saturated.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1000.0,
+        baud: int | None = None,
+        engine: MockSignalEngine | None = None,
+    ):
+        if not hasattr(os, "openpty"):
+            raise OSError("SerialSimulator needs a POSIX pseudo-terminal.")
+        self.engine = engine or MockSignalEngine(rate=rate)
+        self.baud = baud
+        self.mode: str | None = None
+        self.bytes_sent = 0
+        self._master: int | None = None
+        self._slave: int | None = None
+        self._pending = bytearray()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.port: str | None = None
+
+    @property
+    def rate(self) -> float:
+        return self.engine.rate
+
+    def start(self) -> "SerialSimulator":
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self.port = os.ttyname(self._slave)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logging.info(f"Serial simulator listening on {self.port} at {self.rate:g} Hz")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self) -> "SerialSimulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        started = budget_start = None
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._master], [], [], TICK)
+            if readable:
+                self._handle_commands()
+
+            now = time.perf_counter()
+            if self.mode is None:
+                started = None
+                continue
+            if started is None:
+                started = now - self.engine.emitted / self.rate
+                budget_start = (
+                    now - self.bytes_sent * 10 / self.baud if self.baud else None
+                )
+
+            due = int((now - started) * self.rate) - self.engine.emitted
+            if due > 0 and len(self._pending) < 1 << 16:
+                self._pending += self._encode(self.engine.block(due))
+            self._flush(now, budget_start)
+
+    def _handle_commands(self) -> None:
+        try:
+            commands = os.read(self._master, 1024)
+        except (BlockingIOError, OSError):
+            return
+        for command in commands:
+            if command == ord("s"):
+                self.mode = "ascii"
+            elif command == ord("b"):
+                self.mode = "binary"
+            elif command == ord("e"):
+                self.mode = None
+                self._pending.clear()
+
+    def _encode(self, records) -> bytes:
+        if self.mode == "binary":
+            return encode_frames(records)
+        lines = [" | ".join(row) for row in format_rows(records)]
+        return ("\n".join(lines) + "\n").encode()
+
+    def _flush(self, now: float, budget_start: float | None) -> None:
+        size = len(self._pending)
+        if budget_start is not None:
+            size = min(
+                size, int((now - budget_start) * self.baud / 10) - self.bytes_sent
+            )
+        if size <= 0:
+            return
+        try:
+            written = os.write(self._master, self._pending[:size])
+        except BlockingIOError:
+            return
+        del self._pending[:written]
+        self.bytes_sent += written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Emulate the sensor Arduino on a pseudo-terminal."
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="Samples per second."
+    )
+    parser.add_argument(
+        "--baud", type=int, default=None, help="Throttle to a baud rate."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = MockSignalEngine(rate=args.rate, seed=args.seed)
+    with SerialSimulator(baud=args.baud, engine=engine) as simulator:
+        print(f"Simulated Arduino on {simulator.port} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
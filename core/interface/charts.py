@@ -1,27 +1,147 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import re
 import logging
 
+from core.analysis.alignment import (
+    align_experiment,
+    average_aligned,
+    find_aligned_files,
+)
+from core.analysis.engine import ExperimentReport, analyze_experiment
+from core.analysis.heatmap import Panels, heatmap_png, heatmap_spec
+from core.analysis.index import ExperimentIndex
+from core.analysis.loader import (
+    SENSORS,
+    Signature,
+    file_signature,
+)
+from core.analysis.preview import downsample, page_count, paginate, trial_overview
+from core.analysis.store import ExperimentStore
+from core.config.setting import settings
+from core.utils.storage import find_clean_files, load_trial
+
 # Setup basic logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
 
+@st.cache_data(show_spinner="Updating analysis index...")
+def load_report(data_directory: str, signature: Signature) -> ExperimentReport:
+    """
+    Cached `analyze_experiment`: updates the experiment's analysis index,
+    reading only trials whose files changed, and summarizes it.
+    """
+    return analyze_experiment(
+        Path(data_directory),
+        [Path(path) for path, _, _ in signature],
+        workers=settings.LOADER_WORKERS,
+        executor=settings.LOADER_EXECUTOR,
+    )
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_heatmaps(panels: Panels, vmin: float, vmax: float) -> bytes:
+    """
+    Cached `heatmap_png`, keyed on the quadrant values and colour range, so
+    reruns with an unchanged summary do not draw again.
+    """
+    return heatmap_png(panels, vmin, vmax)
+
+
+@st.cache_data(show_spinner="Averaging aligned trials...")
+def load_aligned_average(signature: Signature, sensor: str):
+    """
+    Cached `average_aligned` over the experiment's ALIGNED_* files.
+    """
+    return average_aligned([Path(path) for path, _, _ in signature], sensor)
+
+
+@st.cache_data(show_spinner=False)
+def load_trial_overview(data_directory: str, signature: Signature):
+    """
+    Per-trial summary rows from the (already updated) analysis index.
+    """
+    return trial_overview(ExperimentIndex.load(Path(data_directory)).trials)
+
+
+@st.cache_resource(max_entries=1, show_spinner="Updating experiment store...")
+def load_store(data_directory: str, signature: Signature) -> ExperimentStore:
+    """
+    Bring the experiment's memory-mapped store up to date and keep it open.
+    """
+    store = ExperimentStore.load(Path(data_directory))
+    store.update(
+        [Path(path) for path, _, _ in signature],
+        workers=settings.LOADER_WORKERS,
+        executor=settings.LOADER_EXECUTOR,
+    )
+    return store
+
+
+@st.cache_resource(max_entries=4, show_spinner="Opening trial...")
+def open_trial_file(path: str, mtime_ns: int, size: int):
+    """
+    Keep the previewed trial open across reruns; .npy trials stay
+    memory-mapped, so paging only touches the rows shown.
+    """
+    return load_trial(path)
+
+
+def open_trial(data_directory: str, relative_path: str, signature: Signature):
+    """
+    One trial's samples: a zero-copy slice of the experiment store when
+    EXPERIMENT_STORE is enabled, otherwise the CLEAN file itself.
+    """
+    if settings.EXPERIMENT_STORE:
+        store = load_store(data_directory, signature)
+        if relative_path in store.trials:
+            return store.trial(relative_path)
+    path = Path(data_directory) / relative_path
+    stat = path.stat()
+    return open_trial_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def load_trial_chart(
+    data_directory: str, relative_path: str, signature: Signature, points: int
+):
+    return downsample(open_trial(data_directory, relative_path, signature), points)
+
+
+def show_preview(data_directory: Path, signature: Signature):
+    overview = load_trial_overview(str(data_directory), signature)
+    if overview.empty:
+        st.write("No trials to preview.")
+        return
+    st.dataframe(overview, hide_index=True)
+
+    relative_path = st.selectbox("Trial", overview["file"], key="preview_trial")
+    key = (str(data_directory), relative_path, signature)
+
+    chart_tab, samples_tab = st.tabs(["Chart", "Samples"])
+    with chart_tab:
+        st.line_chart(load_trial_chart(*key, settings.PREVIEW_POINTS))
+        st.caption(
+            f"Downsampled to about {settings.PREVIEW_POINTS} points per sensor; "
+            "peaks and each sensor's minimum and maximum are kept."
+        )
+    with samples_tab:
+        records = open_trial(*key)
+        pages = page_count(len(records), settings.PREVIEW_PAGE_SIZE)
+        page = st.number_input(f"Page (of {pages})", 1, pages, 1, key="preview_page")
+        st.dataframe(paginate(records, page, settings.PREVIEW_PAGE_SIZE))
+
+
 def display_charts(data_directory: Path):
     st.title("Analysis")
     st.markdown("Analyzing quadrant sensor values from CLEAN FSR logs.")
 
-    logging.info(f"Searching for CLEAN_*.csv files in: {data_directory.resolve()}")
-    csv_files = list(data_directory.rglob("CLEAN_*.csv"))
+    csv_files = find_clean_files(data_directory)
 
     if not csv_files:
-        st.warning(f"No CLEAN_*.csv files found in {data_directory.resolve()}.")
+        st.warning(f"No CLEAN_* files found in {data_directory.resolve()}.")
         logging.warning(f"No files found in {data_directory.resolve()}.")
         return
 
@@ -29,141 +149,42 @@ def display_charts(data_directory: Path):
     with st.expander("Detected clean files", expanded=False):
         st.subheader("Detected Clean Files")
         for f in csv_files:
-            st.write(f"- `{f.relative_to(data_directory)}` (Exists: {f.exists()})")
-
-    all_dfs = []
-    pattern = r"^CLEAN_TRIAL_(\d+)_LOC_(\d+)_(LUMP|NOLUMP)\.csv$"  # <-- single backslash, anchored
-    logging.info(f"Using regex pattern: {pattern}")
-
-    for file_path in csv_files:
-        relative_path = file_path.relative_to(data_directory)
-        logging.info(f"Processing file: {relative_path}")
-        logging.info(f"Full path: {file_path.resolve()}")
-        logging.info(f"File exists: {file_path.exists()}")
-        logging.info(f"Filename being matched: {file_path.name}")
-
-        match = re.match(pattern, file_path.name)
-        if not match:
-            st.error(f"Regex mismatch for: `{relative_path}`")
-            logging.error(f"Regex did not match for filename: {file_path.name}")
-            continue
-
-        logging.info(f"Regex matched for {file_path.name}! Groups: {match.groups()}")
-
-        try:
-            df = pd.read_csv(file_path)
-            if "Time(s)" not in df.columns or "D" not in df.columns:
-                st.warning(
-                    f"Required columns ('Time(s)', 'D') not found in `{relative_path}`."
-                )
-                continue
-
-            processed_df = df[["Time(s)", "D"]].copy()
-            processed_df["source_file"] = str(relative_path)
-
-            trial_num, loc, condition = match.groups()
-            processed_df["trial_no"] = int(trial_num)
-            processed_df["location_no"] = int(loc)
-            processed_df["condition"] = condition
-
-            all_dfs.append(processed_df)
-        except Exception as e:
-            st.error(f"Failed to parse or process {relative_path}: {e}")
-            logging.error(f"Error processing {file_path.name}: {e}", exc_info=True)
+            st.write(f"- `{f.relative_to(data_directory)}`")
+
+    signature = file_signature(csv_files)
+    report = load_report(str(data_directory), signature)
+    summary = report.summary
+    for relative_path, message in report.errors:
+        st.error(f"{message}: `{relative_path}`")
 
     with st.expander("Data set preview", expanded=False):
         st.subheader("DataSet")
-        if all_dfs:
-            concatenated_df = pd.concat(all_dfs, ignore_index=True)
-            cols = [
-                "source_file",
-                "trial_no",
-                "location_no",
-                "condition",
-                "Time(s)",
-                "D",
-            ]
-            st.dataframe(concatenated_df[cols])
-        else:
-            st.write("No data to display in DataFrame.")
+        show_preview(data_directory, signature)
 
     # --- Analysis Section ---
     st.subheader("Analysis & Visualizations")
-    data = {}
-    for file_path in csv_files:
-        relative_path = file_path.relative_to(data_directory)
-        match = re.search(pattern, file_path.name)
-        if not match:
-            # This should be consistent with the error above
-            continue
-
-        try:
-            trial_num, loc, condition = match.groups()
-            quadrant = f"Q{loc}"
-            key = (condition, quadrant)
-            df = pd.read_csv(file_path)
-            if "D" not in df.columns:
-                continue
-            values = df["D"].astype(float)
-            data.setdefault(key, []).append(values)
-        except Exception:
-            # Errors are already logged above, so we can be brief here
-            st.warning(f"Skipping {relative_path} for analysis due to read error.")
-
-    if not data:
+    if summary.empty:
         st.warning("No data was successfully parsed for analysis.")
         return
 
     # === STEP 3: Summary Stats ===
-    summary = {"LUMP": {}, "NOLUMP": {}}
-    for (condition, quadrant), trials in data.items():
-        if not trials:
-            continue
-        combined = pd.concat(trials, axis=1)
-        summary[condition][quadrant] = {
-            "avg": round(combined.mean(axis=1).mean(), 1),
-            "median": round(combined.median(axis=1).median(), 1),
-            "std": round(combined.stack().std(), 1),
-        }
+    sensor = st.selectbox("Sensor", SENSORS, index=SENSORS.index("D"))
 
     # === STEP 4: Summary Table ===
-    st.subheader("Summary Statistics (Sensor D)")
-    rows = []
-    for condition in ["LUMP", "NOLUMP"]:
-        for metric in ["avg", "median", "std"]:
-            row = {"Condition": condition, "Metric": metric}
-            for q in ["Q1", "Q2", "Q3", "Q4"]:
-                row[q] = summary.get(condition, {}).get(q, {}).get(metric, np.nan)
-            rows.append(row)
-    st.dataframe(pd.DataFrame(rows))
+    st.subheader(f"Summary Statistics (Sensor {sensor})")
+    st.dataframe(report.table(sensor))
 
     # === STEP 5: Variability Metrics ===
-    def compute_metrics(summary_dict):
-        quad_avgs = [
-            summary_dict.get(q, {}).get("avg", np.nan) for q in ["Q1", "Q2", "Q3", "Q4"]
-        ]
-        quad_arr = np.array(quad_avgs)
-        quad_arr_clean = quad_arr[~np.isnan(quad_arr)]
-        if len(quad_arr_clean) >= 2:
-            q_mean = np.mean(quad_arr_clean)
-            q_std = np.std(quad_arr_clean)
-            q_range = np.max(quad_arr_clean) - np.min(quad_arr_clean)
-            q_cv = (q_std / q_mean) * 100 if q_mean != 0 else np.nan
-            return q_range, q_std, q_cv
-        return np.nan, np.nan, np.nan
-
     st.subheader("Intra-Quadrant Variability Comparison")
 
-    # Build summary table
     variability_rows = []
-    for cond in ["LUMP", "NOLUMP"]:
-        r, s, c = compute_metrics(summary.get(cond, {}))
+    for row in report.variability(sensor).itertuples():
         variability_rows.append(
             {
-                "Condition": cond,
-                "Range (Max - Min)": f"{r:.1f}",
-                "Standard Deviation": f"{s:.1f}",
-                "Coefficient of Variation (CV)": f"{c:.2f} %",
+                "Condition": row.condition,
+                "Range (Max - Min)": f"{row.range:.1f}",
+                "Standard Deviation": f"{row.std:.1f}",
+                "Coefficient of Variation (CV)": f"{row.cv:.2f} %",
             }
         )
 
@@ -171,42 +192,32 @@ def display_charts(data_directory: Path):
     st.table(pd.DataFrame(variability_rows))
 
     # === STEP 6: Heatmaps ===
-    def grid(data_dict):
-        return np.array(
-            [
-                [data_dict.get("Q2", np.nan), data_dict.get("Q1", np.nan)],
-                [data_dict.get("Q3", np.nan), data_dict.get("Q4", np.nan)],
-            ]
-        )
-
-    vmin = 0
-    vmax = 60000
-    fig, axs = plt.subplots(1, 2, figsize=(14, 6))
-
-    for i, cond in enumerate(["LUMP", "NOLUMP"]):
-        avg_dict = {
-            q: summary[cond].get(q, {}).get("avg", np.nan)
-            for q in ["Q1", "Q2", "Q3", "Q4"]
-        }
-        data_grid = grid(avg_dict)
-        labels = np.array(
-            [
-                [f"Q2\n{data_grid[0,0]:.1f}", f"Q1\n{data_grid[0,1]:.1f}"],
-                [f"Q3\n{data_grid[1,0]:.1f}", f"Q4\n{data_grid[1,1]:.1f}"],
-            ]
-        )
-        sns.heatmap(
-            data_grid,
-            annot=labels,
-            fmt="",
-            cmap="YlOrRd",
-            vmin=vmin,
-            vmax=vmax,
-            xticklabels=False,
-            yticklabels=False,
-            cbar=True,
-            ax=axs[i],
-        )
-        axs[i].set_title(f"{cond} - Sensor D")
+    panels = report.panels(sensor)
+    vmin, vmax = settings.HEATMAP_VMIN, settings.HEATMAP_VMAX
+    if st.toggle(
+        "Interactive heatmaps",
+        value=settings.HEATMAP_INTERACTIVE,
+        key="interactive_heatmaps",
+    ):
+        st.vega_lite_chart(heatmap_spec(panels, vmin, vmax), use_container_width=True)
+    else:
+        st.image(render_heatmaps(panels, vmin, vmax))
+
+    # === STEP 7: Aligned Average ===
+    st.subheader(f"Aligned Average Over Time (Sensor {sensor})")
+    aligned_files = find_aligned_files(data_directory)
+    if st.button("Align new trials"):
+        with st.spinner("Aligning trials..."):
+            align_experiment(data_directory, rate=settings.ALIGN_RATE_HZ)
+        aligned_files = find_aligned_files(data_directory)
+
+    if not aligned_files:
+        st.info("No aligned trials yet. Click **Align new trials** to create them.")
+        return
 
-    st.pyplot(fig)
+    average = load_aligned_average(file_signature(aligned_files), sensor)
+    st.caption(
+        f"Mean of {len(aligned_files)} trials per condition and quadrant, "
+        f"resampled to {settings.ALIGN_RATE_HZ:g} Hz on the host clock."
+    )
+    st.line_chart(average)
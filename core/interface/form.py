@@ -1,4 +1,34 @@
 import streamlit as st
+from core.config.setting import get_settings
+from core.hardware.monitor import RESCAN_INTERVAL, get_monitor
+
+
+@st.fragment(run_every=RESCAN_INTERVAL)
+def device_status():
+    """
+    Show the detected Arduinos from the port monitor's cache and toast
+    plug/unplug events. Never scans ports on the page thread.
+    """
+    if get_settings().USE_MOCK:
+        st.info("🧪 Mock mode is on (`USE_MOCK`), no Arduino is needed.")
+        return
+
+    monitor = get_monitor()
+    seen = st.session_state.get("port_events_seen", 0.0)
+    for event in monitor.recent_events():
+        if event.at > seen:
+            icon = "🔌" if event.kind == "added" else "⚠️"
+            st.toast(f"{icon} Arduino {event.kind}: {event.port}")
+            seen = event.at
+    st.session_state.port_events_seen = seen
+
+    if not monitor.ready:
+        st.info("🔍 Scanning for Arduinos...")
+    elif monitor.ports:
+        ports = ", ".join(f"`{port}`" for port in monitor.ports)
+        st.success(f"🟢 {len(monitor.ports)} Arduino(s) connected: {ports}")
+    else:
+        st.warning("🔴 No Arduino detected. Plug one in; this updates automatically.")
 
 
 def input_form():
@@ -9,6 +39,7 @@ def input_form():
 
     st.title("🧪 PreSure Trial Setup")
     st.markdown("Configure the parameters for your experimental trials below.")
+    device_status()
 
     with st.form("trial_input_form"):
         st.subheader("Basic Configuration")
@@ -1,23 +1,235 @@
 import streamlit as st
-import time
 from pathlib import Path
+import pandas as pd
+from core.analysis.alignment import align_trial_files
 from core.config.setting import settings
 from core.utils.generator import filename_generator
+from core.hardware.connection import DeviceManager, sync_devices
+from core.hardware.monitor import detected_ports
 from core.logging.logger import VernierFSRLogger
+from core.logging.metrics import load_metrics
+from core.logging.multi import MultiDeviceLogger
+from core.logging.scheduler import TrialJob, TrialScheduler
+from core.utils.mock_data import MockSignalEngine
+
+STALL_WARNING_SECONDS = 2.0
+STATUS_BADGES = {
+    "queued": "🕒 Queued",
+    "running": "⏳ Running",
+    "done": "✅ Done",
+    "failed": "❌ Failed",
+    "cancelled": "⏹️ Cancelled",
+}
+
+
+def get_device() -> DeviceManager:
+    """
+    Return the session's device manager; its serial connection stays open
+    across trials so the board is only reset once per session.
+    """
+    if "device" not in st.session_state:
+        # SERIAL_PORT pins a port (e.g. a simulator pty); None auto-detects
+        st.session_state.device = DeviceManager(
+            port=settings.SERIAL_PORT, baud=settings.BAUD_RATE
+        )
+    return st.session_state.device
+
+
+def get_devices() -> dict[str, DeviceManager]:
+    """
+    Return the session's device managers by port, for multi-device mode.
+    The scheduler re-syncs them with the port monitor before every trial, so
+    boards plugged in or out during the session are picked up.
+    """
+    if "devices" not in st.session_state:
+        st.session_state.devices = {}
+    return st.session_state.devices
+
+
+def get_scheduler() -> TrialScheduler:
+    """
+    Return the session's trial scheduler, starting it on first use.
+    """
+    if "scheduler" not in st.session_state:
+        # Set USE_MOCK in settings.json to false to log from a real Arduino
+        multi = settings.MULTI_DEVICE and not settings.USE_MOCK
+        device = None if settings.USE_MOCK or multi else get_device()
+        devices = get_devices()
+
+        def create_device_logger(device) -> VernierFSRLogger:
+            return VernierFSRLogger(
+                use_mock=settings.USE_MOCK,
+                stream=True,
+                clean_formats=tuple(settings.CLEAN_FORMATS),
+                device=device,
+                echo=False,
+                protocol=settings.PROTOCOL,
+                mock_engine=MockSignalEngine(
+                    rate=settings.MOCK_RATE_HZ, seed=settings.MOCK_SEED
+                ),
+            )
+
+        def create_logger():
+            if not multi:
+                return create_device_logger(device)
+            # Runs on the worker thread, so the port set is current per trial
+            current = sync_devices(devices, detected_ports(), settings.BAUD_RATE)
+            if not current:
+                raise RuntimeError("MULTI_DEVICE is on but no Arduino was found.")
+            return MultiDeviceLogger([create_device_logger(d) for d in current])
+
+        def align(job: TrialJob) -> None:
+            align_trial_files(job.save_dir, job.name, rate=settings.ALIGN_RATE_HZ)
+
+        st.session_state.scheduler = TrialScheduler(create_logger, post_process=align)
+    return st.session_state.scheduler
+
+
+def render_live_view(logger, trial_name):
+    """
+    Draw the progress bar and a downsampled A/B/C/D chart of the samples
+    currently held in the logger's ring buffer.
+    """
+    if logger.phase == "waiting":
+        st.progress(0.0, text=f"⏳ {trial_name}: starting...")
+    else:
+        elapsed = logger.progress() * logger.duration
+        st.progress(
+            logger.progress(),
+            text=f"⏳ Running {trial_name}... {int(elapsed)}/ {logger.duration}s",
+        )
+
+    stalled = logger.stalled_for()
+    if stalled > STALL_WARNING_SECONDS:
+        st.warning(
+            f"⚠️ No samples received for {stalled:.0f}s. Check the sensor connection."
+        )
+
+    samples = logger.samples.snapshot()
+    if not len(samples):
+        return
+
+    step = max(1, len(samples) // settings.LIVE_CHART_POINTS)
+    first = logger.samples.total - len(samples)
+    live = pd.DataFrame(
+        samples[::step, 1:],
+        columns=logger.samples.columns[1:],
+        index=pd.RangeIndex(first, first + len(samples), step, name="sample"),
+    )
+    st.line_chart(live)
+
+
+def render_job_status(scheduler: TrialScheduler):
+    """
+    Show the running trial and the job queue. Reruns on a timer while the
+    scheduler is busy, then triggers one full rerun to refresh the page.
+    """
+    active = scheduler.active()
+    if active is not None and active.logger is not None:
+        st.subheader(f"Now running: {active.name}")
+        render_live_view(active.logger, active.name)
+
+    jobs = scheduler.jobs()
+    if jobs:
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "Experiment": job.save_dir.parent.name,
+                        "Trial": job.name,
+                        "Status": STATUS_BADGES[job.status],
+                        "Error": job.error or "",
+                    }
+                    for job in jobs.values()
+                ]
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+    if st.session_state.get("scheduler_was_busy") and not scheduler.busy:
+        st.session_state.scheduler_was_busy = False
+        st.rerun()
+    st.session_state.scheduler_was_busy = scheduler.busy
+
+
+def render_metrics(trial_dir: Path):
+    """
+    Summarize the acquisition metrics sidecars of a finished trial and warn
+    when its data was degraded (gaps, parse failures or corrupt frames).
+    """
+    for path in sorted(trial_dir.glob("METRICS_*.json")):
+        metrics = load_metrics(path)
+        if metrics is None:
+            continue
+        label = path.stem.removeprefix("METRICS_")
+        latency = metrics["latency_ms"]
+        st.caption(
+            f"`{label}`: {metrics['samples']} samples @ "
+            f"{metrics['effective_rate_hz']:.0f} Hz · {metrics['gaps']} gaps · "
+            f"p95 latency {latency['p95'] or 0:g} ms · "
+            f"peak backlog {metrics['peak_in_waiting']} B"
+        )
+        if metrics["degraded"]:
+            st.warning(
+                f"⚠️ `{label}` is degraded: {metrics['missing_samples']} samples "
+                f"missing in {metrics['gaps']} gaps, "
+                f"{metrics['parse_failures']} unparsed lines, "
+                f"{metrics['dropped_bytes']} corrupt bytes."
+            )
 
 
 def run_trials(config):
     st.title("🔬 Run Trials")
-    st.markdown("Here is the list of all generated trials. Run them one by one.")
+    st.markdown(
+        "Here is the list of all generated trials. Queue them one by one or "
+        "run all remaining trials in the background."
+    )
 
     filenames = filename_generator(
         config["num_trials"], config["num_locations"], config["lump_options"]
     )
+    base_dir = Path(settings.DATA_DIRECTORY) / config["directory"]
+    scheduler = get_scheduler()
+    jobs = scheduler.jobs()
+
+    def submit(trial_name):
+        scheduler.submit(
+            trial_name, base_dir / trial_name, config["duration"], config["delay"]
+        )
 
     st.info(f"**Total Trials Generated:** {len(filenames)}")
 
+    # Jobs of earlier experiments in this session reuse the same trial names
+    trial_jobs = {name: jobs.get((base_dir / name, name)) for name in filenames}
+    remaining = [
+        name
+        for name, job in trial_jobs.items()
+        if job is None or job.status in ("failed", "cancelled")
+    ]
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(
+            f"Run All Remaining ({len(remaining)})",
+            disabled=not remaining,
+            use_container_width=True,
+        ):
+            for trial_name in remaining:
+                submit(trial_name)
+            st.rerun()
+    with col2:
+        if st.button(
+            "Cancel Queued", disabled=not scheduler.busy, use_container_width=True
+        ):
+            scheduler.cancel_all()
+            st.rerun()
+
+    poll_interval = 1 / settings.LIVE_CHART_FPS if scheduler.busy else None
+    st.fragment(render_job_status, run_every=poll_interval)(scheduler)
+
     # Create a container for each trial to keep the layout clean
     for i, trial_name in enumerate(filenames):
+        job = trial_jobs[trial_name]
         with st.container():
             st.subheader(f"Trial {i + 1}: {trial_name}")
 
@@ -26,53 +238,26 @@ def run_trials(config):
             with col1:
                 st.markdown(
                     f"**Directory:** `{config['directory']}/{trial_name}`<br>"
-                    f"**Duration:** `{config['duration']}s`  **Delay:** `{config['delay']}s`",
+                    f"**Duration:** `{config['duration']}s`  "
+                    f"**Delay:** `{config['delay']}s`",
                     unsafe_allow_html=True,
                 )
+                if job is not None:
+                    st.markdown(f"**Status:** {STATUS_BADGES[job.status]}")
+                    if job.error:
+                        st.error(f"❌ Trial {trial_name} failed: {job.error}")
+                if job is None or not job.is_pending:
+                    render_metrics(base_dir / trial_name)
 
             with col2:
                 # Use a unique key for each button to avoid conflicts
                 if st.button(
-                    "Run Trial", key=f"run_{trial_name}", use_container_width=True
+                    "Run Trial",
+                    key=f"run_{trial_name}",
+                    disabled=job is not None and job.is_pending,
+                    use_container_width=True,
                 ):
-                    base_dir = Path(settings.DATA_DIRECTORY) / config["directory"]
-                    trial_dir = base_dir / trial_name
-                    trial_dir.mkdir(parents=True, exist_ok=True)
-
-                    try:
-                        # Set use_mock=True for testing without a physical Arduino
-                        logger = VernierFSRLogger(use_mock=True)
-                    except Exception as e:
-                        st.error(f"Logger initialization failed for {trial_name}: {e}")
-                        continue
-
-                    # Use an empty placeholder for the progress bar
-                    progress_placeholder = st.empty()
-                    start_time = time.time()
-
-                    try:
-                        logger.run(
-                            duration_seconds=config["duration"],
-                            start_delay=config["delay"],
-                            save_dir=trial_dir,
-                            file_stem=trial_name,
-                        )
-
-                        # Update the progress bar in the placeholder
-                        for t in range(config["duration"]):
-                            elapsed = time.time() - start_time
-                            progress_value = min(elapsed / config["duration"], 1.0)
-                            progress_placeholder.progress(
-                                progress_value,
-                                text=f"⏳ Running {trial_name}... {int(elapsed)}/ {config['duration']}s",
-                            )
-                            time.sleep(1)
-
-                        progress_placeholder.empty()
-                        st.success(f"✅ Trial {trial_name} completed successfully.")
-
-                    except Exception as e:
-                        progress_placeholder.empty()
-                        st.error(f"❌ Trial {trial_name} failed: {e}")
+                    submit(trial_name)
+                    st.rerun()
 
             st.markdown("<hr>", unsafe_allow_html=True)
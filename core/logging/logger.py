@@ -1,31 +1,86 @@
 import csv
-import re
 import logging
+import sys
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import serial
+from core.analysis.online import TrialStats
+from core.hardware.connection import DeviceManager
 from core.hardware.detector import (
     find_arduino_ports,
     ArduinoNotFoundError,
     MultipleArduinoPortsFoundError,
 )
-from core.utils.mock_data import generate_mock_data
+from core.hardware.monitor import detected_ports
+from core.hardware.protocol import (
+    PROTOCOLS,
+    START_COMMANDS,
+    decode_frames,
+    format_rows,
+)
+from core.logging.metrics import TrialMetrics
+from core.logging.ring import SampleRingBuffer
+from core.logging.writer import CLEAN_HEADER, CLEAN_PATTERN, TrialWriter
+from core.utils.mock_data import MockSignalEngine
+from core.utils.storage import rows_to_array, save_trial_npy
 
 POLL_INTERVAL = 0.01
 
 
 class VernierFSRLogger:
-    def __init__(self, baud: int = 9600, timeout: float = 1.0, use_mock: bool = False):
+    def __init__(
+        self,
+        baud: int = 9600,
+        timeout: float = 1.0,
+        use_mock: bool = False,
+        stream: bool = False,
+        clean_formats: tuple[str, ...] = ("csv",),
+        device: DeviceManager | None = None,
+        echo: bool = True,
+        protocol: str = "ascii",
+        port: str | None = None,
+        clock_origin: tuple[int, int] | None = None,
+        mock_engine: MockSignalEngine | None = None,
+    ):
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Invalid protocol {protocol!r}. Allowed: {PROTOCOLS}")
         self.use_mock = use_mock
+        self.stream = stream
+        self.clean_formats = tuple(clean_formats)
+        self.timeout = timeout
+        self.device = device
+        self.echo = echo
+        self.protocol = protocol
+        self.mock = mock_engine or MockSignalEngine()
+        self.metrics = TrialMetrics()
+        self.metrics_path: Path | None = None
+        self.stats = TrialStats()
+        self.stats_path: Path | None = None
         if self.use_mock:
             self.port = "mock"
             logging.info("Using mock data logger.")
+        elif self.device is not None:
+            # Reuse the session's warm connection instead of opening the port
+            self.port = self.device.port
+            if self.port == "mock":
+                self.use_mock = True
+                logging.info("No Arduino found, switching to mock data logger.")
+            else:
+                self.device.prepare()
+        elif port is not None:
+            self.port = port
+            logging.info(f"Opening serial port {self.port} @ {baud} baud")
+            self._ser = serial.serial_for_url(self.port, baudrate=baud, timeout=timeout)
+            time.sleep(2)
+            self._ser.reset_input_buffer()
         else:
             try:
-                ports = find_arduino_ports()
+                # Cached by the port monitor, so no scan per trial
+                ports = find_arduino_ports(detected_ports())
             except ArduinoNotFoundError:
                 logging.error("No Arduino found. Plug it in and try again.")
                 raise
@@ -39,46 +94,231 @@ class VernierFSRLogger:
                 logging.info("No Arduino found, switching to mock data logger.")
             else:
                 logging.info(f"Opening serial port {self.port} @ {baud} baud")
-                self.ser = serial.Serial(self.port, baudrate=baud, timeout=timeout)
+                self._ser = serial.Serial(self.port, baudrate=baud, timeout=timeout)
                 time.sleep(2)
-                self.ser.reset_input_buffer()
+                self._ser.reset_input_buffer()
 
         self.is_logging = False
         self._stop_reader = threading.Event()
+        # Set by Ctrl+C or `interrupt()`; `run()` then ends the trial early
+        self._interrupt = threading.Event()
+        self.interrupted = False
         self._data_lines = []
+        self._writer: TrialWriter | None = None
+        # (wall ns, perf_counter ns) pair; loggers that run side by side can
+        # share one so their host timestamps are directly comparable.
+        self.clock_origin = clock_origin
+        self._clock_origin = clock_origin or (time.time_ns(), time.perf_counter_ns())
+
+        # Live view of the running trial, polled by the UI.
+        self.samples = SampleRingBuffer()
+        self.phase = "idle"
+        self.duration = 0.0
+        self._logging_started: float | None = None
+
+    @property
+    def dropped_bytes(self) -> int:
+        """Bytes of corrupt binary frames discarded so far."""
+        return self.metrics.dropped_bytes
+
+    @property
+    def ser(self) -> serial.SerialBase:
+        if self.device is not None:
+            return self.device.connect()
+        return self._ser
+
+    def progress(self) -> float:
+        """
+        Fraction of the logging duration that has elapsed, between 0 and 1.
+        """
+        if self.phase == "finished":
+            return 1.0
+        if self._logging_started is None or self.duration <= 0:
+            return 0.0
+        elapsed = time.monotonic() - self._logging_started
+        return min(elapsed / self.duration, 1.0)
+
+    def stalled_for(self) -> float:
+        """
+        Seconds without a new sample while logging; 0 outside the logging window.
+        """
+        if self.phase != "logging" or self._logging_started is None:
+            return 0.0
+        last = max(self._logging_started, self.samples.updated_at or 0.0)
+        return time.monotonic() - last
+
+    def _send(self, command: bytes) -> None:
+        if self.device is not None:
+            self.device.write(command)
+        else:
+            self.ser.write(command)
 
     def start_logging(self) -> None:
         if not self.is_logging and not self.use_mock:
-            self.ser.write(b"s")
+            self._send(START_COMMANDS[self.protocol])
         self.is_logging = True
 
     def stop_logging(self) -> None:
         if self.is_logging and not self.use_mock:
-            self.ser.write(b"e")
+            self._send(b"e")
         self.is_logging = False
 
+    def interrupt(self) -> None:
+        """
+        End a running trial early, or the next one if called before `run()`.
+        `run()` still saves what was logged and sets `interrupted`.
+        """
+        self._interrupt.set()
+
+    def _record(self, entry: str) -> tuple[str, ...] | None:
+        match = CLEAN_PATTERN.search(entry)
+        row = match.groups() if match else None
+        if row is not None:
+            self.samples.append(row)
+        else:
+            self.metrics.parse_failures += 1
+
+        if self._writer is not None:
+            self._writer.write_parsed(entry, row)
+        else:
+            self._data_lines.append(entry)
+        return row
+
+    def _timestamp(self, perf_ns: int) -> str:
+        """
+        Format a perf_counter_ns reading as wall-clock time with microseconds.
+        """
+        wall_ns = self._clock_origin[0] + perf_ns - self._clock_origin[1]
+        stamp = datetime.fromtimestamp(wall_ns / 1e9)
+        return stamp.strftime("%H:%M:%S.%f")
+
+    def _emit(self, received: int, lines) -> None:
+        timestamp = self._timestamp(received)
+        entries = [f"[{timestamp}] {line}" for line in lines]
+        if self.echo:
+            sys.stdout.write("\n".join(entries) + "\n")
+        rows = [row for row in map(self._record, entries) if row]
+        if rows:
+            self.metrics.observe(received, [float(row[0]) for row in rows])
+            self.stats.update(rows_to_array(rows))
+
     def _reader_loop(self) -> None:
+        self._clock_origin = self.clock_origin or (
+            time.time_ns(),
+            time.perf_counter_ns(),
+        )
+        if self.use_mock:
+            self._read_mock()
+        else:
+            self._read_serial()
+
+    def _read_mock(self) -> None:
+        """
+        Emit mock samples in blocks, paced to the engine's rate in real
+        time. Like the device, samples are only sent while logging.
+        """
+        started = None
         while not self._stop_reader.is_set():
-            if self.use_mock:
-                line = generate_mock_data()
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                entry = f"[{timestamp}] {line}"
-                print(entry)
-                self._data_lines.append(entry)
-                time.sleep(POLL_INTERVAL)
-            else:
-                try:
-                    line = self.ser.readline().decode("utf-8", errors="ignore").strip()
-                    if line:
-                        timestamp = datetime.now().strftime("%H:%M:%S")
-                        entry = f"[{timestamp}] {line}"
-                        print(entry)
-                        self._data_lines.append(entry)
-                    else:
-                        time.sleep(POLL_INTERVAL)
-                except serial.SerialException as e:
-                    logging.error(f"Serial read error: {e}")
+            time.sleep(POLL_INTERVAL)
+            now = time.perf_counter_ns()
+            if not self.is_logging:
+                started = None
+                continue
+            if started is None:
+                started = now - self.mock.emitted * 1e9 / self.mock.rate
+            due = int((now - started) * self.mock.rate / 1e9) - self.mock.emitted
+            if due > 0:
+                self._emit_records(self.mock.block(due), now, decimals=6)
+
+    def _read_serial(self) -> None:
+        """
+        Drain everything waiting on the port per read call and split it into
+        lines in memory. A 1-byte blocking read (bounded by the port timeout)
+        is used only when nothing is waiting, so there is no polling sleep.
+        """
+        pending = bytearray()
+        while not self._stop_reader.is_set():
+            try:
+                ser = self.ser
+                waiting = ser.in_waiting
+                self.metrics.backlog(waiting)
+                chunk = ser.read(waiting or 1)
+            except serial.SerialException as e:
+                logging.error(f"Serial read error: {e}")
+                pending.clear()
+                if not self._recover():
                     break
+                continue
+
+            if not chunk:
+                continue
+            received = time.perf_counter_ns()
+            pending += chunk
+            if self.protocol == "binary":
+                self._consume_frames(pending, received)
+                continue
+
+            end = pending.rfind(b"\n")
+            if end < 0:
+                continue
+
+            complete = pending[:end].decode("utf-8", errors="ignore")
+            del pending[: end + 1]
+            lines = [line.strip() for line in complete.split("\n")]
+            lines = [line for line in lines if line]
+            if lines:
+                self._emit(received, lines)
+
+    def _consume_frames(self, pending: bytearray, received: int) -> None:
+        """
+        Decode complete binary frames from the front of `pending` in bulk.
+        """
+        records, consumed, dropped = decode_frames(pending)
+        del pending[:consumed]
+        if dropped:
+            self.metrics.dropped_bytes += dropped
+            logging.warning(f"Discarded {dropped} bytes of corrupt binary frames.")
+        if len(records):
+            self._emit_records(records, received)
+
+    def _emit_records(
+        self, records: np.ndarray, received: int, decimals: int = 3
+    ) -> None:
+        """
+        Record a block of TRIAL_DTYPE samples received at `received`.
+        """
+        rows = format_rows(records, decimals)
+        timestamp = self._timestamp(received)
+        entries = [f"[{timestamp}] {' | '.join(row)}" for row in rows]
+        if self.echo:
+            sys.stdout.write("\n".join(entries) + "\n")
+
+        self.samples.extend(
+            np.column_stack([records[name] for name in records.dtype.names])
+        )
+        self.metrics.observe(received, records["Time(s)"])
+        self.stats.update(records)
+        if self._writer is not None:
+            for entry, row in zip(entries, rows):
+                self._writer.write_parsed(entry, row)
+        else:
+            self._data_lines.extend(entries)
+
+    def _recover(self) -> bool:
+        """
+        Reconnect a managed device after a read error and resume logging.
+        """
+        if self.device is None:
+            return False
+        try:
+            self.device.reconnect()
+            if self.is_logging:
+                self.device.write(START_COMMANDS[self.protocol])
+        except serial.SerialException as e:
+            logging.error(f"Reconnect failed: {e}")
+            return False
+        logging.info(f"Reconnected to {self.port}.")
+        return True
 
     def run(
         self,
@@ -90,6 +330,11 @@ class VernierFSRLogger:
         """
         Run the logger, save raw and clean CSV files after logging.
 
+        In streaming mode the files are written while the trial runs instead
+        of being saved from memory once it ends. Ctrl+C or `interrupt()`
+        ends logging early; the partial trial is still saved and
+        `interrupted` is set, so callers can tell it apart from a full one.
+
         Args:
             duration_seconds: Logging time in seconds.
             start_delay: Optional delay before start.
@@ -99,34 +344,78 @@ class VernierFSRLogger:
         Returns:
             (raw_csv_path, clean_csv_path)
         """
-        reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
-        reader_thread.start()
+        save_dir = Path(save_dir or ".")
+        save_dir.mkdir(parents=True, exist_ok=True)
+        file_stem = file_stem or "vernier"
 
-        if start_delay > 0:
-            logging.info(f"Waiting {start_delay}s before logging...")
-            time.sleep(start_delay)
+        if self.use_mock:
+            self.mock.configure_for(file_stem)
+            self.metrics = TrialMetrics(nominal_interval=1 / self.mock.rate)
+        self.stats = TrialStats()
+        self.interrupted = False
+        # Left set by the previous run; the logger can be run again
+        self._stop_reader.clear()
+        self._logging_started = None
+        if self.stream:
+            self._writer = TrialWriter(
+                save_dir, file_stem, clean_formats=self.clean_formats
+            )
 
-        logging.info(f"Logging for {duration_seconds}s started.")
-        self.start_logging()
+        self.duration = duration_seconds
+        self.phase = "waiting"
+        reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        reader_thread.start()
 
         try:
-            time.sleep(duration_seconds)
+            # Inside the try so an interrupt during the delay still cleans up
+            if start_delay > 0:
+                logging.info(f"Waiting {start_delay}s before logging...")
+                self._interrupt.wait(start_delay)
+            if not self._interrupt.is_set():
+                logging.info(f"Logging for {duration_seconds}s started.")
+                self.start_logging()
+                self.phase = "logging"
+                self._logging_started = time.monotonic()
+                self.metrics.start()
+                self._interrupt.wait(duration_seconds)
         except KeyboardInterrupt:
-            logging.warning("Logging interrupted by user.")
+            self._interrupt.set()
         finally:
             self.stop_logging()
             self._stop_reader.set()
-            if not self.use_mock:
+            reader_thread.join(timeout=self.timeout + POLL_INTERVAL)
+            self.metrics.finish()
+            # A managed device stays open for the next trial
+            if not self.use_mock and self.device is None:
                 self.ser.close()
+            self.phase = "finished"
+            self.interrupted = self._interrupt.is_set()
+            self._interrupt.clear()
+            if self.interrupted:
+                logging.warning("Logging interrupted by user.")
             logging.info("Logging finished.")
 
-        save_dir = Path(save_dir or ".")
-        save_dir.mkdir(parents=True, exist_ok=True)
-        file_stem = file_stem or "vernier"
+        self.metrics_path = self.metrics.save(save_dir / f"METRICS_{file_stem}.json")
+        if self.metrics.degraded:
+            logging.warning(f"Trial {file_stem} degraded: {self.metrics.to_dict()}")
 
-        raw_path = self.save_to_csv(save_dir, f"RAW_{file_stem}.csv")
-        clean_path = self.save_clean_csv(save_dir, f"CLEAN_{file_stem}.csv")
-        return raw_path, clean_path
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            paths = writer.close()
+        else:
+            raw_path = self.save_to_csv(save_dir, f"RAW_{file_stem}.csv")
+            clean_paths = []
+            for fmt in self.clean_formats:
+                if fmt == "npy":
+                    path = self.save_clean_npy(save_dir, f"CLEAN_{file_stem}.npy")
+                else:
+                    path = self.save_clean_csv(save_dir, f"CLEAN_{file_stem}.csv")
+                clean_paths.append(path)
+            paths = raw_path, clean_paths[0] if clean_paths else None
+
+        # Written after the CLEAN files, so the index knows it is current
+        self.stats_path = self.stats.save(save_dir / f"STATS_{file_stem}.json")
+        return paths
 
     def save_to_csv(self, save_dir: Path, filename: str) -> Path:
         filepath = save_dir / filename
@@ -138,23 +427,22 @@ class VernierFSRLogger:
         logging.info(f"Saved raw log to {filepath.resolve()}")
         return filepath
 
+    def _extract_rows(self) -> list[tuple[str, ...]]:
+        extracted = list()
+        for line in self._data_lines:
+            match = CLEAN_PATTERN.search(line)
+            if match:
+                extracted.append(match.groups())
+        return extracted
+
     def save_clean_csv(self, save_dir: Path, filename: str) -> Path | None:
         """
         Parse raw lines with format:
-        [15:42:33] 0.100 | 31085 | 29010 | 50 | 25444
+        [15:42:33.123456] 0.100 | 31085 | 29010 | 50 | 25444
 
         Output columns: Time(s), A, B, C, D
         """
-        pattern = re.compile(
-            r"\[\d{2}:\d{2}:\d{2}\]\s+([\d.]+)\s+\|\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\d+)"
-        )
-
-        extracted = list()
-        for line in self._data_lines:
-            match = pattern.search(line)
-            if match:
-                extracted.append(match.groups())
-
+        extracted = self._extract_rows()
         if not extracted:
             logging.warning("No valid structured sensor data found.")
             return None
@@ -162,8 +450,22 @@ class VernierFSRLogger:
         filepath = save_dir / filename
         with filepath.open("w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(["Time(s)", "A", "B", "C", "D"])
+            writer.writerow(CLEAN_HEADER)
             writer.writerows(extracted)
 
         logging.info(f"Saved clean log to {filepath.resolve()}")
         return filepath
+
+    def save_clean_npy(self, save_dir: Path, filename: str) -> Path | None:
+        """
+        Parse raw lines like `save_clean_csv` and write them as a typed,
+        memory-mappable .npy record array (float32 time, uint16 sensors).
+        """
+        extracted = self._extract_rows()
+        if not extracted:
+            logging.warning("No valid structured sensor data found.")
+            return None
+
+        filepath = save_trial_npy(save_dir / filename, rows_to_array(extracted))
+        logging.info(f"Saved clean log to {filepath.resolve()}")
+        return filepath
@@ -0,0 +1,172 @@
+import json
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Upper bounds (ms) of the arrival latency histogram buckets; the last
+# bucket collects everything above the final bound.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+GAP_FACTOR = 1.5
+WARMUP_INTERVALS = 64
+
+
+class TrialMetrics:
+    """
+    Acquisition health counters for one trial, updated by the reader thread.
+
+    - Gaps are device `Time(s)` steps longer than `GAP_FACTOR` sample
+      intervals. The interval is given (`nominal_interval`) or estimated
+      from the first samples.
+    - Arrival latency is host receive time minus device time. It is measured
+      relative to the fastest sample seen so far, so it shows how far behind
+      the host is reading, not the absolute transport delay.
+    - `peak_in_waiting` is the largest serial input backlog seen before a read.
+    """
+
+    def __init__(self, nominal_interval: float | None = None):
+        self.nominal_interval = nominal_interval
+        self.samples = 0
+        self.parse_failures = 0
+        self.dropped_bytes = 0
+        self.peak_in_waiting = 0
+        self.gaps = 0
+        self.missing_samples = 0
+        self.largest_gap = 0.0
+        self.time_resets = 0
+        self.latency_counts = np.zeros(len(LATENCY_BUCKETS_MS) + 1, dtype=np.int64)
+        self.max_latency = 0.0
+        self._interval = nominal_interval
+        self._warmup: list[np.ndarray] = []
+        self._last_time: float | None = None
+        self._min_delay: float | None = None
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    def start(self) -> None:
+        self._started = time.monotonic()
+
+    def finish(self) -> None:
+        self._finished = time.monotonic()
+
+    @property
+    def duration(self) -> float:
+        if self._started is None:
+            return 0.0
+        return (self._finished or time.monotonic()) - self._started
+
+    def backlog(self, in_waiting: int) -> None:
+        if in_waiting > self.peak_in_waiting:
+            self.peak_in_waiting = in_waiting
+
+    def observe(self, received_ns: int, device_times) -> None:
+        """
+        Account for a batch of samples received together.
+
+        Args:
+            received_ns: perf_counter_ns() when the batch was read.
+            device_times: Device `Time(s)` of each sample, in order.
+        """
+        times = np.asarray(device_times, dtype=np.float64)
+        if not len(times):
+            return
+        self.samples += len(times)
+
+        previous = self._last_time
+        self._last_time = float(times[-1])
+        if previous is None:
+            steps = np.diff(times)
+        else:
+            steps = np.diff(times, prepend=previous)
+        self.time_resets += int(np.count_nonzero(steps < 0))
+        self._count_gaps(steps[steps > 0])
+
+        delay = received_ns / 1e9 - times
+        lowest = float(delay.min())
+        if self._min_delay is None or lowest < self._min_delay:
+            self._min_delay = lowest
+        latency_ms = (delay - self._min_delay) * 1000
+        self.latency_counts += np.bincount(
+            np.searchsorted(LATENCY_BUCKETS_MS, latency_ms),
+            minlength=len(self.latency_counts),
+        )
+        self.max_latency = max(self.max_latency, float(latency_ms.max()))
+
+    def _count_gaps(self, steps: np.ndarray) -> None:
+        if self._interval is None:
+            self._warmup.append(steps)
+            warmup = np.concatenate(self._warmup)
+            if len(warmup) < WARMUP_INTERVALS:
+                return
+            self._interval = float(np.median(warmup))
+            self._warmup = []
+            steps = warmup
+
+        gaps = steps[steps > GAP_FACTOR * self._interval]
+        if len(gaps):
+            self.gaps += len(gaps)
+            self.missing_samples += int(np.rint(gaps / self._interval).sum()) - len(
+                gaps
+            )
+            self.largest_gap = max(self.largest_gap, float(gaps.max()))
+
+    def latency_percentile(self, q: float) -> float | None:
+        """
+        Upper bucket bound (ms) below which a fraction `q` of samples
+        arrived, capped at the largest latency seen.
+        """
+        total = self.latency_counts.sum()
+        if not total:
+            return None
+        bucket = int(np.searchsorted(np.cumsum(self.latency_counts), q * total))
+        if bucket >= len(LATENCY_BUCKETS_MS):
+            return round(self.max_latency, 3)
+        return min(float(LATENCY_BUCKETS_MS[bucket]), round(self.max_latency, 3))
+
+    @property
+    def degraded(self) -> bool:
+        """True if the trial lost or mangled data."""
+        return bool(self.gaps or self.parse_failures or self.dropped_bytes)
+
+    def to_dict(self) -> dict:
+        duration = self.duration
+        return {
+            "samples": self.samples,
+            "duration_s": round(duration, 3),
+            "effective_rate_hz": round(self.samples / duration, 1) if duration else 0,
+            "sample_interval_s": (
+                round(self._interval, 9) if self._interval is not None else None
+            ),
+            "gaps": self.gaps,
+            "missing_samples": self.missing_samples,
+            "largest_gap_s": round(self.largest_gap, 6),
+            "time_resets": self.time_resets,
+            "parse_failures": self.parse_failures,
+            "dropped_bytes": self.dropped_bytes,
+            "peak_in_waiting": self.peak_in_waiting,
+            "latency_ms": {
+                "buckets": list(LATENCY_BUCKETS_MS),
+                "counts": self.latency_counts.tolist(),
+                "p50": self.latency_percentile(0.5),
+                "p95": self.latency_percentile(0.95),
+                "max": round(self.max_latency, 3),
+            },
+            "degraded": self.degraded,
+        }
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        logging.info(f"Saved trial metrics to {path.resolve()}")
+        return path
+
+
+def load_metrics(path: Path) -> dict | None:
+    """
+    Read a METRICS_*.json sidecar, or None if it is missing or unreadable.
+    """
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,228 @@
+import csv
+import heapq
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+
+from core.logging.logger import VernierFSRLogger
+from core.logging.writer import CLEAN_HEADER, CLEAN_PATTERN
+
+MERGED_HEADER = ["Timestamp", "Device", *CLEAN_HEADER]
+TIMESTAMP_PATTERN = re.compile(r"^\[(\d{2}):(\d{2}):(\d{2}(?:\.\d+)?)\]")
+
+
+def device_stem(file_stem: str, device_no: int) -> str:
+    """
+    File stem of one device's share of a multi-device trial.
+    """
+    return f"{file_stem}_DEV{device_no}"
+
+
+def raw_entries(raw_path: Path, device_no: int = 0):
+    """
+    Yield (seconds, device_no, timestamp, row) for every parsed RAW line.
+
+    Host timestamps only carry the time of day, so a jump back of more than
+    twelve hours is treated as crossing midnight.
+    """
+    offset, previous = 0.0, None
+    with raw_path.open(newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for record in reader:
+            if not record:
+                continue
+            line = record[0]
+            stamp = TIMESTAMP_PATTERN.match(line)
+            match = CLEAN_PATTERN.search(line)
+            if not stamp or not match:
+                continue
+
+            hours, minutes, seconds = stamp.groups()
+            elapsed = int(hours) * 3600 + int(minutes) * 60 + float(seconds) + offset
+            if previous is not None and elapsed < previous - 43200:
+                offset += 86400
+                elapsed += 86400
+            previous = elapsed
+            yield elapsed, device_no, stamp.group(0)[1:-1], match.groups()
+
+
+def merge_device_logs(raw_paths: list[Path | None], out_path: Path) -> Path | None:
+    """
+    Merge per-device RAW logs into one file ordered by host timestamp.
+
+    The logs are already in time order, so they are merged as streams and the
+    trial is never held in memory.
+
+    Args:
+        raw_paths (list[Path | None]): RAW log of each device, indexed by
+            device number; missing logs are skipped.
+        out_path (Path): Merged CSV to write.
+
+    Returns:
+        Path | None: `out_path`, or None if no device produced any samples.
+    """
+    streams = [
+        raw_entries(Path(path), device_no)
+        for device_no, path in enumerate(raw_paths)
+        if path is not None
+    ]
+    written = 0
+    with out_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(MERGED_HEADER)
+        for _, device_no, timestamp, row in heapq.merge(*streams):
+            writer.writerow([timestamp, device_no, *row])
+            written += 1
+
+    if not written:
+        out_path.unlink()
+        logging.warning("No valid structured sensor data found on any device.")
+        return None
+    logging.info(f"Saved merged log of {written} samples to {out_path.resolve()}")
+    return out_path
+
+
+class MultiDeviceLogger:
+    """
+    Log one trial from several devices at once.
+
+    Each device keeps its own `VernierFSRLogger` and reader thread; all of
+    them share one clock origin so their host timestamps are comparable.
+    Every device writes its own RAW/CLEAN files with a `_DEV<n>` suffix and,
+    with `merge` enabled, the RAW logs are combined into
+    `MERGED_<stem>.csv` once the trial ends.
+
+    Exposes the same `run`/`phase`/`progress` interface as a single logger,
+    so it can be used by the trial scheduler unchanged.
+    """
+
+    def __init__(self, loggers: list[VernierFSRLogger], merge: bool = True):
+        if not loggers:
+            raise ValueError("MultiDeviceLogger needs at least one logger.")
+        self.loggers = list(loggers)
+        self.merge = merge
+        self.device_paths: list[tuple[Path | None, Path | None] | None] = []
+
+        origin = (time.time_ns(), time.perf_counter_ns())
+        for logger in self.loggers:
+            logger.clock_origin = origin
+
+    @property
+    def samples(self):
+        """Live samples of the first device."""
+        return self.loggers[0].samples
+
+    @property
+    def phase(self) -> str:
+        phases = {logger.phase for logger in self.loggers}
+        for phase in ("logging", "waiting", "finished"):
+            if phase in phases:
+                return phase
+        return "idle"
+
+    @property
+    def duration(self) -> float:
+        return self.loggers[0].duration
+
+    @property
+    def dropped_bytes(self) -> int:
+        return sum(logger.dropped_bytes for logger in self.loggers)
+
+    @property
+    def interrupted(self) -> bool:
+        return any(logger.interrupted for logger in self.loggers)
+
+    def interrupt(self) -> None:
+        for logger in self.loggers:
+            logger.interrupt()
+
+    def progress(self) -> float:
+        return min(logger.progress() for logger in self.loggers)
+
+    def stalled_for(self) -> float:
+        return max(logger.stalled_for() for logger in self.loggers)
+
+    def run(
+        self,
+        duration_seconds: float,
+        start_delay: float = 0,
+        save_dir: Path | str | None = None,
+        file_stem: str | None = None,
+    ) -> tuple[Path | None, Path | None]:
+        """
+        Run every device's logger concurrently for the same window.
+
+        Args:
+            duration_seconds: Logging time in seconds.
+            start_delay: Optional delay before start.
+            save_dir: Directory to save files.
+            file_stem: Base filename without extension.
+
+        Returns:
+            (merged_or_raw_path, clean_path): The merged log (or the first
+            device's RAW log when merging is off) and the first device's
+            clean file. Per-device paths are kept in `device_paths`.
+
+        Raises:
+            RuntimeError: if any device failed; files from the other devices
+                are still saved and merged.
+        """
+        save_dir = Path(save_dir or ".")
+        save_dir.mkdir(parents=True, exist_ok=True)
+        file_stem = file_stem or "vernier"
+
+        results: list[tuple[Path | None, Path | None] | None] = [None] * len(
+            self.loggers
+        )
+        errors: dict[int, Exception] = {}
+
+        def run_device(device_no: int, logger: VernierFSRLogger) -> None:
+            try:
+                results[device_no] = logger.run(
+                    duration_seconds=duration_seconds,
+                    start_delay=start_delay,
+                    save_dir=save_dir,
+                    file_stem=device_stem(file_stem, device_no),
+                )
+            except Exception as e:
+                logging.error(f"Device {device_no} ({logger.port}) failed: {e}")
+                errors[device_no] = e
+
+        threads = []
+        for device_no, logger in enumerate(self.loggers):
+            logging.info(f"DEV{device_no}: {logger.port}")
+            thread = threading.Thread(
+                target=run_device, args=(device_no, logger), daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            # Ctrl+C only reaches the main thread; stop every device's trial
+            self.interrupt()
+            for thread in threads:
+                thread.join()
+
+        self.device_paths = results
+        raw_paths = [paths[0] if paths else None for paths in results]
+        main_path = next((path for path in raw_paths if path is not None), None)
+        if self.merge:
+            main_path = merge_device_logs(
+                raw_paths, save_dir / f"MERGED_{file_stem}.csv"
+            )
+
+        if errors:
+            failed = ", ".join(f"DEV{n}: {e}" for n, e in sorted(errors.items()))
+            raise RuntimeError(
+                f"{len(errors)} of {len(self.loggers)} devices failed ({failed})"
+            )
+
+        clean_path = next(
+            (paths[1] for paths in results if paths and paths[1] is not None), None
+        )
+        return main_path, clean_path
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import numpy as np
+
+from core.logging.writer import CLEAN_HEADER
+
+
+class SampleRingBuffer:
+    """
+    Fixed-capacity, thread-safe buffer of the most recent parsed samples.
+
+    The logger's reader thread appends (Time(s), A, B, C, D) rows while the
+    UI polls `snapshot()`; once full, the oldest samples are overwritten.
+    """
+
+    columns = CLEAN_HEADER
+
+    def __init__(self, capacity: int = 2048):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._data = np.zeros((capacity, len(self.columns)), dtype=np.float64)
+        self._total = 0
+        self._lock = threading.Lock()
+        self.updated_at: float | None = None
+
+    @property
+    def total(self) -> int:
+        """Number of samples ever appended."""
+        return self._total
+
+    def append(self, row) -> None:
+        with self._lock:
+            self._data[self._total % self.capacity] = row
+            self._total += 1
+            self.updated_at = time.monotonic()
+
+    def extend(self, rows) -> None:
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(self.columns))
+        count = len(rows)
+        rows = rows[-self.capacity :]
+        with self._lock:
+            idx = (
+                self._total + count - len(rows) + np.arange(len(rows))
+            ) % self.capacity
+            self._data[idx] = rows
+            self._total += count
+            self.updated_at = time.monotonic()
+
+    def snapshot(self) -> np.ndarray:
+        """
+        Copy the buffered samples, oldest first, as an (n, 5) array.
+        """
+        with self._lock:
+            if self._total <= self.capacity:
+                return self._data[: self._total].copy()
+            start = self._total % self.capacity
+            return np.concatenate((self._data[start:], self._data[:start]))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._total = 0
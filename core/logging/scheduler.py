@@ -0,0 +1,177 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from core.logging.logger import VernierFSRLogger
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+
+# Trials are identified by where they are saved as well as by name, since
+# every experiment of a session reuses the same trial names
+JobKey = tuple[Path, str]
+
+
+@dataclass
+class TrialJob:
+    name: str
+    save_dir: Path
+    duration: float
+    delay: float
+    status: str = "queued"
+    logger: VernierFSRLogger | None = None
+    paths: tuple[Path | None, Path | None] | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def key(self) -> JobKey:
+        return self.save_dir, self.name
+
+    @property
+    def is_pending(self) -> bool:
+        return self.status in ("queued", "running")
+
+
+class TrialScheduler:
+    """
+    Run queued trials one at a time on a background worker thread.
+
+    Trials share one acquisition device, so jobs are executed strictly in
+    submission order. The UI submits jobs and polls `jobs()`/`active()`
+    without ever blocking on a running trial.
+
+    `post_process`, if given, runs on the worker after each successful
+    trial (e.g. alignment). Its failure is reported in `job.error` but keeps
+    the job done, since the trial data is already saved.
+    """
+
+    def __init__(
+        self,
+        logger_factory: Callable[[], VernierFSRLogger],
+        post_process: Callable[[TrialJob], None] | None = None,
+    ):
+        self.logger_factory = logger_factory
+        self.post_process = post_process
+        self._queue: deque[TrialJob] = deque()
+        self._jobs: dict[JobKey, TrialJob] = {}
+        self._active: TrialJob | None = None
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+
+    def submit(
+        self, name: str, save_dir: Path, duration: float, delay: float = 0
+    ) -> TrialJob:
+        """
+        Queue a trial. A trial with the same name and save directory that is
+        already queued or running is returned unchanged instead of being
+        queued twice.
+        """
+        with self._condition:
+            existing = self._jobs.get((Path(save_dir), name))
+            if existing is not None and existing.is_pending:
+                return existing
+
+            job = TrialJob(name, Path(save_dir), duration, delay)
+            self._jobs[job.key] = job
+            self._queue.append(job)
+            self._condition.notify()
+            return job
+
+    def cancel(self, save_dir: Path, name: str) -> bool:
+        """
+        Cancel a queued trial, or interrupt a running one. An interrupted
+        trial still saves what it logged and ends as done.
+        """
+        with self._condition:
+            job = self._jobs.get((Path(save_dir), name))
+            if job is None or not job.is_pending:
+                return False
+            if job.status == "running":
+                job.cancel_requested = True
+                if job.logger is not None:
+                    job.logger.interrupt()
+                return True
+            self._queue.remove(job)
+            job.status = "cancelled"
+            return True
+
+    def cancel_all(self) -> int:
+        with self._condition:
+            cancelled = 0
+            while self._queue:
+                self._queue.popleft().status = "cancelled"
+                cancelled += 1
+            return cancelled
+
+    def jobs(self) -> dict[JobKey, TrialJob]:
+        with self._condition:
+            return dict(self._jobs)
+
+    def active(self) -> TrialJob | None:
+        return self._active
+
+    @property
+    def busy(self) -> bool:
+        with self._condition:
+            return self._active is not None or bool(self._queue)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if self._shutdown:
+                    return
+                job = self._queue.popleft()
+                job.status = "running"
+                job.started_at = time.time()
+                self._active = job
+
+            self._run(job)
+
+            with self._condition:
+                job.finished_at = time.time()
+                self._active = None
+
+    def _run(self, job: TrialJob) -> None:
+        try:
+            logger = self.logger_factory()
+            with self._condition:
+                job.logger = logger
+                # Cancelled while the logger was being created
+                if job.cancel_requested:
+                    logger.interrupt()
+            job.save_dir.mkdir(parents=True, exist_ok=True)
+            job.paths = job.logger.run(
+                duration_seconds=job.duration,
+                start_delay=job.delay,
+                save_dir=job.save_dir,
+                file_stem=job.name,
+            )
+        except Exception as e:
+            logging.error(f"Trial {job.name} failed: {e}", exc_info=True)
+            job.error = str(e)
+            job.status = "failed"
+            return
+
+        if self.post_process is not None:
+            try:
+                self.post_process(job)
+            except Exception as e:
+                logging.error(f"Post-processing {job.name} failed: {e}", exc_info=True)
+                job.error = f"Post-processing failed: {e}"
+        job.status = "done"
@@ -0,0 +1,138 @@
+import csv
+import logging
+import os
+import re
+import time
+from pathlib import Path
+
+from core.utils.storage import CLEAN_FORMATS, NpyAppender, rows_to_array
+
+CLEAN_HEADER = ["Time(s)", "A", "B", "C", "D"]
+CLEAN_PATTERN = re.compile(
+    r"\[\d{2}:\d{2}:\d{2}(?:\.\d+)?\]\s+([\d.]+)\s+\|\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\d+)"
+)
+
+
+class TrialWriter:
+    """
+    Stream timestamped lines to RAW_*.csv and parsed rows to CLEAN_* files.
+
+    Lines are held in a bounded buffer and written out whenever it fills up or
+    `flush_interval` seconds have passed, so memory stays constant for the
+    whole trial and at most one buffer of data is lost on a crash.
+    """
+
+    def __init__(
+        self,
+        save_dir: Path | str,
+        file_stem: str,
+        buffer_size: int = 256,
+        flush_interval: float = 1.0,
+        fsync: bool = True,
+        clean_formats: tuple[str, ...] = ("csv",),
+    ):
+        invalid = [fmt for fmt in clean_formats if fmt not in CLEAN_FORMATS]
+        if invalid or not clean_formats:
+            raise ValueError(
+                f"Invalid clean formats: {invalid}. Allowed: {CLEAN_FORMATS}"
+            )
+
+        self.save_dir = Path(save_dir)
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.raw_path = self.save_dir / f"RAW_{file_stem}.csv"
+        self.clean_paths = {
+            fmt: self.save_dir / f"CLEAN_{file_stem}.{fmt}" for fmt in clean_formats
+        }
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self._buffer: list[tuple[str, tuple[str, ...] | None]] = []
+        self._rows_written = 0
+        self._last_flush = time.monotonic()
+
+        self._raw_file = self.raw_path.open("w", newline="")
+        self._raw_writer = csv.writer(self._raw_file)
+        self._raw_writer.writerow(["timestamped_line"])
+        self._clean_file = None
+        self._clean_writer = None
+        self._npy = None
+
+    @property
+    def clean_path(self) -> Path:
+        return next(iter(self.clean_paths.values()))
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    def write(self, entry: str) -> None:
+        match = CLEAN_PATTERN.search(entry)
+        self.write_parsed(entry, match.groups() if match else None)
+
+    def write_parsed(self, entry: str, row: tuple[str, ...] | None) -> None:
+        """
+        Buffer a raw line together with its already-parsed CLEAN row, if any.
+        """
+        self._buffer.append((entry, row))
+        if (
+            len(self._buffer) >= self.buffer_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered lines to disk and sync both files.
+        """
+        if self._buffer:
+            self._raw_writer.writerows([entry] for entry, _ in self._buffer)
+            rows = [row for _, row in self._buffer if row is not None]
+
+            if rows:
+                if self._rows_written == 0:
+                    self._open_clean()
+                if self._clean_writer is not None:
+                    self._clean_writer.writerows(rows)
+                if self._npy is not None:
+                    self._npy.append(rows_to_array(rows))
+                self._rows_written += len(rows)
+            self._buffer.clear()
+
+        for f in (self._raw_file, self._clean_file, self._npy):
+            if f is not None and not f.closed:
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+        self._last_flush = time.monotonic()
+
+    def close(self) -> tuple[Path, Path | None]:
+        """
+        Flush remaining lines and close all files.
+
+        Returns:
+            (raw_csv_path, clean_path), the latter None if no structured
+            sensor data was seen. clean_path is the first requested format.
+        """
+        self.flush()
+        self._raw_file.close()
+        logging.info(f"Saved raw log to {self.raw_path.resolve()}")
+
+        if self._rows_written == 0:
+            logging.warning("No valid structured sensor data found.")
+            return self.raw_path, None
+
+        for f in (self._clean_file, self._npy):
+            if f is not None:
+                f.close()
+        for path in self.clean_paths.values():
+            logging.info(f"Saved clean log to {path.resolve()}")
+        return self.raw_path, self.clean_path
+
+    def _open_clean(self) -> None:
+        if "csv" in self.clean_paths:
+            self._clean_file = self.clean_paths["csv"].open("w", newline="")
+            self._clean_writer = csv.writer(self._clean_file)
+            self._clean_writer.writerow(CLEAN_HEADER)
+        if "npy" in self.clean_paths:
+            self._npy = NpyAppender(self.clean_paths["npy"])
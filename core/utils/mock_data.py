@@ -1,6 +1,26 @@
 import random
+import re
 import time
+import zlib
 from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from core.utils.storage import TRIAL_DTYPE, save_clean_trial
+
+SENSOR_NAMES = ("A", "B", "C", "D")
+# Resting level and noise (std) per sensor, matching `generate_mock_data`
+BASELINE = np.array([30000.0, 30000.0, 50.0, 25000.0])
+NOISE = np.array([1150.0, 1150.0, 6.0, 580.0])
+# Reading added at full press directly over a sensor
+PRESS_GAIN = 25000.0
+LUMP_GAIN = 1.4
+# Sensors A-D sit at the centres of quadrants Q1-Q4 (Q2 Q1 / Q3 Q4 layout)
+SENSOR_POSITIONS = np.array([[1.0, 1.0], [0.0, 1.0], [0.0, 0.0], [1.0, 0.0]])
+SPREAD = 0.6
+MAX_RATE = 50_000.0
+TRIAL_NAME = re.compile(r"TRIAL_\d+_LOC_(\d+)_(LUMP|NOLUMP)")
 
 
 def generate_mock_data():
@@ -14,3 +34,149 @@ def generate_mock_data():
     val3 = random.randint(40, 60)
     val4 = random.randint(24000, 26000)
     return f"[{timestamp}] {time_sec} | {val1} | {val2} | {val3} | {val4}"
+
+
+def press_profile(
+    t: np.ndarray, period: float = 2.0, duty: float = 0.6, ramp: float = 0.15
+) -> np.ndarray:
+    """
+    Repeating press/release envelope between 0 (released) and 1 (pressed).
+
+    Each `period` starts with a raised-cosine press of `ramp * period`
+    seconds, holds until `duty * period`, releases over the same ramp and
+    rests for the remainder.
+    """
+    phase = np.mod(t, period) / period
+    rise = 0.5 - 0.5 * np.cos(np.pi * phase / ramp)
+    fall = 0.5 + 0.5 * np.cos(np.pi * (phase - duty) / ramp)
+    return np.select(
+        [phase < ramp, phase < duty, phase < duty + ramp],
+        [rise, 1.0, fall],
+        default=0.0,
+    )
+
+
+def spatial_weights(location: int, condition: str) -> np.ndarray:
+    """
+    Share of the press each sensor sees when pressing at `location`.
+
+    Pressure falls off with distance from the pressed quadrant; with a
+    LUMP the sensor under the pressed quadrant reads higher.
+    """
+    pressed = SENSOR_POSITIONS[(location - 1) % len(SENSOR_POSITIONS)]
+    distance2 = np.square(SENSOR_POSITIONS - pressed).sum(axis=1)
+    weights = np.exp(-distance2 / (2 * SPREAD**2))
+    if condition == "LUMP":
+        weights[distance2 == 0] *= LUMP_GAIN
+    return weights
+
+
+class MockSignalEngine:
+    """
+    Seeded, vectorized generator of A/B/C/D pressure samples.
+
+    Samples are produced in NumPy blocks at `rate` Hz (up to 50 kHz), so the
+    acquisition, storage and analysis paths can be exercised at production
+    rates without hardware. The same seed and trial always give the same
+    samples.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1000.0,
+        seed: int = 0,
+        location: int = 1,
+        condition: str = "NOLUMP",
+        period: float = 2.0,
+        duty: float = 0.6,
+    ):
+        if not 0 < rate <= MAX_RATE:
+            raise ValueError(f"rate must be in (0, {MAX_RATE:g}] Hz, got {rate}")
+        self.rate = rate
+        self.seed = seed
+        self.period = period
+        self.duty = duty
+        self.configure(location, condition)
+
+    @property
+    def emitted(self) -> int:
+        """Number of samples generated so far."""
+        return self._next
+
+    def configure(
+        self, location: int, condition: str, trial: str | None = None
+    ) -> None:
+        """
+        Set the pressed location and condition and restart the signal.
+
+        Args:
+            location (int): Pressed location; locations map onto Q1-Q4.
+            condition (str): "LUMP" or "NOLUMP".
+            trial (str | None): Trial name mixed into the seed, so each trial
+                gets its own reproducible noise.
+        """
+        self.location = location
+        self.condition = condition
+        self.weights = spatial_weights(location, condition)
+        entropy = (
+            [self.seed] if trial is None else [self.seed, zlib.crc32(trial.encode())]
+        )
+        self._rng = np.random.default_rng(entropy)
+        self._next = 0
+
+    def configure_for(self, file_stem: str) -> None:
+        """
+        Configure from a trial name like `TRIAL_1_LOC_2_LUMP`; other names
+        only reseed the signal.
+        """
+        match = TRIAL_NAME.search(file_stem)
+        if match:
+            self.configure(int(match.group(1)), match.group(2), trial=file_stem)
+        else:
+            self.configure(self.location, self.condition, trial=file_stem)
+
+    def block(self, count: int) -> np.ndarray:
+        """
+        Generate the next `count` samples as TRIAL_DTYPE records.
+        """
+        index = self._next + np.arange(count, dtype=np.float64)
+        self._next += count
+        t = index / self.rate
+
+        envelope = press_profile(t, self.period, self.duty)
+        values = BASELINE + np.outer(envelope, self.weights * PRESS_GAIN)
+        values += self._rng.standard_normal((count, len(SENSOR_NAMES))) * NOISE
+        values = np.clip(np.rint(values), 0, np.iinfo(np.uint16).max)
+
+        records = np.empty(count, dtype=TRIAL_DTYPE)
+        records["Time(s)"] = t
+        for column, name in enumerate(SENSOR_NAMES):
+            records[name] = values[:, column]
+        return records
+
+    def generate(self, duration: float) -> np.ndarray:
+        """
+        Generate `duration` seconds of samples in one block.
+        """
+        return self.block(int(round(duration * self.rate)))
+
+
+def write_mock_experiment(
+    directory: Path | str,
+    names: list[str],
+    samples: int,
+    fmt: str = "csv",
+    engine: MockSignalEngine | None = None,
+) -> Path:
+    """
+    Write one synthetic CLEAN trial of `samples` samples per trial name, in
+    the layout the logger produces.
+
+    Returns:
+        Path: The experiment directory.
+    """
+    engine = engine or MockSignalEngine()
+    for name in names:
+        engine.configure_for(name)
+        save_clean_trial(directory, name, engine.block(samples), fmt)
+    return Path(directory)
@@ -0,0 +1,171 @@
+import struct
+from pathlib import Path
+
+import numpy as np
+
+TRIAL_DTYPE = np.dtype(
+    [("Time(s)", "<f4"), ("A", "<u2"), ("B", "<u2"), ("C", "<u2"), ("D", "<u2")]
+)
+CLEAN_FORMATS = ("csv", "npy")
+
+# Fixed header size so the record count can be patched in place on close.
+_NPY_HEADER_SIZE = 256
+
+
+def rows_to_array(rows) -> np.ndarray:
+    """
+    Convert parsed (Time(s), A, B, C, D) rows into a typed record array.
+
+    Args:
+        rows: Sequence of 5-tuples of strings or numbers.
+
+    Returns:
+        np.ndarray: Structured array with TRIAL_DTYPE.
+    """
+    values = np.asarray(rows, dtype=np.float64).reshape(-1, len(TRIAL_DTYPE))
+    array = np.empty(len(values), dtype=TRIAL_DTYPE)
+    for i, name in enumerate(TRIAL_DTYPE.names):
+        array[name] = values[:, i]
+    return array
+
+
+def _npy_header(count: int) -> bytes:
+    header = {
+        "descr": np.lib.format.dtype_to_descr(TRIAL_DTYPE),
+        "fortran_order": False,
+        "shape": (count,),
+    }
+    prefix_size = len(np.lib.format.MAGIC_PREFIX) + 2 + 2
+    text = repr(header).encode("latin1")
+    text = text.ljust(_NPY_HEADER_SIZE - prefix_size - 1) + b"\n"
+    return np.lib.format.MAGIC_PREFIX + bytes([1, 0]) + struct.pack("<H", len(text)) + text
+
+
+class NpyAppender:
+    """
+    Append TRIAL_DTYPE records to a .npy file without holding them in memory.
+
+    The header is rewritten with the final record count on close, after which
+    the file can be opened with `np.load(path, mmap_mode="r")`.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.count = 0
+        self._file = self.path.open("wb")
+        self._file.write(_npy_header(0))
+
+    def append(self, records: np.ndarray) -> None:
+        records = np.ascontiguousarray(records, dtype=TRIAL_DTYPE)
+        self._file.write(records.tobytes())
+        self.count += len(records)
+        self._file.seek(0)
+        self._file.write(_npy_header(self.count))
+        self._file.seek(0, 2)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def save_trial_npy(path: Path | str, records: np.ndarray) -> Path:
+    """
+    Write a complete trial as a memory-mappable .npy file.
+    """
+    path = Path(path)
+    appender = NpyAppender(path)
+    appender.append(records)
+    appender.close()
+    return path
+
+
+def save_clean_trial(
+    directory: Path | str, name: str, records: np.ndarray, fmt: str = "csv"
+) -> Path:
+    """
+    Write records as `<directory>/<name>/CLEAN_<name>.<fmt>`, the layout the
+    logger produces.
+
+    Args:
+        directory (Path | str): Experiment directory.
+        name (str): Trial name, e.g. "TRIAL_1_LOC_1_LUMP".
+        records (np.ndarray): Structured array with TRIAL_DTYPE.
+        fmt (str): "csv" or "npy".
+
+    Returns:
+        Path: The written file.
+    """
+    trial_dir = Path(directory) / name
+    trial_dir.mkdir(parents=True, exist_ok=True)
+    path = trial_dir / f"CLEAN_{name}.{fmt}"
+    if fmt == "npy":
+        return save_trial_npy(path, records)
+    np.savetxt(
+        path,
+        np.column_stack([records[c] for c in TRIAL_DTYPE.names]),
+        fmt=["%.3f", "%d", "%d", "%d", "%d"],
+        delimiter=",",
+        header=",".join(TRIAL_DTYPE.names),
+        comments="",
+    )
+    return path
+
+
+def load_trial(path: Path | str, mmap: bool = True) -> np.ndarray:
+    """
+    Load a CLEAN trial file as a TRIAL_DTYPE record array.
+
+    Args:
+        path (Path | str): A CLEAN_*.npy or CLEAN_*.csv file.
+        mmap (bool): Memory-map .npy files instead of reading them.
+
+    Returns:
+        np.ndarray: Structured array with TRIAL_DTYPE.
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        array = np.load(path, mmap_mode="r" if mmap else None)
+        if array.dtype != TRIAL_DTYPE:
+            raise ValueError(f"Unexpected dtype {array.dtype} in {path}")
+        return array
+
+    with path.open("r", encoding="utf-8") as f:
+        header = f.readline().strip().split(",")
+        if header != list(TRIAL_DTYPE.names):
+            raise ValueError(f"Unexpected columns {header} in {path}")
+        lines = f.read().splitlines()
+
+    if not lines:
+        return np.empty(0, dtype=TRIAL_DTYPE)
+    return rows_to_array(np.loadtxt(lines, delimiter=",", ndmin=2))
+
+
+def find_clean_files(directory: Path | str) -> list[Path]:
+    """
+    Recursively find CLEAN trial files, preferring .npy over .csv per trial.
+
+    Args:
+        directory (Path | str): Experiment directory to search.
+
+    Returns:
+        list[Path]: One file per trial, sorted by path.
+    """
+    found: dict[Path, Path] = {}
+    for path in sorted(Path(directory).rglob("CLEAN_*")):
+        suffix = path.suffix.lstrip(".")
+        if suffix not in CLEAN_FORMATS:
+            continue
+        key = path.with_suffix("")
+        current = found.get(key)
+        if current is None or suffix == "npy":
+            found[key] = path
+    return sorted(found.values())
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from core.utils.mock_data import MockSignalEngine, write_mock_experiment
+from core.utils.storage import rows_to_array, save_clean_trial
+
+
+@pytest.fixture
+def write_trial():
+    """
+    Write one CLEAN trial into an experiment directory.
+
+    The trial's data is a TRIAL_DTYPE array, a list of (Time(s), A, B, C, D)
+    rows, or a number of samples to generate with the mock engine.
+    """
+
+    def write(directory, name, data, fmt="csv"):
+        if isinstance(data, int):
+            engine = MockSignalEngine()
+            engine.configure_for(name)
+            data = engine.block(data)
+        elif not isinstance(data, np.ndarray):
+            data = rows_to_array(data)
+        return save_clean_trial(directory, name, data, fmt)
+
+    return write
+
+
+@pytest.fixture
+def make_experiment():
+    """
+    Write a mock experiment, one CLEAN trial per name; see
+    `write_mock_experiment`.
+    """
+    return write_mock_experiment
@@ -0,0 +1,116 @@
+import json
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from core.cli.acquire import main
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run(tmp_path, *extra):
+    return main(
+        [
+            "--directory",
+            "Campaign",
+            "--locations",
+            "2",
+            "--conditions",
+            "LUMP",
+            "--duration",
+            "0.2",
+            "--delay",
+            "0",
+            "--mock",
+            "--data-directory",
+            str(tmp_path),
+            *extra,
+        ]
+    )
+
+
+def test_campaign_runs_grid_and_writes_manifest(tmp_path):
+    """
+    Test that the CLI logs every trial of the grid in mock mode and records
+    each one in the manifest.
+    """
+    assert run(tmp_path) == 0
+    base_dir = tmp_path / "Campaign"
+    manifest = json.loads((base_dir / "manifest.json").read_text())
+    assert manifest["finished"] is True
+    assert manifest["config"]["lump_options"] == ["LUMP"]
+    assert manifest["settings"]["USE_MOCK"] is True
+
+    names = [entry["name"] for entry in manifest["trials"]]
+    assert names == ["TRIAL_1_LOC_1_LUMP", "TRIAL_1_LOC_2_LUMP"]
+    for entry in manifest["trials"]:
+        assert entry["status"] == "done"
+        assert entry["metrics"][entry["name"]]["samples"] > 0
+        assert (base_dir / entry["name"] / f"CLEAN_{entry['name']}.csv").is_file()
+
+
+def test_campaign_resumes_from_manifest(tmp_path):
+    """
+    Test that a rerun only logs trials the manifest does not list as done.
+    """
+    assert run(tmp_path) == 0
+    manifest_path = tmp_path / "Campaign" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["trials"][1]["status"] = "failed"
+    first_started = manifest["trials"][0]["started"]
+    manifest_path.write_text(json.dumps(manifest))
+
+    assert run(tmp_path, "--trials", "1") == 0
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["trials"][0]["started"] == first_started
+    assert manifest["trials"][1]["status"] == "done"
+
+
+def test_campaign_requires_directory(tmp_path):
+    """
+    Test that a missing directory name is a usage error.
+    """
+    with pytest.raises(SystemExit):
+        main(["--mock", "--data-directory", str(tmp_path)])
+
+
+def test_ctrl_c_stops_campaign_and_resume_reruns_trial(tmp_path):
+    """
+    Test that SIGINT during a trial ends the campaign with exit code 130 and
+    records the trial as interrupted, so the next run logs it again.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-u", "-m", "core.cli.acquire", "--directory", "Campaign"]
+        + ["--locations", "2", "--conditions", "LUMP", "--duration", "30"]
+        + ["--delay", "0", "--mock", "--data-directory", str(tmp_path)],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for line in process.stdout:
+            if "logging" in line:
+                break
+        time.sleep(0.5)
+        process.send_signal(signal.SIGINT)
+        process.communicate(timeout=20)
+    finally:
+        process.kill()
+    assert process.returncode == 130
+
+    manifest_path = tmp_path / "Campaign" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["finished"] is False
+    assert [(e["name"], e["status"]) for e in manifest["trials"]] == [
+        ("TRIAL_1_LOC_1_LUMP", "interrupted")
+    ]
+
+    assert run(tmp_path) == 0
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["finished"] is True
+    assert [e["status"] for e in manifest["trials"]] == ["done", "done"]
@@ -0,0 +1,108 @@
+import csv
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from core.analysis.alignment import (
+    align_trial_files,
+    average_aligned,
+    estimate_clock,
+    find_aligned_files,
+    resample,
+    unwrap_device_time,
+)
+
+
+def write_raw(path, host_s, device_s, values):
+    origin = datetime(2025, 1, 1, 12)
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamped_line"])
+        for host, device, value in zip(host_s, device_s, values):
+            stamp = (origin + timedelta(seconds=float(host))).strftime("%H:%M:%S.%f")
+            writer.writerow([f"[{stamp}] {device:.3f} | {value} | 0 | 0 | {value}"])
+
+
+def test_estimate_clock_recovers_offset_and_drift():
+    """
+    Test that the lower-envelope fit ignores batched, delayed host stamps.
+    """
+    rng = np.random.default_rng(0)
+    device_s = np.arange(0, 60, 0.01)
+    true_host = 5.0 + (1 + 2e-4) * device_s
+    # Lines arrive in batches of 10 and are stamped when the batch is read
+    host_s = np.repeat(true_host[9::10], 10) + rng.uniform(0, 0.02, len(device_s))
+
+    offset, drift = estimate_clock(device_s, host_s)
+
+    assert abs(offset - 5.0) < 0.01
+    assert abs(drift - 2e-4) < 5e-5
+
+
+def test_resample_onto_shared_grid():
+    """
+    Test that device clock restarts are bridged and values are interpolated
+    onto grid points at whole multiples of 1 / rate.
+    """
+    host_s = np.array([0.0, 0.1, 0.2, 0.3])
+    device = np.array([58.0, 58.1, 0.05, 0.15])
+    assert np.allclose(unwrap_device_time(device, host_s), [58.0, 58.1, 58.2, 58.3])
+
+    values = np.column_stack([np.arange(0, 1, 0.1), *[np.arange(10)] * 4])
+    aligned = resample(np.arange(0, 1, 0.1) + 0.005, values, rate=20)
+
+    assert np.allclose(aligned["time"] * 20, np.round(aligned["time"] * 20))
+    assert np.allclose(aligned["D"], (aligned["time"] - 0.005) * 10, atol=1e-4)
+
+
+def test_align_trial_files_and_average(tmp_path):
+    """
+    Test aligning per-device RAW logs and averaging aligned trials per condition.
+    """
+    device_s = np.arange(0, 2, 0.01)
+    for trial, value in [("TRIAL_1_LOC_1_LUMP", 100), ("TRIAL_2_LOC_1_LUMP", 300)]:
+        trial_dir = tmp_path / trial
+        trial_dir.mkdir()
+        write_raw(
+            trial_dir / f"RAW_{trial}_DEV0.csv",
+            device_s + 0.5,
+            device_s,
+            [value] * len(device_s),
+        )
+
+    paths = align_trial_files(tmp_path / "TRIAL_1_LOC_1_LUMP", "TRIAL_1_LOC_1_LUMP")
+    assert [p.name for p in paths] == ["ALIGNED_TRIAL_1_LOC_1_LUMP_DEV0.npz"]
+    align_trial_files(tmp_path / "TRIAL_2_LOC_1_LUMP", "TRIAL_2_LOC_1_LUMP")
+
+    average = average_aligned(find_aligned_files(tmp_path), "D")
+    assert list(average.columns) == ["LUMP Q1"]
+    assert np.allclose(average["LUMP Q1"], 200)
+    assert average.index[1] == 0.01
+
+
+def test_average_aligned_by_location_over_unequal_trials(tmp_path):
+    """
+    Test that locations are averaged separately and that a shorter trial only
+    drops out of the points it does not reach.
+    """
+    trials = [
+        ("TRIAL_1_LOC_1_LUMP", [100.0] * 4),
+        ("TRIAL_2_LOC_1_LUMP", [300.0] * 2),
+        ("TRIAL_1_LOC_2_LUMP", [50.0] * 3),
+        ("TRIAL_1_LOC_1_NOLUMP", [10.0] * 2),
+    ]
+    for trial, values in trials:
+        np.savez(
+            tmp_path / f"ALIGNED_{trial}.npz",
+            time=np.arange(len(values)) / 10,
+            D=np.array(values, dtype=np.float32),
+            rate=np.float64(10),
+        )
+
+    average = average_aligned(find_aligned_files(tmp_path), "D")
+
+    assert list(average.columns) == ["LUMP Q1", "LUMP Q2", "NOLUMP Q1"]
+    assert np.allclose(average.index, [0, 0.1, 0.2, 0.3])
+    assert np.allclose(average["LUMP Q1"], [200, 200, 100, 100])
+    assert np.allclose(average["LUMP Q2"], [50, 50, 50, np.nan], equal_nan=True)
+    assert np.allclose(average["NOLUMP Q1"].iloc[:2], 10)
@@ -0,0 +1,23 @@
+from benchmarks.run import compare
+
+
+def test_compare_flags_regressions_in_the_right_direction():
+    """
+    Test that slower rates and longer times beyond the tolerance are regressions.
+    """
+    baseline = {
+        "rate": {"value": 100.0, "unit": "rows/s", "higher_is_better": True},
+        "time": {"value": 1.0, "unit": "s", "higher_is_better": False},
+        "zero": {"value": 0.0, "unit": "s", "higher_is_better": False},
+    }
+    results = {
+        "rate": {"value": 60.0, "unit": "rows/s", "higher_is_better": True},
+        "time": {"value": 0.5, "unit": "s", "higher_is_better": False},
+        "zero": {"value": 5.0, "unit": "s", "higher_is_better": False},
+        "new": {"value": 1.0, "unit": "s", "higher_is_better": False},
+    }
+
+    assert compare(results, baseline, tolerance=0.3) == ["rate"]
+    results["time"]["value"] = 1.5
+    assert compare(results, baseline, tolerance=0.3) == ["rate", "time"]
+    assert compare(results, baseline, tolerance=1.0) == []
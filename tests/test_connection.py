@@ -0,0 +1,91 @@
+import threading
+import time
+
+import serial
+
+from core.hardware.connection import DeviceManager, sync_devices
+from core.logging.logger import VernierFSRLogger
+
+
+def test_device_connection_is_reused_across_trials(tmp_path):
+    """
+    Test that consecutive loggers share one open port and leave it open.
+    """
+    device = DeviceManager(port="loop://", timeout=0.05, reset_delay=0)
+    connection = device.connect()
+
+    for trial in range(2):
+        logger = VernierFSRLogger(device=device, stream=True)
+        device.connect().write(b"0.100 | 31085 | 29010 | 50 | 25444\n")
+        _, clean_path = logger.run(0.1, save_dir=tmp_path, file_stem=f"t{trial}")
+
+        assert clean_path is not None
+        assert device.connect() is connection
+        assert device.is_open
+
+    device.close()
+    assert not device.is_open
+
+
+def test_device_write_reconnects_on_error():
+    """
+    Test that a failed write reopens the port and retries once.
+    """
+    device = DeviceManager(port="loop://", timeout=0.05, reset_delay=0)
+    broken = device.connect()
+
+    def fail(data):
+        raise serial.SerialException("device disconnected")
+
+    broken.write = fail
+    device.write(b"s")
+
+    assert device.connect() is not broken
+    assert device.connect().read(1) == b"s"
+
+
+def test_bulk_reader_keeps_every_line(tmp_path, capsys):
+    """
+    Test that a burst of lines split across reads is captured completely,
+    with sub-second host timestamps and no console echo.
+    """
+    device = DeviceManager(port="loop://", timeout=0.05, reset_delay=0)
+    logger = VernierFSRLogger(device=device, stream=True, echo=False)
+    burst = b"".join(b"%.3f | 1 | 2 | 3 | %d\n" % (i / 1000, i) for i in range(2000))
+
+    def feed():
+        # Wait for the looped-back start command, then feed the bounded
+        # loopback queue while the reader drains it
+        while logger.phase != "logging":
+            time.sleep(0.001)
+        device.connect().write(b"\n" + burst)
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    raw_path, clean_path = logger.run(1.0, save_dir=tmp_path, file_stem="burst")
+    feeder.join(timeout=5)
+
+    assert not feeder.is_alive()
+    rows = clean_path.read_text().splitlines()[1:]
+    assert [int(row.rsplit(",", 1)[1]) for row in rows] == list(range(2000))
+    assert raw_path.read_text().splitlines()[1].startswith("[")
+    assert "." in raw_path.read_text().splitlines()[1].split("]")[0]
+    assert capsys.readouterr().out == ""
+
+
+def test_sync_devices_follows_plugged_ports():
+    """
+    Test that syncing adds managers for new ports, keeps existing ones and
+    closes the ones whose port disappeared.
+    """
+    devices = {}
+    assert sync_devices(devices, []) == []
+
+    first = sync_devices(devices, ["loop://"])
+    assert [d.port for d in first] == ["loop://"]
+    connection = first[0].connect()
+    assert sync_devices(devices, ["loop://"])[0] is first[0]
+
+    assert sync_devices(devices, []) == []
+    assert devices == {}
+    assert not connection.is_open
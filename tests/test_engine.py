@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+
+from core.analysis.engine import analyze_archive, analyze_experiment
+from core.analysis.stats import variability
+from core.cli.analyze import main
+from core.utils.storage import find_clean_files, load_trial
+
+TRIALS = ("TRIAL_1_LOC_1_LUMP", "TRIAL_1_LOC_2_NOLUMP")
+
+
+def test_analyze_experiment_matches_loaded_data(tmp_path, make_experiment):
+    """
+    Test that the engine's summary pools every sample of a quadrant.
+    """
+    make_experiment(tmp_path, TRIALS, 500, "npy")
+    report = analyze_experiment(tmp_path)
+    lump = load_trial(find_clean_files(tmp_path)[0])["D"]
+
+    assert report.trials == 2
+    assert report.summary.loc[("LUMP", "Q1", "D"), "avg"] == round(lump.mean(), 1)
+    assert report.variability("D").equals(variability(report.summary, "D"))
+    title, grid = report.panels("D")[0]
+    assert title == "LUMP - Sensor D" and not np.isnan(grid[0][1])
+
+
+def test_analyze_archive_writes_reports_in_parallel(tmp_path, make_experiment):
+    """
+    Test that every experiment of an archive gets its reports from a process
+    pool, and directories without trials are skipped.
+    """
+    make_experiment(tmp_path / "Alpha", TRIALS, 500, "npy")
+    make_experiment(tmp_path / "Beta", ["TRIAL_2_LOC_3_LUMP"], 500, "npy")
+    (tmp_path / "Empty").mkdir()
+
+    outcomes = analyze_archive(tmp_path, workers=2, sensors=("D",))
+    assert [o["status"] for o in outcomes] == ["done", "done"]
+    assert [o["trials"] for o in outcomes] == [2, 1]
+
+    report_dir = tmp_path / "Alpha" / "report"
+    for name in ("summary.csv", "variability.csv", "heatmap_D.png", "report.json"):
+        assert (report_dir / name).is_file()
+    report = json.loads((report_dir / "report.json").read_text())
+    assert report["experiment"] == "Alpha"
+    assert {row["condition"] for row in report["variability"]} == {"LUMP", "NOLUMP"}
+    summary = json.loads((tmp_path / "analysis_summary.json").read_text())
+    assert len(summary["experiments"]) == 2
+
+
+def test_analyze_cli_output_directory(tmp_path, make_experiment, capsys):
+    """
+    Test that the CLI writes reports for named experiments to --output.
+    """
+    experiment = make_experiment(tmp_path / "data" / "Alpha", TRIALS, 500, "npy")
+    out = tmp_path / "reports"
+    assert main([str(experiment), "--output", str(out), "--sensors", "A"]) == 0
+    assert (out / "Alpha" / "heatmap_A.png").is_file()
+    assert "done" in capsys.readouterr().out
+
+
+def test_analyze_cli_named_experiments_in_parallel(tmp_path, make_experiment):
+    """
+    Test that named experiments go through the process pool and get an
+    archive summary in --root.
+    """
+    root = tmp_path / "data"
+    alpha = make_experiment(root / "Alpha", TRIALS, 500, "npy")
+    beta = make_experiment(root / "Beta", TRIALS[:1], 500, "npy")
+    make_experiment(root / "Gamma", TRIALS[:1], 500, "npy")
+
+    args = [str(alpha), str(beta), "--root", str(root), "--workers", "2"]
+    assert main([*args, "--sensors", "D"]) == 0
+    summary = json.loads((root / "analysis_summary.json").read_text())
+    assert [o["experiment"] for o in summary["experiments"]] == [str(alpha), str(beta)]
+    assert (beta / "report" / "heatmap_D.png").is_file()
+    assert not (root / "Gamma" / "report").exists()
@@ -0,0 +1,40 @@
+import math
+
+import matplotlib.pyplot as plt
+
+from core.analysis.heatmap import heatmap_png, heatmap_spec, quadrant_grid
+
+
+def test_quadrant_grid_uses_board_layout():
+    """
+    Test that quadrants are placed Q2 Q1 / Q3 Q4 and missing ones are NaN.
+    """
+    grid = quadrant_grid({"Q1": 1.0, "Q2": 2.0, "Q3": 3.0})
+    assert grid[0] == (2.0, 1.0)
+    assert grid[1][0] == 3.0 and math.isnan(grid[1][1])
+
+
+def test_heatmap_png_leaves_no_figures_open():
+    """
+    Test that heatmaps render to PNG without leaving pyplot figures open.
+    """
+    panels = (
+        ("LUMP - Sensor D", quadrant_grid({"Q1": 100.0, "Q2": 200.0})),
+        ("NOLUMP - Sensor D", quadrant_grid({"Q3": 300.0, "Q4": 400.0})),
+    )
+    png = heatmap_png(panels, 0.0, 60000.0)
+    assert png.startswith(b"\x89PNG")
+    assert plt.get_fignums() == []
+
+
+def test_heatmap_spec_is_json_safe():
+    """
+    Test that the Vega-Lite spec carries the colour range and no NaN values.
+    """
+    panels = (("LUMP - Sensor D", quadrant_grid({"Q1": 5.0})),)
+    spec = heatmap_spec(panels, 10.0, 20.0)
+    values = spec["data"]["values"]
+    assert len(values) == 4
+    assert {v["quadrant"]: v["value"] for v in values}["Q2"] is None
+    color = spec["spec"]["layer"][0]["encoding"]["color"]
+    assert color["scale"]["domain"] == [10.0, 20.0]
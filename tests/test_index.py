@@ -0,0 +1,94 @@
+import weakref
+
+import numpy as np
+
+import core.analysis.index as index_module
+from core.analysis.index import INDEX_FILENAME, ExperimentIndex
+from core.analysis.sketch import QuantileSketch
+
+
+def d_rows(d_values):
+    return [(i * 0.01, 1, 2, 3, d) for i, d in enumerate(d_values)]
+
+
+def test_quantile_sketch_merge_error_bound():
+    """
+    Test that merged sketches stay within half a bin of the exact quantile.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.integers(20000, 30000, 10001)
+    left, right = QuantileSketch(), QuantileSketch()
+    left.update(values[:4000])
+    right.update(values[4000:])
+    left.merge(right)
+
+    assert left.count == len(values)
+    for q in (0.0, 0.25, 0.5, 0.9, 1.0):
+        assert abs(left.quantile(q) - np.quantile(values, q)) <= left.bin_width / 2
+
+
+def test_index_only_reads_changed_trials(tmp_path, write_trial):
+    """
+    Test that a second update reuses unchanged trials and drops removed ones.
+    """
+    first = write_trial(tmp_path, "TRIAL_1_LOC_1_LUMP", d_rows([100, 200]))
+    write_trial(tmp_path, "TRIAL_2_LOC_1_LUMP", d_rows([300]))
+
+    index = ExperimentIndex.load(tmp_path)
+    assert len(index.update()) == 2
+    assert (tmp_path / INDEX_FILENAME).is_file()
+
+    index = ExperimentIndex.load(tmp_path)
+    assert index.update() == []
+
+    write_trial(tmp_path, "TRIAL_3_LOC_2_NOLUMP", d_rows([500, 700]))
+    first.unlink()
+    assert index.update() == ["TRIAL_3_LOC_2_NOLUMP/CLEAN_TRIAL_3_LOC_2_NOLUMP.csv"]
+    assert len(index.trials) == 2
+
+
+def test_index_summary_pools_trials(tmp_path, write_trial):
+    """
+    Test that merged aggregates equal statistics over all pooled samples.
+    """
+    write_trial(tmp_path, "TRIAL_1_LOC_1_LUMP", d_rows([100, 200, 600]))
+    write_trial(tmp_path, "TRIAL_2_LOC_1_LUMP", d_rows([300, 1000]))
+    index = ExperimentIndex.load(tmp_path)
+    index.update()
+
+    row = index.summary(decimals=None).loc[("LUMP", "Q1", "D")]
+    pooled = np.array([100, 200, 600, 300, 1000])
+    assert row["count"] == 5
+    assert row["avg"] == pooled.mean()
+    assert np.isclose(row["std"], pooled.std(ddof=1))
+    assert abs(row["median"] - np.median(pooled)) <= 8
+    assert (row["min"], row["max"]) == (100, 1000)
+
+
+def test_index_cold_build_reads_in_batches(tmp_path, write_trial, monkeypatch):
+    """
+    Test that a cold index build reads at most READ_BATCH trials per call and
+    releases each batch's samples before reading the next one.
+    """
+    for trial_no in range(1, 6):
+        write_trial(tmp_path, f"TRIAL_{trial_no}_LOC_1_LUMP", 200)
+    monkeypatch.setattr(index_module, "READ_BATCH", 2)
+
+    batches, alive = [], []
+    read_trials = index_module.read_trials
+
+    def tracking_read(data_directory, files, *args):
+        alive.append(sum(ref() is not None for ref in refs))
+        batches.append(len(files))
+        results = read_trials(data_directory, files, *args)
+        refs.extend(weakref.ref(records) for _, _, records, _ in results)
+        return results
+
+    refs = []
+    monkeypatch.setattr(index_module, "read_trials", tracking_read)
+    index = ExperimentIndex.load(tmp_path)
+    assert len(index.update()) == 5
+
+    assert batches == [2, 2, 1]
+    assert alive == [0, 0, 0]
+    assert index.summary(decimals=None).loc[("LUMP", "Q1", "D"), "count"] == 1000
@@ -0,0 +1,63 @@
+import numpy as np
+
+from core.analysis.loader import file_signature, parse_trial_name, read_trials
+from core.utils.storage import TRIAL_DTYPE, find_clean_files
+
+
+def test_parse_trial_name():
+    """
+    Test metadata extraction from CLEAN filenames in both formats.
+    """
+    assert parse_trial_name("CLEAN_TRIAL_3_LOC_2_NOLUMP.npy") == (3, 2, "NOLUMP")
+    assert parse_trial_name("CLEAN_TRIAL_1_LOC_1_LUMP.csv") == (1, 1, "LUMP")
+    assert parse_trial_name("CLEAN_other.csv") is None
+
+
+def test_read_trials_parses_metadata_and_reports_errors(tmp_path, write_trial):
+    """
+    Test that each trial is read into typed records with its metadata, and
+    unexpected files are reported instead of raised.
+    """
+    write_trial(tmp_path, "TRIAL_1_LOC_1_LUMP", [(0.1, 1, 2, 3, 4), (0.2, 5, 6, 7, 8)])
+    write_trial(tmp_path, "TRIAL_1_LOC_2_NOLUMP", [(0.1, 9, 9, 9, 9)])
+    (tmp_path / "CLEAN_unexpected.csv").write_text("Time(s),A,B,C,D\n")
+
+    results = read_trials(tmp_path, find_clean_files(tmp_path))
+
+    assert [(path, parsed, error) for path, parsed, _, error in results] == [
+        ("CLEAN_unexpected.csv", None, "Regex mismatch"),
+        ("TRIAL_1_LOC_1_LUMP/CLEAN_TRIAL_1_LOC_1_LUMP.csv", (1, 1, "LUMP"), None),
+        ("TRIAL_1_LOC_2_NOLUMP/CLEAN_TRIAL_1_LOC_2_NOLUMP.csv", (1, 2, "NOLUMP"), None),
+    ]
+    records = results[1][2]
+    assert records.dtype == TRIAL_DTYPE
+    assert records["D"].tolist() == [4, 8]
+
+
+def test_file_signature_changes_with_content(tmp_path, write_trial):
+    """
+    Test that rewriting a trial changes its cache signature.
+    """
+    path = write_trial(tmp_path, "TRIAL_1_LOC_1_LUMP", [(0.1, 1, 2, 3, 4)])
+    before = file_signature([path])
+    path.write_text("Time(s),A,B,C,D\n0.1,1,2,3,4\n0.2,1,2,3,4\n")
+    assert file_signature([path]) != before
+
+
+def test_read_trials_parallel_matches_sequential(tmp_path, write_trial):
+    """
+    Test that thread and process pools return trials in file order.
+    """
+    for trial in range(1, 4):
+        for loc in range(1, 3):
+            rows = [(0.1 * i, trial, loc, i, i * 10) for i in range(5)]
+            write_trial(tmp_path, f"TRIAL_{trial}_LOC_{loc}_LUMP", rows)
+
+    files = find_clean_files(tmp_path)
+    expected = read_trials(tmp_path, files)
+    for executor in ("thread", "process"):
+        results = read_trials(tmp_path, files, workers=3, executor=executor)
+        assert [r[:2] for r in results] == [r[:2] for r in expected]
+        for result, reference in zip(results, expected):
+            assert result[3] is None
+            assert np.array_equal(result[2], reference[2])
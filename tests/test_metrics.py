@@ -0,0 +1,54 @@
+import numpy as np
+
+from core.logging.logger import VernierFSRLogger
+from core.logging.metrics import TrialMetrics, load_metrics
+from core.utils.mock_data import MockSignalEngine
+
+
+def test_metrics_detect_gaps_resets_and_latency():
+    """
+    Test gap counting from device time, clock resets and the latency histogram.
+    """
+    metrics = TrialMetrics()
+    times = np.arange(100) / 1000
+    # A full batch read at once: the first sample waited ~99 ms for the read
+    metrics.observe(int(0.099 * 1e9), times)
+    # Five samples lost, then the device clock restarts
+    metrics.observe(int(0.2 * 1e9), np.array([0.105, 0.106, 0.0, 0.001]))
+
+    result = metrics.to_dict()
+    assert result["samples"] == 104
+    assert result["sample_interval_s"] == 0.001
+    assert (result["gaps"], result["missing_samples"]) == (1, 5)
+    assert result["largest_gap_s"] == 0.006
+    assert result["time_resets"] == 1
+    assert sum(result["latency_ms"]["counts"]) == 104
+    assert 190 < result["latency_ms"]["max"] < 210
+    assert metrics.degraded
+
+    # Latency is relative to the fastest sample: here 6, 3 and 0 ms
+    metrics = TrialMetrics(nominal_interval=0.003)
+    metrics.observe(int(0.5 * 1e9), np.array([0.494, 0.497, 0.5]))
+    assert metrics.latency_counts[:4].tolist() == [1, 0, 1, 1]
+    assert metrics.latency_percentile(0.5) == 5.0
+    assert not metrics.degraded
+
+
+def test_logger_writes_metrics_sidecar(tmp_path):
+    """
+    Test that a trial saves METRICS_<stem>.json and counts unparsable lines.
+    """
+    logger = VernierFSRLogger(
+        use_mock=True, stream=True, echo=False, mock_engine=MockSignalEngine(2000)
+    )
+    logger.run(0.2, save_dir=tmp_path, file_stem="T")
+
+    metrics = load_metrics(tmp_path / "METRICS_T.json")
+    assert logger.metrics_path == tmp_path / "METRICS_T.json"
+    assert metrics["samples"] > 200
+    assert metrics["gaps"] == 0 and not metrics["degraded"]
+    assert metrics["sample_interval_s"] == 0.0005
+
+    logger._emit(0, ["garbage", "0.001 | 1 | 2 | 3 | 4"])
+    assert logger.metrics.parse_failures == 1
+    assert load_metrics(tmp_path / "missing.json") is None
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.logging.logger import VernierFSRLogger
+from core.utils.mock_data import BASELINE, MockSignalEngine, press_profile
+from core.utils.storage import load_trial
+
+
+def test_engine_is_reproducible_and_block_size_independent():
+    """
+    Test that a seed and trial name fully determine the generated samples.
+    """
+    engine = MockSignalEngine(rate=10_000, seed=7)
+    engine.configure_for("TRIAL_1_LOC_2_LUMP")
+    blocks = np.concatenate([engine.block(n) for n in (1, 999, 9000)])
+
+    other = MockSignalEngine(rate=10_000, seed=7)
+    other.configure_for("TRIAL_1_LOC_2_LUMP")
+    single = other.generate(1.0)
+
+    assert len(single) == 10_000
+    assert np.array_equal(blocks["Time(s)"], single["Time(s)"])
+    assert np.array_equal(blocks["B"][:1000], single["B"][:1000])
+    assert (engine.location, engine.condition) == (2, "LUMP")
+    with pytest.raises(ValueError):
+        MockSignalEngine(rate=100_000)
+
+
+def test_press_profile_and_spatial_pattern():
+    """
+    Test the press/release envelope and that a lump raises the pressed sensor.
+    """
+    envelope = press_profile(np.linspace(0, 4, 4001))
+    assert envelope.min() == 0.0 and envelope.max() == 1.0
+    assert envelope[1000] == 1.0 and envelope[1900] == 0.0
+
+    means = {}
+    for condition in ("LUMP", "NOLUMP"):
+        engine = MockSignalEngine(rate=1000, location=4, condition=condition)
+        records = engine.generate(2.0)
+        means[condition] = {s: records[s].astype(float).mean() for s in "ABCD"}
+
+    assert means["LUMP"]["D"] > means["NOLUMP"]["D"] + 2000
+    # Location 4 is Q4, where sensor D sits; B in Q2 is diagonally opposite
+    press = {s: means["NOLUMP"][s] - BASELINE[i] for i, s in enumerate("ABCD")}
+    assert press["D"] > press["A"] > press["B"]
+
+
+def test_logger_emits_mock_blocks_at_engine_rate(tmp_path):
+    """
+    Test that the mock logger is paced to the engine rate and only logs
+    while logging is on.
+    """
+    logger = VernierFSRLogger(
+        use_mock=True,
+        stream=True,
+        echo=False,
+        mock_engine=MockSignalEngine(rate=20_000),
+    )
+    _, clean_path = logger.run(0.25, start_delay=0.1, save_dir=tmp_path)
+
+    records = load_trial(clean_path)
+    assert 3000 < len(records) <= 5000
+    assert records["Time(s)"][0] == 0.0
+    assert np.all(np.diff(records["Time(s)"]) > 0)
+
+
+def test_interrupt_during_start_delay_and_rerun(tmp_path):
+    """
+    Test that `interrupt()` ends the start delay without logging, stops the
+    reader thread, and that the same logger can run another trial after it.
+    """
+    logger = VernierFSRLogger(
+        use_mock=True, echo=False, mock_engine=MockSignalEngine(rate=2000)
+    )
+    threads = set(threading.enumerate())
+    timer = threading.Timer(0.1, logger.interrupt)
+    timer.start()
+    started = time.monotonic()
+    _, clean_path = logger.run(5, start_delay=30, save_dir=tmp_path)
+    timer.join()
+
+    assert time.monotonic() - started < 5
+    assert logger.interrupted
+    assert clean_path is None
+    assert set(threading.enumerate()) <= threads
+
+    _, clean_path = logger.run(0.2, save_dir=tmp_path)
+    assert not logger.interrupted
+    assert len(load_trial(clean_path)) > 0
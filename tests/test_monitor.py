@@ -0,0 +1,57 @@
+import threading
+
+from core.hardware.detector import find_arduino_ports
+from core.hardware.monitor import PortMonitor
+
+
+def test_refresh_publishes_changes():
+    """
+    Test that rescans report added/removed ports but the first scan does not.
+    """
+    available = ["/dev/ttyACM1", "/dev/ttyACM0"]
+    monitor = PortMonitor(scan=lambda: list(available), use_udev=False)
+    received = []
+    monitor.subscribe(received.append)
+
+    assert monitor.refresh() == []
+    assert monitor.ready and monitor.ports == ["/dev/ttyACM0", "/dev/ttyACM1"]
+    assert find_arduino_ports(monitor.ports) == "mock"
+
+    available[:] = ["/dev/ttyACM1", "/dev/ttyUSB0"]
+    events = monitor.refresh()
+    assert [(e.kind, e.port) for e in events] == [
+        ("removed", "/dev/ttyACM0"),
+        ("added", "/dev/ttyUSB0"),
+    ]
+    assert received == events == monitor.recent_events()
+
+
+def test_background_rescan_only_when_fingerprint_changes():
+    """
+    Test that the polling thread skips scans until the device listing changes.
+    """
+    scans = []
+    nodes = {"ttyS0"}
+    changed = threading.Event()
+
+    def scan():
+        scans.append(1)
+        return sorted(node for node in nodes if node.startswith("ttyACM"))
+
+    monitor = PortMonitor(
+        rescan_interval=0.01,
+        scan=scan,
+        fingerprint=lambda: frozenset(nodes),
+        use_udev=False,
+    )
+    monitor.subscribe(lambda event: changed.set())
+    monitor.start()
+    assert monitor.wait_ready(5)
+    threading.Event().wait(0.1)
+    assert len(scans) == 1
+
+    nodes.add("ttyACM0")
+    assert changed.wait(5)
+    monitor.stop()
+    assert monitor.ports == ["ttyACM0"]
+    assert not monitor.running
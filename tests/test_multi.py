@@ -0,0 +1,69 @@
+import csv
+
+from core.analysis.loader import parse_trial_name
+from core.logging.logger import VernierFSRLogger
+from core.logging.multi import MERGED_HEADER, MultiDeviceLogger, merge_device_logs
+
+
+def write_raw(path, lines):
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamped_line"])
+        writer.writerows([line] for line in lines)
+    return path
+
+
+def test_multi_device_logger_writes_per_device_and_merged_files(tmp_path):
+    """
+    Test that every device gets its own trial files sharing one clock origin,
+    and that the merged log is ordered by host timestamp.
+    """
+    loggers = [VernierFSRLogger(use_mock=True, stream=True) for _ in range(2)]
+    multi = MultiDeviceLogger(loggers)
+    assert loggers[0].clock_origin is loggers[1].clock_origin
+
+    merged_path, clean_path = multi.run(0.1, save_dir=tmp_path, file_stem="T")
+
+    assert multi.phase == "finished"
+    assert clean_path.name == "CLEAN_T_DEV0.csv"
+    assert (tmp_path / "CLEAN_T_DEV1.csv").is_file()
+    assert merged_path == tmp_path / "MERGED_T.csv"
+
+    with merged_path.open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == MERGED_HEADER
+    assert {row[1] for row in rows[1:]} == {"0", "1"}
+    stamps = [row[0] for row in rows[1:]]
+    assert stamps == sorted(stamps)
+
+    assert parse_trial_name("CLEAN_TRIAL_2_LOC_3_LUMP_DEV1.npy") == (2, 3, "LUMP")
+
+
+def test_merge_device_logs_across_midnight(tmp_path):
+    """
+    Test that merging interleaves devices by time and handles a midnight rollover.
+    """
+    first = write_raw(
+        tmp_path / "RAW_0.csv",
+        [
+            "[23:59:59.900000] 0.000 | 1 | 1 | 1 | 1",
+            "[00:00:00.100000] 0.200 | 2 | 2 | 2 | 2",
+        ],
+    )
+    second = write_raw(
+        tmp_path / "RAW_1.csv",
+        [
+            "[23:59:59.950000] 0.000 | 3 | 3 | 3 | 3",
+            "garbage",
+            "[00:00:00.050000] 0.100 | 4 | 4 | 4 | 4",
+        ],
+    )
+
+    merged = merge_device_logs([first, None, second], tmp_path / "MERGED.csv")
+    with merged.open(newline="") as f:
+        rows = list(csv.reader(f))[1:]
+
+    assert [row[1] for row in rows] == ["0", "2", "2", "0"]
+    assert [row[3] for row in rows] == ["1", "3", "4", "2"]
+    assert merge_device_logs([], tmp_path / "EMPTY.csv") is None
+    assert not (tmp_path / "EMPTY.csv").exists()
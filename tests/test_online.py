@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+
+import core.analysis.index as index_module
+from core.analysis.index import ExperimentIndex
+from core.analysis.online import RunningStats, TrialStats, load_stats
+from core.logging.logger import VernierFSRLogger
+from core.utils.mock_data import MockSignalEngine
+from core.utils.storage import load_trial
+
+
+def test_running_stats_match_numpy_across_batches_and_merges():
+    """
+    Test that batched and merged Welford accumulators equal NumPy statistics.
+    """
+    values = np.random.default_rng(0).normal(30000, 1200, 10_000)
+    left, right = RunningStats(), RunningStats()
+    for chunk in np.array_split(values[:6000], 7):
+        left.update(chunk)
+    right.update(values[6000:])
+    left.merge(right)
+    left.merge(RunningStats())
+
+    assert left.count == len(values)
+    assert math.isclose(left.mean, values.mean())
+    assert math.isclose(left.std, values.std(ddof=1))
+    assert left.min == values.min() and left.max == values.max()
+    assert math.isnan(RunningStats().variance)
+
+
+def test_trial_stats_round_trip_and_median(tmp_path):
+    """
+    Test that trial statistics persist and report a median within the
+    sketch's error bound.
+    """
+    records = MockSignalEngine(seed=3).generate(5.0)
+    stats = TrialStats()
+    for block in np.array_split(records, 9):
+        stats.update(block)
+
+    loaded = load_stats(stats.save(tmp_path / "STATS_T.json"))
+    summary = loaded.summary("D")
+    assert summary["count"] == len(records)
+    assert abs(summary["median"] - np.median(records["D"])) <= 8
+    assert math.isclose(summary["avg"], records["D"].astype(float).mean())
+    assert load_stats(tmp_path / "missing.json") is None
+
+
+def test_index_merges_logger_stats_without_reading(tmp_path, monkeypatch):
+    """
+    Test that the logger writes STATS_*.json and the index uses it instead of
+    reading the trial's samples.
+    """
+    stem = "TRIAL_1_LOC_1_LUMP"
+    logger = VernierFSRLogger(
+        use_mock=True, echo=False, mock_engine=MockSignalEngine(rate=2000)
+    )
+    _, clean_path = logger.run(0.3, save_dir=tmp_path / stem, file_stem=stem)
+    assert logger.stats_path == tmp_path / stem / f"STATS_{stem}.json"
+
+    read_files = []
+    read_trials = index_module.read_trials
+
+    def tracking_read(data_directory, files, *args):
+        read_files.extend(files)
+        return read_trials(data_directory, files, *args)
+
+    monkeypatch.setattr(index_module, "read_trials", tracking_read)
+    index = ExperimentIndex.load(tmp_path)
+    index.update()
+    assert read_files == []
+
+    d = load_trial(clean_path)["D"].astype(float)
+    row = index.summary(decimals=None).loc[("LUMP", "Q1", "D")]
+    assert row["count"] == len(d)
+    assert math.isclose(row["avg"], d.mean())
+    assert math.isclose(row["std"], d.std(ddof=1))
@@ -0,0 +1,57 @@
+import numpy as np
+
+from core.analysis.index import ExperimentIndex
+from core.analysis.preview import downsample, lttb, paginate, trial_overview
+from core.utils.mock_data import MockSignalEngine
+from core.utils.storage import save_trial_npy
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    """
+    Test that LTTB returns the requested number of sorted indices, including
+    both ends and an isolated spike.
+    """
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.zeros_like(x)
+    y[4321] = 100.0
+    kept = lttb(x, y, 50)
+    assert len(kept) == 50
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert 4321 in kept
+    assert np.array_equal(lttb(x[:20], y[:20], 50), np.arange(20))
+
+
+def test_downsample_is_bounded_and_keeps_extremes():
+    """
+    Test that a long trial is reduced to a bounded frame that still contains
+    every sensor's minimum and maximum.
+    """
+    records = MockSignalEngine(rate=10_000).generate(10.0)
+    frame = downsample(records, points=200)
+    assert len(frame) <= 4 * 202
+    for sensor in ("A", "B", "C", "D"):
+        assert frame[sensor].max() == records[sensor].max()
+        assert frame[sensor].min() == records[sensor].min()
+
+
+def test_paginate_and_overview(tmp_path):
+    """
+    Test that pages are numbered by sample and clamped to the last page, and
+    that the overview has one row per indexed trial.
+    """
+    engine = MockSignalEngine()
+    for name in ("TRIAL_1_LOC_1_LUMP", "TRIAL_1_LOC_2_NOLUMP"):
+        engine.configure_for(name)
+        save_trial_npy(tmp_path / f"CLEAN_{name}.npy", engine.block(1050))
+
+    records = engine.block(1050)
+    page = paginate(records, 3, 500)
+    assert list(page.index) == list(range(1000, 1050))
+    assert paginate(records, 99, 500).index[0] == 1000
+
+    index = ExperimentIndex.load(tmp_path)
+    index.update()
+    overview = trial_overview(index.trials)
+    assert list(overview["condition"]) == ["LUMP", "NOLUMP"]
+    assert list(overview["samples"]) == [1050, 1050]
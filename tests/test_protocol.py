@@ -0,0 +1,72 @@
+import threading
+import time
+
+import numpy as np
+
+from core.hardware.connection import DeviceManager
+from core.hardware.protocol import FRAME_SIZE, decode_frames, encode_frames
+from core.logging.logger import VernierFSRLogger
+from core.utils.storage import load_trial, rows_to_array
+
+
+def make_records(n):
+    return rows_to_array([(i / 100, i, 2 * i, 3, 65535 - i) for i in range(n)])
+
+
+def test_decode_round_trip_and_partial_frame():
+    """
+    Test that complete frames decode in bulk and a trailing partial frame waits.
+    """
+    data = encode_frames(make_records(5))
+    records, consumed, dropped = decode_frames(data + data[: FRAME_SIZE - 1])
+
+    assert consumed == len(data)
+    assert dropped == 0
+    assert records["A"].tolist() == [0, 1, 2, 3, 4]
+    assert records["D"].tolist() == [65535, 65534, 65533, 65532, 65531]
+    assert np.allclose(records["Time(s)"], [0, 0.01, 0.02, 0.03, 0.04])
+
+
+def test_decode_resynchronises_after_corruption():
+    """
+    Test that garbage and a bad checksum only cost the affected frame.
+    """
+    data = bytearray(b"\x00\x01" + encode_frames(make_records(4)))
+    data[2 + FRAME_SIZE + 3] ^= 0xFF
+
+    records, consumed, dropped = decode_frames(data)
+
+    assert records["A"].tolist() == [0, 2, 3]
+    assert consumed == len(data)
+    assert dropped == 2 + FRAME_SIZE
+
+
+def test_logger_binary_protocol(tmp_path):
+    """
+    Test that the logger decodes binary frames into the usual trial files.
+    """
+    device = DeviceManager(port="loop://", timeout=0.05, reset_delay=0)
+    logger = VernierFSRLogger(
+        device=device,
+        stream=True,
+        echo=False,
+        protocol="binary",
+        clean_formats=("csv", "npy"),
+    )
+    frames = encode_frames(make_records(500))
+
+    def feed():
+        while logger.phase != "logging":
+            time.sleep(0.001)
+        device.connect().write(frames)
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    raw_path, clean_path = logger.run(0.5, save_dir=tmp_path, file_stem="bin")
+    feeder.join(timeout=5)
+
+    records = load_trial(tmp_path / "CLEAN_bin.npy")
+    assert records["A"].tolist() == list(range(500))
+    assert load_trial(clean_path)["D"].tolist() == records["D"].tolist()
+    assert logger.samples.total == 500
+    assert " | 499 | 998 | 3 | 65036" in raw_path.read_text()
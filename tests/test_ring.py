@@ -0,0 +1,64 @@
+import threading
+
+import numpy as np
+
+from core.logging.logger import VernierFSRLogger
+from core.logging.ring import SampleRingBuffer
+
+
+def test_ring_buffer_keeps_most_recent_samples():
+    """
+    Test that the snapshot is ordered oldest-first after wrapping around.
+    """
+    ring = SampleRingBuffer(capacity=3)
+    for i in range(5):
+        ring.append((i, i, i, i, i))
+
+    assert ring.total == 5
+    assert ring.snapshot()[:, 0].tolist() == [2, 3, 4]
+
+
+def test_ring_buffer_extend_larger_than_capacity():
+    """
+    Test that a block bigger than the buffer keeps only its tail.
+    """
+    ring = SampleRingBuffer(capacity=4)
+    ring.extend(np.arange(30).reshape(6, 5))
+
+    assert ring.total == 6
+    assert ring.snapshot()[:, 0].tolist() == [10, 15, 20, 25]
+
+
+def test_ring_buffer_concurrent_appends():
+    """
+    Test that appends from several threads are all counted.
+    """
+    ring = SampleRingBuffer(capacity=16)
+    workers = [
+        threading.Thread(
+            target=lambda: [ring.append((0, 1, 2, 3, 4)) for _ in range(1000)]
+        )
+        for _ in range(4)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    assert ring.total == 4000
+    assert len(ring.snapshot()) == 16
+
+
+def test_logger_publishes_samples_and_progress(tmp_path):
+    """
+    Test that a mock run fills the ring buffer and reports completion.
+    """
+    logger = VernierFSRLogger(use_mock=True, stream=True)
+    assert logger.progress() == 0.0
+
+    logger.run(0.1, save_dir=tmp_path, file_stem="live")
+
+    assert logger.phase == "finished"
+    assert logger.progress() == 1.0
+    assert logger.samples.total > 0
+    assert logger.samples.snapshot().shape[1] == 5
@@ -0,0 +1,119 @@
+import threading
+import time
+
+from core.logging.logger import VernierFSRLogger
+from core.logging.scheduler import TrialScheduler
+
+
+def wait_idle(scheduler, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while scheduler.busy and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not scheduler.busy
+
+
+def test_scheduler_runs_jobs_in_order(tmp_path):
+    """
+    Test that queued trials run sequentially in the background and save files.
+    """
+    scheduler = TrialScheduler(lambda: VernierFSRLogger(use_mock=True, stream=True))
+    first = scheduler.submit("TRIAL_1_LOC_1_LUMP", tmp_path / "a", duration=0.05)
+    second = scheduler.submit("TRIAL_1_LOC_2_LUMP", tmp_path / "b", duration=0.05)
+    assert scheduler.submit("TRIAL_1_LOC_2_LUMP", tmp_path / "b", 0.05) is second
+
+    wait_idle(scheduler)
+    scheduler.shutdown()
+
+    assert [first.status, second.status] == ["done", "done"]
+    assert first.finished_at <= second.started_at
+    assert first.paths[1].name == "CLEAN_TRIAL_1_LOC_1_LUMP.csv"
+
+
+def test_scheduler_keys_jobs_by_directory(tmp_path):
+    """
+    Test that the same trial name in another experiment directory is a new
+    job rather than the earlier experiment's finished one.
+    """
+    scheduler = TrialScheduler(lambda: VernierFSRLogger(use_mock=True, stream=True))
+    name = "TRIAL_1_LOC_1_LUMP"
+    first = scheduler.submit(name, tmp_path / "ExpA" / name, duration=0.02)
+    wait_idle(scheduler)
+    second = scheduler.submit(name, tmp_path / "ExpB" / name, duration=0.02)
+    wait_idle(scheduler)
+    scheduler.shutdown()
+
+    assert second is not first
+    assert set(scheduler.jobs()) == {
+        (tmp_path / "ExpA" / name, name),
+        (tmp_path / "ExpB" / name, name),
+    }
+    assert (first.status, second.status) == ("done", "done")
+    assert second.paths[0].parent == tmp_path / "ExpB" / name
+
+
+def test_scheduler_cancel_and_failure(tmp_path):
+    """
+    Test that queued trials can be cancelled and logger errors mark a job failed.
+    """
+    release = threading.Event()
+
+    def factory():
+        release.wait()
+        raise RuntimeError("no device")
+
+    scheduler = TrialScheduler(factory)
+    running = scheduler.submit("first", tmp_path, duration=0)
+    queued = scheduler.submit("second", tmp_path, duration=0)
+    while running.status != "running":
+        time.sleep(0.01)
+
+    assert scheduler.cancel(tmp_path, "second")
+    assert not scheduler.cancel(tmp_path, "second")
+    release.set()
+    wait_idle(scheduler)
+    scheduler.shutdown()
+
+    assert queued.status == "cancelled"
+    assert running.status == "failed"
+    assert running.error == "no device"
+
+
+def test_scheduler_cancel_interrupts_start_delay(tmp_path):
+    """
+    Test that cancelling a running trial ends it during its start delay.
+    """
+    scheduler = TrialScheduler(lambda: VernierFSRLogger(use_mock=True, echo=False))
+    job = scheduler.submit("first", tmp_path, duration=5, delay=30)
+    while job.status != "running":
+        time.sleep(0.01)
+
+    assert scheduler.cancel(tmp_path, "first")
+    wait_idle(scheduler, timeout=5)
+    scheduler.shutdown()
+
+    assert job.status == "done"
+    assert job.logger.interrupted
+
+
+def test_scheduler_post_process(tmp_path):
+    """
+    Test that post-processing runs after a trial and its failure keeps the job done.
+    """
+    processed = []
+
+    def post_process(job):
+        processed.append(job.name)
+        if job.name == "second":
+            raise ValueError("bad log")
+
+    scheduler = TrialScheduler(
+        lambda: VernierFSRLogger(use_mock=True, stream=True), post_process
+    )
+    first = scheduler.submit("first", tmp_path, duration=0.02)
+    second = scheduler.submit("second", tmp_path, duration=0.02)
+    wait_idle(scheduler)
+    scheduler.shutdown()
+
+    assert processed == ["first", "second"]
+    assert (first.status, first.error) == ("done", None)
+    assert (second.status, second.error) == ("done", "Post-processing failed: bad log")
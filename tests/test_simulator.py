@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.hardware.connection import DeviceManager
+from core.hardware.simulator import SerialSimulator
+from core.logging.logger import VernierFSRLogger
+from core.utils.mock_data import MockSignalEngine
+from core.utils.storage import load_trial
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "openpty"), reason="needs a POSIX pseudo-terminal"
+)
+
+
+@pytest.mark.parametrize("protocol", ["ascii", "binary"])
+def test_logger_reads_simulated_device(tmp_path, protocol):
+    """
+    Test the full serial path against the pty simulator: commands, bulk
+    reads, decoding and parsing must reproduce the simulated samples exactly.
+    """
+    with SerialSimulator(engine=MockSignalEngine(rate=5000, seed=3)) as simulator:
+        device = DeviceManager(port=simulator.port, timeout=0.05, reset_delay=0)
+        logger = VernierFSRLogger(
+            device=device, stream=True, echo=False, protocol=protocol
+        )
+        _, clean_path = logger.run(0.4, save_dir=tmp_path, file_stem="SIM")
+        device.close()
+        sent = simulator.engine.emitted
+
+    records = load_trial(clean_path)
+    expected = MockSignalEngine(rate=5000, seed=3).block(sent)
+
+    assert 1000 < len(records) <= sent
+    assert logger.dropped_bytes == 0
+    for name in ("A", "B", "C", "D"):
+        assert np.array_equal(records[name], expected[name][: len(records)])
+    assert np.allclose(
+        records["Time(s)"], expected["Time(s)"][: len(records)], atol=5e-4
+    )
+
+
+def test_simulator_baud_throttle(tmp_path):
+    """
+    Test that a baud limit caps throughput below the requested sample rate.
+    """
+    with SerialSimulator(rate=5000, baud=115200) as simulator:
+        device = DeviceManager(port=simulator.port, timeout=0.05, reset_delay=0)
+        logger = VernierFSRLogger(device=device, stream=True, echo=False)
+        _, clean_path = logger.run(0.5, save_dir=tmp_path)
+        device.close()
+        sent = simulator.bytes_sent
+
+    # 115200 baud is 11520 bytes/s, far below 5000 lines/s of ~30 bytes
+    assert sent <= 11520 * 0.6
+    assert len(load_trial(clean_path)) < 0.5 * 5000 / 2
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_app_import_is_lazy():
+    """
+    Test that importing the app loads neither analysis libraries nor settings.
+    """
+    code = (
+        "import sys, app\n"
+        "from core.config import setting\n"
+        "heavy = [m for m in ('pandas', 'matplotlib') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+        "assert setting.get_settings.cache_info().currsize == 0\n"
+        "assert setting.settings is setting.get_settings()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
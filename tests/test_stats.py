@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from core.analysis.stats import compute_metrics, summary_table
+
+
+def test_summary_table_fills_missing_quadrants():
+    """
+    Test that quadrants without data are reported as NaN.
+    """
+    summary = pd.DataFrame(
+        {"avg": [2.0], "median": [2.0], "std": [1.4]},
+        index=pd.MultiIndex.from_tuples(
+            [("LUMP", "Q1", "D")], names=["condition", "quadrant", "sensor"]
+        ),
+    )
+    table = summary_table(summary)
+
+    assert len(table) == 6
+    assert table.loc[0, "Q1"] == 2.0
+    assert np.isnan(table.loc[0, "Q2"])
+
+
+def test_compute_metrics():
+    """
+    Test range, standard deviation and CV across quadrant averages.
+    """
+    r, s, c = compute_metrics({"Q1": 10.0, "Q2": 20.0})
+    assert (r, s, c) == (10.0, 5.0, (5.0 / 15.0) * 100)
+    assert all(np.isnan(compute_metrics({"Q1": 10.0})))
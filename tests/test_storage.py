@@ -0,0 +1,63 @@
+import numpy as np
+
+from core.logging.logger import VernierFSRLogger
+from core.utils.storage import (
+    TRIAL_DTYPE,
+    NpyAppender,
+    find_clean_files,
+    load_trial,
+    rows_to_array,
+)
+
+
+def test_npy_appender_round_trip(tmp_path):
+    """
+    Test that appended blocks load back as one memory-mapped array.
+    """
+    path = tmp_path / "CLEAN_x.npy"
+    appender = NpyAppender(path)
+    appender.append(rows_to_array([("0.100", "31085", "29010", "50", "25444")]))
+    appender.append(rows_to_array([(0.2, 1, 2, 3, 4), (0.3, 5, 6, 7, 8)]))
+    appender.close()
+
+    array = load_trial(path)
+    assert isinstance(array, np.memmap)
+    assert array.dtype == TRIAL_DTYPE
+    assert array["D"].tolist() == [25444, 4, 8]
+    assert np.allclose(array["Time(s)"], [0.1, 0.2, 0.3])
+
+
+def test_load_trial_csv_matches_npy(tmp_path):
+    """
+    Test that CSV and NPY copies of a trial load identically.
+    """
+    csv_path = tmp_path / "CLEAN_x.csv"
+    csv_path.write_text("Time(s),A,B,C,D\n0.1,1,2,3,4\n0.2,5,6,7,8\n")
+    records = load_trial(csv_path)
+
+    assert records.dtype == TRIAL_DTYPE
+    assert records["A"].tolist() == [1, 5]
+    assert len(load_trial(tmp_path / "CLEAN_x.csv")) == 2
+
+
+def test_find_clean_files_prefers_npy(tmp_path):
+    """
+    Test that a trial stored in both formats is only reported once, as .npy.
+    """
+    trial = tmp_path / "TRIAL_1_LOC_1_LUMP"
+    trial.mkdir()
+    for name in ["CLEAN_a.csv", "CLEAN_a.npy", "CLEAN_b.csv", "RAW_a.csv"]:
+        (trial / name).touch()
+
+    assert [p.name for p in find_clean_files(tmp_path)] == ["CLEAN_a.npy", "CLEAN_b.csv"]
+
+
+def test_logger_writes_npy(tmp_path):
+    """
+    Test that both logger modes can write the binary clean format.
+    """
+    for stream in (False, True):
+        logger = VernierFSRLogger(use_mock=True, stream=stream, clean_formats=("npy",))
+        _, clean_path = logger.run(0.1, save_dir=tmp_path / str(stream), file_stem="t")
+        assert clean_path.suffix == ".npy"
+        assert len(load_trial(clean_path)) > 0
@@ -0,0 +1,51 @@
+import numpy as np
+
+from core.analysis.store import ExperimentStore
+from core.utils.storage import TRIAL_DTYPE, load_trial
+
+TRIALS = ("TRIAL_1_LOC_1_LUMP", "TRIAL_2_LOC_1_LUMP", "TRIAL_1_LOC_2_NOLUMP")
+
+
+def test_store_serves_zero_copy_trials(tmp_path, write_trial):
+    """
+    Test that the store is built from the CLEAN layout and serves each trial
+    as a view of one memory map with the same samples as the file.
+    """
+    paths = [
+        write_trial(tmp_path, name, 300 + 100 * i) for i, name in enumerate(TRIALS)
+    ]
+    store = ExperimentStore.load(tmp_path)
+    assert len(store.update()) == 3
+    assert store.count == 300 + 400 + 500
+
+    reopened = ExperimentStore.load(tmp_path)
+    for path in paths:
+        relative_path = str(path.relative_to(tmp_path))
+        trial = reopened.trial(relative_path)
+        assert np.shares_memory(trial, reopened.samples())
+        assert np.array_equal(trial, load_trial(path))
+    assert reopened.update() == []
+
+
+def test_store_appends_changes_and_compacts(tmp_path, write_trial):
+    """
+    Test that a modified trial is re-appended, dead samples are reclaimed
+    once they outnumber live ones, and a torn append is discarded.
+    """
+    write_trial(tmp_path, TRIALS[0], 100)
+    path = write_trial(tmp_path, TRIALS[1], 1000)
+    store = ExperimentStore.load(tmp_path)
+    store.update()
+
+    write_trial(tmp_path, TRIALS[1], 50)
+    store.update()
+    assert store.count == 150 and store.garbage == 0
+    relative_path = str(path.relative_to(tmp_path))
+    assert np.array_equal(store.trial(relative_path), load_trial(path))
+
+    with store.samples_path.open("ab") as f:
+        f.write(b"\0" * 70)
+    write_trial(tmp_path, TRIALS[2], 10, fmt="npy")
+    store = ExperimentStore.load(tmp_path)
+    store.update()
+    assert store.samples_path.stat().st_size == 160 * TRIAL_DTYPE.itemsize
@@ -0,0 +1,51 @@
+import csv
+
+from core.logging.logger import VernierFSRLogger
+from core.logging.writer import TrialWriter
+
+
+def read_rows(path):
+    with path.open(newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_trial_writer_streams_raw_and_clean(tmp_path):
+    """
+    Test that buffered lines reach both files once the buffer fills.
+    """
+    writer = TrialWriter(tmp_path, "TRIAL_1_LOC_1_LUMP", buffer_size=2)
+    writer.write("[10:00:00] 0.100 | 31085 | 29010 | 50 | 25444")
+    writer.write("[10:00:00] garbage")
+
+    assert writer.rows_written == 1
+    assert len(read_rows(writer.raw_path)) == 3
+    assert read_rows(writer.clean_path)[1] == ["0.100", "31085", "29010", "50", "25444"]
+
+    raw_path, clean_path = writer.close()
+    assert raw_path.name == "RAW_TRIAL_1_LOC_1_LUMP.csv"
+    assert clean_path.name == "CLEAN_TRIAL_1_LOC_1_LUMP.csv"
+
+
+def test_trial_writer_without_structured_data(tmp_path):
+    """
+    Test that no clean file is produced when no line can be parsed.
+    """
+    writer = TrialWriter(tmp_path, "empty")
+    writer.write("[10:00:00] hello")
+    raw_path, clean_path = writer.close()
+
+    assert clean_path is None
+    assert not (tmp_path / "CLEAN_empty.csv").exists()
+    assert read_rows(raw_path) == [["timestamped_line"], ["[10:00:00] hello"]]
+
+
+def test_logger_stream_mode_does_not_buffer(tmp_path):
+    """
+    Test that a streaming mock run writes files without keeping lines in memory.
+    """
+    logger = VernierFSRLogger(use_mock=True, stream=True)
+    raw_path, clean_path = logger.run(0.1, save_dir=tmp_path, file_stem="stream")
+
+    assert logger._data_lines == []
+    assert len(read_rows(raw_path)) > 1
+    assert read_rows(clean_path)[0] == ["Time(s)", "A", "B", "C", "D"]